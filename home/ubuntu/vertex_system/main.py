@@ -505,6 +505,20 @@ async def get_provider(
         raise HTTPException(status_code=500, detail=str(e))
 
 # Task endpoints
+def _task_response(task: Task) -> Dict[str, Any]:
+    """Build a TaskResponse body from an orchestrator task."""
+    created_at = task.created_at_ns / 1e9
+    last_change = task.completed_at or task.started_at
+    
+    return {
+        "task_id": task.task_id,
+        "status": task.status.value,
+        "created_at": created_at,
+        "updated_at": last_change.timestamp() if last_change else created_at,
+        "result": task.result,
+        "error": task.error
+    }
+
 @app.post("/tasks", response_model=TaskResponse)
 async def create_task(
     task_request: TaskRequest,
@@ -523,28 +537,16 @@ async def create_task(
             priority=priority,
             timeout_seconds=task_request.timeout_seconds,
             max_retries=task_request.max_retries,
-            metadata={
-                "model_requirements": task_request.model_requirements
-            }
+            required_capabilities=task_request.model_requirements.get("capabilities", [])
         )
         
         # Submit task
-        task_id = orchestrator.submit_task(task)
+        task_id = orchestrator.add_task(task)
         
         # Start task execution in background
         background_tasks.add_task(orchestrator.execute_task, task_id)
         
-        # Get task status
-        task_status = orchestrator.get_task_status(task_id)
-        
-        return {
-            "task_id": task_id,
-            "status": task_status.status.value,
-            "created_at": task_status.created_at,
-            "updated_at": task_status.updated_at,
-            "result": task_status.result,
-            "error": task_status.error
-        }
+        return _task_response(task)
     except Exception as e:
         logger.error(f"Error creating task: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -552,23 +554,22 @@ async def create_task(
 @app.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: str,
+    wait: float = Query(0, ge=0, le=60, description="Seconds to wait for the task to finish"),
     orchestrator: TaskOrchestrator = Depends(get_task_orchestrator)
 ):
     """Get information about a specific task."""
     try:
-        task_status = orchestrator.get_task_status(task_id)
+        # Long-poll: hold the request until the task finishes, so clients
+        # don't have to poll for completion
+        if wait:
+            task = await orchestrator.wait_for_task(task_id, wait)
+        else:
+            task = orchestrator.get_task(task_id)
         
-        if not task_status:
+        if not task:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
             
-        return {
-            "task_id": task_id,
-            "status": task_status.status.value,
-            "created_at": task_status.created_at,
-            "updated_at": task_status.updated_at,
-            "result": task_status.result,
-            "error": task_status.error
-        }
+        return _task_response(task)
     except HTTPException:
         raise
     except Exception as e:
@@ -140,6 +140,7 @@ class ProviderRegistry:
     def __init__(self):
         """Initialize an empty provider registry."""
         self._providers = {}
+        self.generation = 0  # Incremented on every registration change
     
     def register_provider(self, provider_id: str, provider: ModelProvider) -> None:
         """
@@ -153,6 +154,7 @@ class ProviderRegistry:
             raise ValueError(f"Provider with ID '{provider_id}' already registered")
         
         self._providers[provider_id] = provider
+        self.generation += 1
     
     def get_provider(self, provider_id: str) -> ModelProvider:
         """
@@ -6,15 +6,55 @@ servers, providing a unified interface for accessing external capabilities.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Type
+from typing import Dict, Any, List, Optional, Union, Type, Tuple, Mapping, TYPE_CHECKING
 import importlib
+import itertools
 import time
 import asyncio
-import uuid
-import json
-import requests
+import types
 from enum import Enum
 
+# Prefer orjson for history dumps; it emits bytes directly and is much
+# faster than the stdlib encoder for large lists of records.
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
+except ImportError:
+    import json
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_json_default).encode("utf-8")
+
+# Type-only imports; HTTP clients (requests/aiohttp) are imported lazily by
+# the concrete server implementations that actually need them.
+if TYPE_CHECKING:
+    from ..optimization.resource_optimization import CreditManager
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def _snapshot(value: Any) -> Any:
+    """
+    Copy the dicts and lists of a JSON-like value.
+    
+    Other values are kept by reference, so the copy never fails on objects
+    that cannot be copied.
+    """
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(item) for item in value]
+    return value
+
 
 class MCPCapability(Enum):
     """Enum representing different MCP server capabilities."""
@@ -24,6 +64,10 @@ class MCPCapability(Enum):
     TASK_MANAGEMENT = "task_management"
 
 
+# Precomputed capability values, avoiding the Enum descriptor in hot loops
+_CAP_VALUES = {capability: capability.value for capability in MCPCapability}
+
+
 class MCPServer(ABC):
     """
     Abstract base class for MCP server integrations.
@@ -85,6 +129,29 @@ class MCPServer(ABC):
         pass
 
 
+# Process-wide cache of resolved server classes, keyed by (module_path, class_name)
+_server_class_cache: Dict[Tuple[str, str], Type[MCPServer]] = {}
+
+
+def _load_server_class(module_path: str, class_name: str) -> Type[MCPServer]:
+    """
+    Resolve a server class from its dotted module path, importing it once.
+    
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the class cannot be found in the module
+    """
+    key = (module_path, class_name)
+    server_class = _server_class_cache.get(key)
+    
+    if server_class is None:
+        module = importlib.import_module(module_path)
+        server_class = getattr(module, class_name)
+        _server_class_cache[key] = server_class
+    
+    return server_class
+
+
 class MCPServerRegistry:
     """
     Registry for MCP servers.
@@ -97,6 +164,10 @@ class MCPServerRegistry:
         """Initialize an empty server registry."""
         self._servers = {}
         self._server_metadata = {}
+        self._metadata_views = {}  # server_id -> read-only metadata view
+        self._server_capabilities = {}  # server_id -> frozenset of capability values
+        self._capability_index = {}  # capability value -> list of server IDs
+        self.generation = 0  # Incremented on every registration change
     
     def register_server(self, 
                        server_id: str, 
@@ -112,18 +183,66 @@ class MCPServerRegistry:
             server_module_path: Import path to the module containing the server
             server_class_name: Name of the server class
             
+        Raises:
+            ValueError: If server with same ID already registered
+        """
+        self._store_registration(
+            server_id, server_metadata, server_module_path, server_class_name)
+    
+    def register_server_class(self, 
+                             server_id: str, 
+                             server_metadata: Dict[str, Any],
+                             server_class: Type[MCPServer]) -> None:
+        """
+        Register an MCP server from an already imported class.
+        
+        Skips the dotted-path import entirely when the server is first used.
+        
+        Args:
+            server_id: Unique identifier for the server
+            server_metadata: Metadata for the server
+            server_class: The server class
+            
+        Raises:
+            ValueError: If server with same ID already registered
+        """
+        self._store_registration(
+            server_id, server_metadata, server_class.__module__,
+            server_class.__qualname__, server_class)
+    
+    def _store_registration(self, 
+                           server_id: str, 
+                           server_metadata: Dict[str, Any],
+                           server_module_path: str,
+                           server_class_name: str,
+                           server_class: Optional[Type[MCPServer]] = None) -> None:
+        """
+        Store registration data for lazy loading.
+        
         Raises:
             ValueError: If server with same ID already registered
         """
         if server_id in self._server_metadata:
             raise ValueError(f"Server with ID '{server_id}' already registered")
         
+        # Copy so later caller-side mutation cannot alter registry state
+        server_metadata = dict(server_metadata)
+        
         # Store metadata for lazy loading
         self._server_metadata[server_id] = {
             "metadata": server_metadata,
             "module_path": server_module_path,
-            "class_name": server_class_name
+            "class_name": server_class_name,
+            "server_class": server_class
         }
+        self._metadata_views[server_id] = types.MappingProxyType(server_metadata)
+        self._server_capabilities[server_id] = frozenset(
+            server_metadata.get("capabilities", []))
+        
+        for capability_value in self._server_capabilities[server_id]:
+            self._capability_index.setdefault(capability_value, []).append(server_id)
+        
+        self.generation += 1
     
     def get_server(self, server_id: str) -> MCPServer:
         """
@@ -148,8 +267,8 @@ class MCPServerRegistry:
             metadata = self._server_metadata[server_id]
             
             try:
-                module = importlib.import_module(metadata["module_path"])
-                server_class = getattr(module, metadata["class_name"])
+                server_class = metadata["server_class"] or _load_server_class(
+                    metadata["module_path"], metadata["class_name"])
                 self._servers[server_id] = server_class()
             except (ImportError, AttributeError) as e:
                 raise ValueError(f"Failed to load server {server_id}: {e}")
@@ -165,7 +284,7 @@ class MCPServerRegistry:
         """
         return list(self._server_metadata.keys())
     
-    def get_server_metadata(self, server_id: str) -> Dict[str, Any]:
+    def get_server_metadata(self, server_id: str) -> types.MappingProxyType:
         """
         Get metadata for a server.
         
@@ -173,15 +292,15 @@ class MCPServerRegistry:
             server_id: Identifier for the server
             
         Returns:
-            Dictionary containing server metadata
+            Read-only view of the server metadata
             
         Raises:
             KeyError: If no server with the given ID is registered
         """
-        if server_id not in self._server_metadata:
+        if server_id not in self._metadata_views:
             raise KeyError(f"No server registered with ID '{server_id}'")
         
-        return self._server_metadata[server_id]["metadata"]
+        return self._metadata_views[server_id]
     
     def get_servers_for_capability(self, capability: MCPCapability) -> List[str]:
         """
@@ -193,14 +312,18 @@ class MCPServerRegistry:
         Returns:
             List of server IDs that offer the capability
         """
-        matching_servers = []
-        
-        for server_id, metadata in self._server_metadata.items():
-            server_capabilities = metadata["metadata"].get("capabilities", [])
-            if capability.value in server_capabilities:
-                matching_servers.append(server_id)
+        return list(self._capability_index.get(_CAP_VALUES[capability], ()))
+    
+    def capability_index(self) -> Mapping[str, Tuple[str, ...]]:
+        """
+        Get the capability inverted index.
         
-        return matching_servers
+        Returns:
+            Read-only mapping of capability values to tuples of server IDs
+        """
+        return types.MappingProxyType(
+            {capability_value: tuple(server_ids)
+             for capability_value, server_ids in self._capability_index.items()})
 
 
 class MCPToolExecutor:
@@ -213,17 +336,122 @@ class MCPToolExecutor:
     
     def __init__(self, 
                 registry: MCPServerRegistry,
-                credit_tracker: Any):  # Use Any to avoid circular dependency
+                credit_tracker: "CreditManager",
+                record_batch_size: int = 64,
+                record_flush_interval: float = 0.05):
         """
         Initialize with server registry and credit tracker.
         
         Args:
             registry: MCPServerRegistry instance
             credit_tracker: Component for tracking credit usage
+            record_batch_size: Maximum number of records written per flush
+            record_flush_interval: Maximum time (seconds) a record waits
+                before being flushed
         """
         self.registry = registry
         self.credit_tracker = credit_tracker
         self.execution_history = []
+        self.record_batch_size = record_batch_size
+        self.record_flush_interval = record_flush_interval
+        
+        # Bookkeeping queue, drained by a background writer task
+        self._record_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._in_flight = []  # Records the writer has dequeued but not yet written
+    
+    def _enqueue_record(self, execution_record: Dict[str, Any]) -> None:
+        """
+        Queue an execution record for the background writer.
+        
+        Args:
+            execution_record: Record to append to the execution history
+        """
+        if self._writer_task is None or self._writer_task.done():
+            # Keep records a stopped writer left behind
+            self._drain_records()
+            self._record_queue = asyncio.Queue()
+            self._writer_task = asyncio.get_running_loop().create_task(self._writer())
+        
+        self._record_queue.put_nowait(execution_record)
+    
+    def _drain_records(self) -> None:
+        """Write every queued record now, without waiting for the writer."""
+        # The writer's pending batch is older than anything still queued
+        if self._in_flight:
+            self.execution_history.extend(self._in_flight)
+            self._in_flight.clear()
+        
+        queue = self._record_queue
+        if queue is None:
+            return
+        
+        while not queue.empty():
+            self.execution_history.append(queue.get_nowait())
+            queue.task_done()
+    
+    async def _writer(self) -> None:
+        """Drain queued records in batches until cancelled."""
+        queue = self._record_queue
+        loop = asyncio.get_running_loop()
+        
+        # Dequeued records wait in _in_flight, where _drain_records can still
+        # write them, so readers never miss a record or see one out of order
+        in_flight = self._in_flight
+        
+        while True:
+            in_flight.append(await queue.get())
+            taken = 1
+            deadline = loop.time() + self.record_flush_interval
+            
+            while taken < self.record_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    in_flight.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                taken += 1
+            
+            batch = list(in_flight)
+            in_flight.clear()
+            try:
+                if batch:
+                    self._write_records(batch)
+            finally:
+                for _ in range(taken):
+                    queue.task_done()
+    
+    def _write_records(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Persist a batch of queued records.
+        
+        Args:
+            batch: Execution records, oldest first
+        """
+        self.execution_history.extend(batch)
+    
+    async def flush(self) -> None:
+        """Wait until all queued execution records have been written."""
+        if self._writer_task is None or self._writer_task.done():
+            self._drain_records()
+        elif self._record_queue is not None:
+            await self._record_queue.join()
+    
+    async def close(self) -> None:
+        """Write all queued execution records and stop the background writer."""
+        writer_task = self._writer_task
+        self._writer_task = None
+        
+        if writer_task is not None:
+            writer_task.cancel()
+            try:
+                await writer_task
+            except asyncio.CancelledError:
+                pass
+        
+        self._drain_records()
     
     async def execute_tool(self, 
                          server_id: str,
@@ -248,6 +476,15 @@ class MCPToolExecutor:
             ValueError: If server or tool not found
             RuntimeError: If execution fails after retries
         """
+        # One snapshot shared by every record of this call, so later
+        # caller-side mutation cannot rewrite the history
+        try:
+            params_snapshot = _snapshot(parameters)
+        except Exception:
+            # e.g. self-referencing parameters; record them as text rather
+            # than failing the call
+            params_snapshot = repr(parameters)
+        
         # Get server
         try:
             server = self.registry.get_server(server_id)
@@ -276,24 +513,24 @@ class MCPToolExecutor:
                 result = server.execute_tool(tool_id, parameters)
                 end_time = time.time()
                 
-                # Record execution
                 execution_record = {
                     "timestamp": time.time(),
                     "server_id": server_id,
                     "tool_id": tool_id,
-                    "parameters": parameters,
+                    "parameters": params_snapshot,
                     "component_id": component_id,
                     "execution_time": end_time - start_time,
                     "estimated_cost": estimated_cost,
                     "success": True
                 }
                 
-                self.execution_history.append(execution_record)
-                
-                # Track credit usage
+                # Track credit usage now, so the next allocation check sees
+                # it; only the history record is written in the background
                 if hasattr(self.credit_tracker, "use_credits"):
                     self.credit_tracker.use_credits(component_id, estimated_cost)
                 
+                self._enqueue_record(execution_record)
+                
                 # Return result with metadata
                 return {
                     "result": result,
@@ -314,14 +551,14 @@ class MCPToolExecutor:
                     "timestamp": time.time(),
                     "server_id": server_id,
                     "tool_id": tool_id,
-                    "parameters": parameters,
+                    "parameters": params_snapshot,
                     "component_id": component_id,
                     "error": str(e),
                     "retry_count": retry_count,
                     "success": False
                 }
                 
-                self.execution_history.append(execution_record)
+                self._enqueue_record(execution_record)
                 
                 # Wait before retry (exponential backoff)
                 if retry_count <= max_retries:
@@ -330,11 +567,30 @@ class MCPToolExecutor:
         # All retries failed
         raise RuntimeError(f"Tool execution failed after {max_retries} retries: {last_error}")
     
+    def dump_history(self, path: str) -> int:
+        """
+        Write the execution history to a JSON file in a single call.
+        
+        Args:
+            path: Destination file path
+            
+        Returns:
+            Number of records written
+        """
+        self._drain_records()
+        records = list(self.execution_history)
+        
+        with open(path, "wb") as f:
+            f.write(_dumps(records))
+        
+        return len(records)
+    
     def get_execution_history(self, 
                             server_id: Optional[str] = None,
                             tool_id: Optional[str] = None,
                             component_id: Optional[str] = None,
-                            success_only: bool = False) -> List[Dict[str, Any]]:
+                            success_only: bool = False,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get execution history, optionally filtered.
         
@@ -343,36 +599,34 @@ class MCPToolExecutor:
             tool_id: Optional tool ID filter
             component_id: Optional component ID filter
             success_only: If True, only return successful executions
+            limit: Optional maximum number of (most recent) records to return
             
         Returns:
-            List of execution records
-        """
-        filtered_history = self.execution_history
-        
-        if server_id is not None:
-            filtered_history = [
-                record for record in filtered_history
-                if record.get("server_id") == server_id
-            ]
-            
-        if tool_id is not None:
-            filtered_history = [
-                record for record in filtered_history
-                if record.get("tool_id") == tool_id
-            ]
-            
-        if component_id is not None:
-            filtered_history = [
-                record for record in filtered_history
-                if record.get("component_id") == component_id
-            ]
-            
-        if success_only:
-            filtered_history = [
-                record for record in filtered_history
-                if record.get("success", False)
-            ]
-            
+            List of execution records, oldest first
+        """
+        self._drain_records()
+        history = self.execution_history
+        
+        if limit is not None and limit <= 0:
+            return []
+        
+        # Fast path: no filters, only the requested tail is copied
+        if (server_id is None and tool_id is None and component_id is None
+                and not success_only):
+            return list(history) if limit is None else history[-limit:]
+        
+        # Single pass from the newest record, stopping once the limit is met
+        matches = (
+            record for record in reversed(history)
+            if (server_id is None or record.get("server_id") == server_id)
+            and (tool_id is None or record.get("tool_id") == tool_id)
+            and (component_id is None or record.get("component_id") == component_id)
+            and (not success_only or record.get("success", False))
+        )
+        
+        filtered_history = list(itertools.islice(matches, limit))
+        filtered_history.reverse()
+        
         return filtered_history
 
 
@@ -416,6 +670,7 @@ class MCPToolSelector:
         
         # Find tools from each server
         candidate_tools = []
+        capability_value = _CAP_VALUES[capability]
         
         for server_id in server_ids:
             try:
@@ -425,7 +680,7 @@ class MCPToolSelector:
                 for tool in tools:
                     tool_capabilities = tool.get("capabilities", [])
                     
-                    if capability.value in tool_capabilities:
+                    if capability_value in tool_capabilities:
                         # Check if tool meets additional requirements
                         if self._tool_meets_requirements(tool, requirements):
                             candidate_tools.append({
@@ -534,6 +789,14 @@ class MCPIntegrationLayer:
         self.registry = registry
         self.executor = executor
         self.selector = selector
+        
+        # Cached capability index (server ID tuples) and the registry generation it matches
+        self._capabilities_cache = None
+        self._capabilities_generation = -1
+    
+    async def close(self) -> None:
+        """Write pending execution records and stop background work."""
+        await self.executor.close()
     
     def register_server(self, 
                        server_id: str, 
@@ -555,6 +818,24 @@ class MCPIntegrationLayer:
         self.registry.register_server(
             server_id, server_metadata, server_module_path, server_class_name)
     
+    def register_server_class(self, 
+                             server_id: str, 
+                             server_metadata: Dict[str, Any],
+                             server_class: Type[MCPServer]) -> None:
+        """
+        Register an MCP server from an already imported class.
+        
+        Args:
+            server_id: Unique identifier for the server
+            server_metadata: Metadata for the server
+            server_class: The server class
+            
+        Raises:
+            ValueError: If server with same ID already registered
+        """
+        self.registry.register_server_class(
+            server_id, server_metadata, server_class)
+    
     async def execute_capability(self, 
                                capability: MCPCapability,
                                parameters: Dict[str, Any],
@@ -615,7 +896,8 @@ class MCPIntegrationLayer:
                             server_id: Optional[str] = None,
                             tool_id: Optional[str] = None,
                             component_id: Optional[str] = None,
-                            success_only: bool = False) -> List[Dict[str, Any]]:
+                            success_only: bool = False,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get execution history, optionally filtered.
         
@@ -624,24 +906,31 @@ class MCPIntegrationLayer:
             tool_id: Optional tool ID filter
             component_id: Optional component ID filter
             success_only: If True, only return successful executions
+            limit: Optional maximum number of (most recent) records to return
             
         Returns:
-            List of execution records
+            List of execution records, oldest first
         """
         return self.executor.get_execution_history(
-            server_id, tool_id, component_id, success_only)
+            server_id, tool_id, component_id, success_only, limit)
     
     def list_capabilities(self) -> Dict[MCPCapability, List[str]]:
         """
         List all available capabilities and the servers that provide them.
         
+        The index is cached until the registry changes; each call gets its
+        own dictionary and lists built from it.
+        
         Returns:
             Dictionary mapping capabilities to lists of server IDs
         """
-        capabilities = {}
-        
-        for capability in MCPCapability:
-            server_ids = self.registry.get_servers_for_capability(capability)
-            capabilities[capability] = server_ids
+        if self._capabilities_generation != self.registry.generation:
+            index = self.registry.capability_index()
+            self._capabilities_cache = {
+                capability: index.get(capability_value, ())
+                for capability, capability_value in _CAP_VALUES.items()
+            }
+            self._capabilities_generation = self.registry.generation
             
-        return capabilities
+        return {capability: list(server_ids)
+                for capability, server_ids in self._capabilities_cache.items()}
@@ -6,8 +6,12 @@ credit usage, provider selection, and workload scheduling.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple, NamedTuple
 import time
+import bisect
+from array import array
+import heapq
+from collections import deque, OrderedDict
 from enum import Enum
 
 # Import interfaces
@@ -23,6 +27,22 @@ class ResourceType(Enum):
     TIME = "time"
 
 
+class UsageEvent(NamedTuple):
+    """A single credit allocation or usage event."""
+    timestamp: float
+    component_id: str
+    action: str  # "allocate" or "use"
+    amount: float
+    balance_or_remaining: float  # Total balance for "allocate", remaining allocation for "use"
+
+
+# Action codes stored in CreditManager's history columns; they double as
+# indexes into [allocated, used] totals
+_ALLOCATE = 0
+_USE = 1
+_ACTION_NAMES = ("allocate", "use")
+
+
 class CreditManager:
     """
     Manages credit allocation and tracking.
@@ -30,18 +50,38 @@ class CreditManager:
     Tracks credit usage across the system and enforces budget constraints.
     """
     
-    def __init__(self, initial_balance: float = 0.0, budget_limit: Optional[float] = None):
+    def __init__(self, 
+                initial_balance: float = 0.0, 
+                budget_limit: Optional[float] = None,
+                history_limit: int = 10000):
         """
         Initialize credit manager.
         
         Args:
             initial_balance: Initial credit balance
             budget_limit: Optional maximum budget (None for unlimited)
+            history_limit: Maximum number of usage events kept for
+                time-filtered reports
         """
-        self.balance = initial_balance
-        self.budget_limit = budget_limit
-        self.usage_history = []
-        self.allocations = {}  # component_id -> allocation
+        self.balance: float = initial_balance
+        self.budget_limit: Optional[float] = budget_limit
+        self.history_limit: int = history_limit
+        self.allocations: Dict[str, float] = {}  # component_id -> allocation
+        
+        # Usage events stored column-wise; columns are trimmed in halves once
+        # they hold twice history_limit events
+        self._timestamps = array("d")
+        self._component_column = array("l")  # Interned component IDs
+        self._action_column = array("B")  # _ALLOCATE or _USE
+        self._amount_column = array("d")
+        self._balance_column = array("d")  # Balance or remaining allocation
+        self._component_ids: Dict[str, int] = {}  # component_id -> interned ID
+        self._component_names: List[str] = []  # interned ID -> component_id
+        
+        # Running aggregates over all events, so unfiltered reports are O(1)
+        self._total_allocated: float = 0.0
+        self._total_used: float = 0.0
+        self._component_usage: Dict[str, Dict[str, float]] = {}  # component_id -> {"allocated", "used"}
     
     def allocate_credits(self, component_id: str, amount: float) -> bool:
         """
@@ -59,14 +99,10 @@ class CreditManager:
             
         self.allocations[component_id] = self.allocations.get(component_id, 0.0) + amount
         self.balance += amount
+        self._total_allocated += amount
+        self._usage_for(component_id)["allocated"] += amount
         
-        self.usage_history.append({
-            "timestamp": time.time(),
-            "component_id": component_id,
-            "action": "allocate",
-            "amount": amount,
-            "balance": self.balance
-        })
+        self._record_event(component_id, _ALLOCATE, amount, self.balance)
         
         return True
     
@@ -87,17 +123,66 @@ class CreditManager:
             return False
             
         self.allocations[component_id] = allocation - amount
+        self._total_used += amount
+        self._usage_for(component_id)["used"] += amount
         
-        self.usage_history.append({
-            "timestamp": time.time(),
-            "component_id": component_id,
-            "action": "use",
-            "amount": amount,
-            "allocation_remaining": self.allocations[component_id]
-        })
+        self._record_event(component_id, _USE, amount, self.allocations[component_id])
         
         return True
     
+    def _record_event(self, 
+                     component_id: str,
+                     action: int,
+                     amount: float,
+                     balance_or_remaining: float) -> None:
+        """
+        Append a usage event to the history columns.
+        
+        Args:
+            component_id: ID of the component
+            action: _ALLOCATE or _USE
+            amount: Amount of credits
+            balance_or_remaining: Balance after allocation, or remaining
+                allocation after use
+        """
+        interned_id = self._component_ids.get(component_id)
+        if interned_id is None:
+            interned_id = self._component_ids[component_id] = len(self._component_names)
+            self._component_names.append(component_id)
+        
+        self._timestamps.append(time.time())
+        self._component_column.append(interned_id)
+        self._action_column.append(action)
+        self._amount_column.append(amount)
+        self._balance_column.append(balance_or_remaining)
+        
+        # Trim in bulk so each event pays O(1) amortized
+        if len(self._timestamps) >= 2 * self.history_limit:
+            excess = len(self._timestamps) - self.history_limit
+            for column in (self._timestamps, self._component_column, self._action_column,
+                           self._amount_column, self._balance_column):
+                del column[:excess]
+    
+    @property
+    def usage_history(self) -> List[UsageEvent]:
+        """The most recent usage events (up to history_limit), oldest first."""
+        start = max(len(self._timestamps) - self.history_limit, 0)
+        names = self._component_names
+        return [
+            UsageEvent(timestamp, names[interned_id], _ACTION_NAMES[action], amount, balance)
+            for timestamp, interned_id, action, amount, balance in zip(
+                self._timestamps[start:], self._component_column[start:],
+                self._action_column[start:], self._amount_column[start:],
+                self._balance_column[start:])
+        ]
+    
+    def _usage_for(self, component_id: str) -> Dict[str, float]:
+        """Get (creating if needed) the running usage totals for a component."""
+        usage = self._component_usage.get(component_id)
+        if usage is None:
+            usage = self._component_usage[component_id] = {"allocated": 0.0, "used": 0.0}
+        return usage
+    
     def get_balance(self) -> float:
         """
         Get current total credit balance.
@@ -131,52 +216,79 @@ class CreditManager:
             start_time: Optional start time (timestamp)
             end_time: Optional end time (timestamp)
             
+        Time-filtered reports only cover the most recent ``history_limit``
+        events; unfiltered reports cover all events.
+        
         Returns:
             Dictionary containing usage statistics
         """
-        # Filter history by parameters
-        filtered_history = self.usage_history
-        
+        if start_time is None and end_time is None:
+            return self._aggregate_usage_report(component_id)
+        
+        # History is append-only in timestamp order, so the time window is a
+        # contiguous slice located by binary search
+        first = max(len(self._timestamps) - self.history_limit, 0)
+        lo = bisect.bisect_left(self._timestamps, start_time, first) if start_time is not None else first
+        hi = (bisect.bisect_right(self._timestamps, end_time, first) if end_time is not None
+              else len(self._timestamps))
+        
+        # Filter, total and group in a single pass over the window columns
+        totals = {}  # interned ID -> [allocated, used]
+        wanted_id = None
         if component_id is not None:
-            filtered_history = [
-                entry for entry in filtered_history
-                if entry["component_id"] == component_id
-            ]
-            
-        if start_time is not None:
-            filtered_history = [
-                entry for entry in filtered_history
-                if entry["timestamp"] >= start_time
-            ]
-            
-        if end_time is not None:
-            filtered_history = [
-                entry for entry in filtered_history
-                if entry["timestamp"] <= end_time
-            ]
+            wanted_id = self._component_ids.get(component_id, -1)  # -1 matches nothing
         
-        # Calculate statistics
-        total_allocated = sum(
-            entry["amount"] for entry in filtered_history
-            if entry["action"] == "allocate"
-        )
+        for interned_id, action, amount in zip(self._component_column[lo:hi],
+                                               self._action_column[lo:hi],
+                                               self._amount_column[lo:hi]):
+            if wanted_id is not None and interned_id != wanted_id:
+                continue
+            
+            usage = totals.get(interned_id)
+            if usage is None:
+                usage = totals[interned_id] = [0.0, 0.0]
+            usage[action] += amount
+        
+        names = self._component_names
+        component_usage = {
+            names[interned_id]: {"allocated": allocated, "used": used}
+            for interned_id, (allocated, used) in totals.items()
+        }
+        total_allocated = sum(allocated for allocated, _ in totals.values())
+        total_used = sum(used for _, used in totals.values())
         
-        total_used = sum(
-            entry["amount"] for entry in filtered_history
-            if entry["action"] == "use"
-        )
+        return {
+            "total_allocated": total_allocated,
+            "total_used": total_used,
+            "component_usage": component_usage,
+            "current_balance": self.balance,
+            "current_allocations": self.allocations.copy()
+        }
+    
+    def _aggregate_usage_report(self, component_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build a usage report from the running aggregates.
         
-        # Group by component
-        component_usage = {}
-        for entry in filtered_history:
-            component_id = entry["component_id"]
-            if component_id not in component_usage:
-                component_usage[component_id] = {"allocated": 0.0, "used": 0.0}
-                
-            if entry["action"] == "allocate":
-                component_usage[component_id]["allocated"] += entry["amount"]
-            elif entry["action"] == "use":
-                component_usage[component_id]["used"] += entry["amount"]
+        Args:
+            component_id: Optional component ID to filter by
+            
+        Returns:
+            Dictionary containing usage statistics
+        """
+        if component_id is None:
+            total_allocated = self._total_allocated
+            total_used = self._total_used
+            component_usage = {
+                cid: dict(usage) for cid, usage in self._component_usage.items()
+            }
+        elif component_id in self._component_usage:
+            usage = self._component_usage[component_id]
+            total_allocated = usage["allocated"]
+            total_used = usage["used"]
+            component_usage = {component_id: dict(usage)}
+        else:
+            total_allocated = total_used = 0.0
+            component_usage = {}
         
         return {
             "total_allocated": total_allocated,
@@ -187,6 +299,7 @@ class CreditManager:
         }
 
 
+
 class CostAwareSelector:
     """
     Selects providers based on cost and capability.
@@ -196,17 +309,31 @@ class CostAwareSelector:
     
     def __init__(self, 
                 provider_registry: ProviderRegistry,
-                credit_manager: CreditManager):
+                credit_manager: CreditManager,
+                cost_ttl: float = 300.0,
+                cost_cache_size: int = 4096):
         """
         Initialize selector.
         
         Args:
             provider_registry: Registry of available providers
             credit_manager: Credit manager for budget constraints
+            cost_ttl: Seconds before a cached cost estimate expires
+            cost_cache_size: Maximum number of entries per cost cache
         """
         self.provider_registry = provider_registry
         self.credit_manager = credit_manager
-        self.cost_cache = {}  # (provider_id, model_id) -> cost_info
+        self.cost_ttl = cost_ttl
+        self.cost_cache_size = cost_cache_size
+        self.cost_cache = OrderedDict()  # (provider_id, model_id) -> cost_info, LRU order
+        self._cheapest_cache = OrderedDict()  # (provider_id, capabilities) -> cost_info, LRU order
+        
+        # Indexes rebuilt whenever the provider registry changes
+        self._indexed_generation = -1
+        self._capability_index = {}  # capability -> set of provider IDs
+        self._cost_index = []  # (cost lower bound, registration order, provider_id), sorted
+        self._provider_caps = {}  # provider_id -> frozenset of capabilities over all models
+        self._model_caps = {}  # provider_id -> list of (model_id, frozenset of capabilities), cheapest first
     
     def select_provider(self, 
                        component_id: str,
@@ -228,41 +355,27 @@ class CostAwareSelector:
         required_capabilities = requirements.get("capabilities", [])
         max_cost = requirements.get("max_cost")
         
-        # Find providers with required capabilities
-        candidate_providers = []
+        self._refresh_indexes()
         
-        for provider_id in self.provider_registry.list_providers():
-            provider = self.provider_registry.get_provider(provider_id)
-            
-            # Check if provider has models with all required capabilities
-            has_all_capabilities = True
-            for capability in required_capabilities:
-                capability_models = []
-                for model in provider.list_available_models():
-                    model_id = model.get("id")
-                    model_capabilities = provider.get_model_capabilities(model_id)
-                    if capability in model_capabilities:
-                        capability_models.append(model_id)
-                        break
-                
-                if not capability_models:
-                    has_all_capabilities = False
-                    break
-            
-            if has_all_capabilities:
-                candidate_providers.append((provider_id, provider))
+        # Providers offering every required capability (on some model)
+        if required_capabilities:
+            candidate_ids = set.intersection(*(
+                self._capability_index.get(capability, set())
+                for capability in required_capabilities
+            ))
+        else:
+            candidate_ids = set(self._provider_caps)
         
-        if not candidate_providers:
+        if not candidate_ids:
             raise ValueError("No provider found with required capabilities")
         
-        # Rank candidates by cost
-        ranked_candidates = self._rank_by_cost(candidate_providers, required_capabilities, max_cost)
+        # Select the cheapest candidate within cost constraints
+        selected = self._select_cheapest(candidate_ids, required_capabilities, max_cost)
         
-        if not ranked_candidates:
+        if selected is None:
             raise ValueError("No provider found within cost constraints")
         
-        # Select the top-ranked provider
-        provider_id, provider = ranked_candidates[0]
+        provider_id, provider = selected
         
         # Check credit allocation
         estimated_cost = self._estimate_provider_cost(provider_id, provider, requirements)
@@ -274,10 +387,106 @@ class CostAwareSelector:
         
         return provider_id, provider
     
+    def _refresh_indexes(self) -> None:
+        """
+        Rebuild the capability and cost indexes if providers have changed.
+        
+        Model capabilities are captured here once, so selection never has to
+        query providers for their models or capabilities.
+        
+        Each provider's cost lower bound is the cost of its cheapest model,
+        capped at the 1.0 default used when no suitable model can be priced.
+        """
+        if self._indexed_generation == self.provider_registry.generation:
+            return
+        
+        capability_index = {}
+        cost_index = []
+        provider_caps = {}
+        model_caps = {}
+        
+        for order, provider_id in enumerate(self.provider_registry.list_providers()):
+            provider = self.provider_registry.get_provider(provider_id)
+            cost_floor = 1.0
+            
+            models = [
+                (model.get("id"), frozenset(provider.get_model_capabilities(model.get("id"))))
+                for model in provider.list_available_models()
+            ]
+            model_costs = [
+                self._model_cost(provider_id, provider, model_id) for model_id, _ in models
+            ]
+            cost_floor = min(model_costs + [cost_floor])
+            
+            # Cheapest models first, so cost estimation can stop at the first match
+            order_by_cost = sorted(range(len(models)), key=model_costs.__getitem__)
+            model_caps[provider_id] = [models[i] for i in order_by_cost]
+            provider_caps[provider_id] = frozenset().union(
+                *(capabilities for _, capabilities in models))
+            
+            for capability in provider_caps[provider_id]:
+                capability_index.setdefault(capability, set()).add(provider_id)
+            
+            cost_index.append((cost_floor, order, provider_id))
+        
+        cost_index.sort()
+        
+        self._capability_index = capability_index
+        self._cost_index = cost_index
+        self._provider_caps = provider_caps
+        self._model_caps = model_caps
+        self._cheapest_cache.clear()  # Model sets may have changed
+        self._indexed_generation = self.provider_registry.generation
+    
+    def _select_cheapest(self, 
+                        candidate_ids: set,
+                        required_capabilities: List[str],
+                        max_cost: Optional[float]) -> Optional[Tuple[str, ModelProvider]]:
+        """
+        Find the cheapest candidate provider, walking the cost index in order.
+        
+        Stops as soon as the next provider's cost lower bound exceeds the
+        best cost found so far. Providers with equal costs are decided by
+        registration order.
+        
+        Args:
+            candidate_ids: IDs of providers meeting capability requirements
+            required_capabilities: List of required capabilities
+            max_cost: Maximum cost constraint
+            
+        Returns:
+            Tuple of (provider_id, provider_instance), or None if no candidate
+            is within the cost constraint
+        """
+        best = None
+        best_key = (float("inf"), 0)  # (cost, registration order)
+        
+        for cost_floor, order, provider_id in self._cost_index:
+            if cost_floor > best_key[0] or (max_cost is not None and cost_floor > max_cost):
+                break
+            
+            if provider_id not in candidate_ids:
+                continue
+            
+            provider = self.provider_registry.get_provider(provider_id)
+            cost = self._estimate_provider_cost(provider_id, provider, {
+                "capabilities": required_capabilities
+            })
+            
+            if max_cost is not None and cost > max_cost:
+                continue
+            
+            if (cost, order) < best_key:
+                best = (provider_id, provider)
+                best_key = (cost, order)
+        
+        return best
+    
     def _rank_by_cost(self, 
                      candidates: List[Tuple[str, ModelProvider]],
                      required_capabilities: List[str],
-                     max_cost: Optional[float]) -> List[Tuple[str, ModelProvider]]:
+                     max_cost: Optional[float],
+                     limit: Optional[int] = None) -> List[Tuple[str, ModelProvider]]:
         """
         Rank candidate providers by cost.
         
@@ -285,6 +494,7 @@ class CostAwareSelector:
             candidates: List of (provider_id, provider) tuples
             required_capabilities: List of required capabilities
             max_cost: Maximum cost constraint
+            limit: Optional number of cheapest providers to return
             
         Returns:
             List of (provider_id, provider) tuples, sorted by cost
@@ -303,8 +513,11 @@ class CostAwareSelector:
                 
             provider_costs.append((provider_id, provider, cost))
         
-        # Sort by cost (ascending)
-        provider_costs.sort(key=lambda x: x[2])
+        # Sort by cost (ascending); a partial heap selection suffices for a limit
+        if limit is not None:
+            provider_costs = heapq.nsmallest(limit, provider_costs, key=lambda x: x[2])
+        else:
+            provider_costs.sort(key=lambda x: x[2])
         
         # Return sorted providers without cost
         return [(pid, p) for pid, p, _ in provider_costs]
@@ -324,41 +537,140 @@ class CostAwareSelector:
         Returns:
             Estimated cost
         """
+        self._refresh_indexes()
+        required = frozenset(requirements.get("capabilities", ()))
+        
+        cache_key = (provider_id, required)
+        cached_cost = self._cached_cost(self._cheapest_cache, cache_key)
+        if cached_cost is not None:
+            return cached_cost
+        
+        # Find the cheapest model that meets requirements. Models are ordered
+        # by their estimated cost when the index was built, so the first
+        # suitable model with a known cost is the cheapest one.
+        min_cost = float("inf")
+        
+        for model_id, model_capabilities in self._model_caps.get(provider_id, ()):
+            # Check if model meets capability requirements
+            if not required.issubset(model_capabilities):
+                continue
+            
+            cost = self._model_cost(provider_id, provider, model_id)
+            if cost < min_cost:
+                min_cost = cost
+                break
+        
+        min_cost = min_cost if min_cost != float("inf") else 1.0  # Default if no models found
+        self._store_cost(self._cheapest_cache, cache_key, min_cost)
+        
+        return min_cost
+    
+    def _model_cost(self, 
+                   provider_id: str,
+                   provider: ModelProvider,
+                   model_id: str) -> float:
+        """
+        Get the (cached) cost of a standard prompt on a model.
+        
+        Args:
+            provider_id: ID of the provider
+            provider: Provider instance
+            model_id: ID of the model
+            
+        Returns:
+            Estimated cost (infinity if estimation fails)
+        """
+        # Check cost cache
+        cache_key = (provider_id, model_id)
+        cached_cost = self._cached_cost(self.cost_cache, cache_key)
+        if cached_cost is not None:
+            return cached_cost
+        
         # Simple estimation based on a standard prompt
         # In a real implementation, this would be more sophisticated
         standard_prompt = "This is a standard test prompt to estimate cost."
         
-        # Find the cheapest model that meets requirements
-        min_cost = float("inf")
+        # Estimate cost
+        try:
+            cost = provider.estimate_cost(model_id, standard_prompt)
+            self._store_cost(self.cost_cache, cache_key, cost)
+        except Exception:
+            # If estimation fails, use a high default
+            cost = float("inf")
+        
+        return cost
+    
+    def _cached_cost(self, cache: OrderedDict, cache_key: Any) -> Optional[float]:
+        """
+        Look up an unexpired cost in an LRU cost cache.
         
-        for model in provider.list_available_models():
-            model_id = model.get("id")
+        Args:
+            cache: Cost cache to search
+            cache_key: Key to look up
             
-            # Check if model meets capability requirements
-            if "capabilities" in requirements:
-                model_capabilities = provider.get_model_capabilities(model_id)
-                if not all(cap in model_capabilities for cap in requirements["capabilities"]):
-                    continue
-            
-            # Check cost cache
-            cache_key = (provider_id, model_id)
-            if cache_key in self.cost_cache:
-                cost = self.cost_cache[cache_key]["cost"]
-            else:
-                # Estimate cost
-                try:
-                    cost = provider.estimate_cost(model_id, standard_prompt)
-                    self.cost_cache[cache_key] = {
-                        "cost": cost,
-                        "timestamp": time.time()
-                    }
-                except Exception:
-                    # If estimation fails, use a high default
-                    cost = float("inf")
-            
-            min_cost = min(min_cost, cost)
-        
-        return min_cost if min_cost != float("inf") else 1.0  # Default if no models found
+        Returns:
+            Cached cost, or None if missing or expired
+        """
+        cost_info = cache.get(cache_key)
+        if cost_info is None:
+            return None
+        
+        if time.monotonic() >= cost_info["expires_at"]:
+            del cache[cache_key]
+            return None
+        
+        cache.move_to_end(cache_key)
+        return cost_info["cost"]
+    
+    def _store_cost(self, cache: OrderedDict, cache_key: Any, cost: float) -> None:
+        """
+        Store a cost in an LRU cost cache, evicting the oldest entry if full.
+        
+        Args:
+            cache: Cost cache to update
+            cache_key: Key to store under
+            cost: Cost to cache
+        """
+        cache[cache_key] = {
+            "cost": cost,
+            "expires_at": time.monotonic() + self.cost_ttl
+        }
+        cache.move_to_end(cache_key)
+        
+        if len(cache) > self.cost_cache_size:
+            cache.popitem(last=False)
+
+
+def _aggregate_workload_window(keys: List[Tuple[int, int]],
+                               entries: List[Dict[str, Any]]
+                               ) -> Tuple[float, Dict[str, float], Dict[str, Any]]:
+    """
+    Sum execution time and resource usage over a window of workload entries.
+    
+    Args:
+        keys: (batch_size, seq) keys of the window
+        entries: Workload entries parallel to keys
+        
+    Returns:
+        Tuple of (total execution time, per-resource totals, earliest entry)
+    """
+    total_time = 0.0
+    resource_totals = {}
+    first_seq = float("inf")
+    first_entry = None
+    
+    for (_, seq), entry in zip(keys, entries):
+        total_time += entry["execution_time"]
+        
+        for resource, value in entry["resource_usage"].items():
+            resource_totals[resource] = resource_totals.get(resource, 0) + value
+        
+        # Track the earliest entry
+        if seq < first_seq:
+            first_seq = seq
+            first_entry = entry
+    
+    return total_time, resource_totals, first_entry
 
 
 class PredictiveBatchScheduler:
@@ -376,14 +688,29 @@ class PredictiveBatchScheduler:
             credit_manager: Credit manager for budget constraints
         """
         self.credit_manager = credit_manager
-        self.workload_history = []
-        self.current_schedule = []
+        self.workload_history = deque(maxlen=1000)
+        
+        # Schedule kept as a heap of (-priority, deadline, seq, schedule_id);
+        # completed entries are dropped from _schedule_by_id and lazily from the heap
+        self._schedule_heap = []
+        self._schedule_by_id = {}  # schedule_id -> schedule entry
+        self._schedule_seq = 0
+        
+        # Predictions keyed by (batch_size, history version), LRU order
+        self._history_version = 0
+        self._prediction_cache = OrderedDict()
+        self.prediction_cache_size = 256
+        
+        # Workload entries ordered by batch size, for binary-searched predictions
+        self._workload_seq = 0
+        self._size_keys = []  # (batch_size, seq), sorted
+        self._size_entries = []  # Entries parallel to _size_keys
     
     def record_workload(self, 
                        timestamp: float,
                        batch_size: int,
                        execution_time: float,
-                       resource_usage: Dict[str, float]):
+                       resource_usage: Dict[str, float]) -> None:
         """
         Record workload data for prediction.
         
@@ -393,16 +720,73 @@ class PredictiveBatchScheduler:
             execution_time: Time taken to execute
             resource_usage: Dictionary of resource usage metrics
         """
-        self.workload_history.append({
+        # The deque evicts its oldest entry on append once full; drop it from
+        # the batch-size index too
+        if len(self.workload_history) == self.workload_history.maxlen:
+            evicted = self.workload_history[0]
+            oldest_seq = self._workload_seq - len(self.workload_history)
+            position = bisect.bisect_left(
+                self._size_keys, (evicted["batch_size"], oldest_seq))
+            del self._size_keys[position]
+            del self._size_entries[position]
+        
+        entry = {
             "timestamp": timestamp,
             "batch_size": batch_size,
             "execution_time": execution_time,
             "resource_usage": resource_usage
-        })
+        }
+        self.workload_history.append(entry)
+        self._history_version += 1
+        
+        key = (batch_size, self._workload_seq)
+        self._workload_seq += 1
+        position = bisect.bisect_right(self._size_keys, key)
+        self._size_keys.insert(position, key)
+        self._size_entries.insert(position, entry)
+    
+    def _similar_window(self, batch_size: int) -> Tuple[int, int]:
+        """
+        Locate entries with a batch size within 20% of the given size.
         
-        # Trim history if it gets too large
-        if len(self.workload_history) > 1000:
-            self.workload_history = self.workload_history[-1000:]
+        Args:
+            batch_size: Size of the batch
+            
+        Returns:
+            (lo, hi) slice bounds into the batch-size ordered entries
+        """
+        lo = bisect.bisect_left(self._size_keys, (0.8 * batch_size,))
+        hi = bisect.bisect_right(self._size_keys, (1.2 * batch_size, float("inf")))
+        return lo, hi
+    
+    def _closest_entry(self, batch_size: int) -> Dict[str, Any]:
+        """
+        Find the recorded entry with the batch size closest to the given size.
+        
+        Ties are broken in favour of the earliest recorded entry.
+        
+        Args:
+            batch_size: Size of the batch
+            
+        Returns:
+            Workload history entry
+        """
+        position = bisect.bisect_left(self._size_keys, (batch_size,))
+        candidates = []
+        
+        if position < len(self._size_keys):
+            # Earliest entry with the smallest batch size >= batch_size
+            candidates.append(position)
+        if position > 0:
+            # Earliest entry with the largest batch size < batch_size
+            below_size = self._size_keys[position - 1][0]
+            candidates.append(bisect.bisect_left(self._size_keys, (below_size,)))
+        
+        closest = min(
+            candidates,
+            key=lambda i: (abs(self._size_keys[i][0] - batch_size), self._size_keys[i][1])
+        )
+        return self._size_entries[closest]
     
     def predict_execution_time(self, batch_size: int) -> float:
         """
@@ -414,30 +798,7 @@ class PredictiveBatchScheduler:
         Returns:
             Predicted execution time
         """
-        if not self.workload_history:
-            # No history, use simple linear estimate
-            return batch_size * 0.1  # 100ms per task
-        
-        # Find similar batch sizes in history
-        similar_batches = [
-            entry for entry in self.workload_history
-            if 0.8 * batch_size <= entry["batch_size"] <= 1.2 * batch_size
-        ]
-        
-        if similar_batches:
-            # Average execution time of similar batches
-            avg_time = sum(entry["execution_time"] for entry in similar_batches) / len(similar_batches)
-            return avg_time
-        else:
-            # Linear extrapolation from closest batch size
-            closest_entry = min(
-                self.workload_history,
-                key=lambda entry: abs(entry["batch_size"] - batch_size)
-            )
-            
-            # Simple linear scaling
-            scale_factor = batch_size / closest_entry["batch_size"]
-            return closest_entry["execution_time"] * scale_factor
+        return self._predict(batch_size)[0]
     
     def predict_resource_usage(self, batch_size: int) -> Dict[str, float]:
         """
@@ -449,39 +810,72 @@ class PredictiveBatchScheduler:
         Returns:
             Dictionary of predicted resource usage
         """
+        return self._predict(batch_size)[1]
+    
+    def _predict(self, batch_size: int) -> Tuple[float, Dict[str, float]]:
+        """
+        Predict execution time and resource usage, reusing cached predictions.
+        
+        Args:
+            batch_size: Size of the batch
+            
+        Returns:
+            Tuple of (predicted execution time, predicted resource usage)
+        """
+        cache_key = (batch_size, self._history_version)
+        prediction = self._prediction_cache.get(cache_key)
+        
+        if prediction is None:
+            prediction = self._compute_prediction(batch_size)
+            self._prediction_cache[cache_key] = prediction
+            if len(self._prediction_cache) > self.prediction_cache_size:
+                self._prediction_cache.popitem(last=False)
+        else:
+            self._prediction_cache.move_to_end(cache_key)
+        
+        # Callers may keep and modify the resource dictionary
+        predicted_time, predicted_resources = prediction
+        return predicted_time, dict(predicted_resources)
+    
+    def _compute_prediction(self, batch_size: int) -> Tuple[float, Dict[str, float]]:
+        """
+        Predict execution time and resource usage in one pass over history.
+        
+        Args:
+            batch_size: Size of the batch
+            
+        Returns:
+            Tuple of (predicted execution time, predicted resource usage)
+        """
         if not self.workload_history:
             # No history, use simple linear estimate
-            return {
+            return batch_size * 0.1, {  # 100ms per task
                 "credits": batch_size * 0.01,  # 0.01 credits per task
                 "memory": batch_size * 10,     # 10MB per task
                 "compute": batch_size * 0.05   # 5% CPU per task
             }
         
         # Find similar batch sizes in history
-        similar_batches = [
-            entry for entry in self.workload_history
-            if 0.8 * batch_size <= entry["batch_size"] <= 1.2 * batch_size
-        ]
+        lo, hi = self._similar_window(batch_size)
         
-        if similar_batches:
-            # Average resource usage of similar batches
-            avg_usage = {}
-            for resource in similar_batches[0]["resource_usage"]:
-                avg_usage[resource] = sum(
-                    entry["resource_usage"].get(resource, 0) 
-                    for entry in similar_batches
-                ) / len(similar_batches)
-            return avg_usage
+        if lo < hi:
+            total_time, resource_totals, first_batch = _aggregate_workload_window(
+                self._size_keys[lo:hi], self._size_entries[lo:hi])
+            
+            # Average over similar batches, for resources the earliest one reported
+            count = hi - lo
+            avg_usage = {
+                resource: resource_totals[resource] / count
+                for resource in first_batch["resource_usage"]
+            }
+            return total_time / count, avg_usage
         else:
             # Linear extrapolation from closest batch size
-            closest_entry = min(
-                self.workload_history,
-                key=lambda entry: abs(entry["batch_size"] - batch_size)
-            )
+            closest_entry = self._closest_entry(batch_size)
             
             # Simple linear scaling
             scale_factor = batch_size / closest_entry["batch_size"]
-            return {
+            return closest_entry["execution_time"] * scale_factor, {
                 resource: value * scale_factor
                 for resource, value in closest_entry["resource_usage"].items()
             }
@@ -506,9 +900,8 @@ class PredictiveBatchScheduler:
         Raises:
             ValueError: If insufficient credits or resources
         """
-        # Predict resource usage
-        predicted_resources = self.predict_resource_usage(batch_size)
-        predicted_time = self.predict_execution_time(batch_size)
+        # Predict execution time and resource usage
+        predicted_time, predicted_resources = self._predict(batch_size)
         
         # Check credit allocation
         required_credits = predicted_resources.get("credits", 0.0)
@@ -519,7 +912,7 @@ class PredictiveBatchScheduler:
                 raise ValueError("Insufficient credits for batch scheduling")
         
         # Create schedule entry
-        schedule_id = f"batch_{int(time.time())}_{len(self.current_schedule)}"
+        schedule_id = f"batch_{self._schedule_seq}"
         
         schedule_entry = {
             "schedule_id": schedule_id,
@@ -533,14 +926,22 @@ class PredictiveBatchScheduler:
             "status": "scheduled"
         }
         
-        # Add to schedule
-        self.current_schedule.append(schedule_entry)
-        
-        # Sort schedule by priority and deadline
-        self._sort_schedule()
+        # Add to schedule, ordered by priority and deadline
+        heapq.heappush(self._schedule_heap, self._schedule_key(schedule_entry))
+        self._schedule_by_id[schedule_id] = schedule_entry
+        self._schedule_seq += 1
         
         return schedule_entry
     
+    @property
+    def current_schedule(self) -> List[Dict[str, Any]]:
+        """Scheduled entries, sorted by priority and deadline."""
+        return [
+            self._schedule_by_id[key[-1]]
+            for key in sorted(self._schedule_heap)
+            if key[-1] in self._schedule_by_id
+        ]
+    
     def get_next_batch(self) -> Optional[Dict[str, Any]]:
         """
         Get the next batch to execute.
@@ -548,11 +949,15 @@ class PredictiveBatchScheduler:
         Returns:
             Schedule entry for the next batch, or None if none ready
         """
-        if not self.current_schedule:
+        # Discard completed entries from the top of the heap
+        while self._schedule_heap and self._schedule_heap[0][-1] not in self._schedule_by_id:
+            heapq.heappop(self._schedule_heap)
+        
+        if not self._schedule_heap:
             return None
             
         # Return the highest priority batch
-        next_batch = self.current_schedule[0]
+        next_batch = self._schedule_by_id[self._schedule_heap[0][-1]]
         next_batch["status"] = "executing"
         
         return next_batch
@@ -574,43 +979,49 @@ class PredictiveBatchScheduler:
         Raises:
             ValueError: If schedule ID not found
         """
-        # Find the schedule entry
-        for i, entry in enumerate(self.current_schedule):
-            if entry["schedule_id"] == schedule_id:
-                # Record workload data
-                self.record_workload(
-                    time.time(),
-                    entry["batch_size"],
-                    execution_time,
-                    resource_usage
-                )
-                
-                # Use credits
-                self.credit_manager.use_credits(
-                    entry["component_id"],
-                    resource_usage.get("credits", 0.0)
-                )
-                
-                # Remove from schedule
-                self.current_schedule.pop(i)
-                return
-                
-        raise ValueError(f"Schedule ID not found: {schedule_id}")
+        # Find and remove the schedule entry
+        entry = self._schedule_by_id.pop(schedule_id, None)
+        if entry is None:
+            raise ValueError(f"Schedule ID not found: {schedule_id}")
+        
+        # Record workload data
+        self.record_workload(
+            time.time(),
+            entry["batch_size"],
+            execution_time,
+            resource_usage
+        )
+        
+        # Use credits
+        self.credit_manager.use_credits(
+            entry["component_id"],
+            resource_usage.get("credits", 0.0)
+        )
+        
+        # Compact the heap once completed entries dominate it
+        if len(self._schedule_heap) > 2 * len(self._schedule_by_id) + 16:
+            self._schedule_heap = [
+                key for key in self._schedule_heap if key[-1] in self._schedule_by_id
+            ]
+            heapq.heapify(self._schedule_heap)
     
-    def _sort_schedule(self) -> None:
-        """
-        Sort the schedule by priority and deadline.
+    def _schedule_key(self, entry: Dict[str, Any]) -> Tuple[int, float, int, str]:
         """
-        def sort_key(entry):
-            # Higher priority comes first
-            priority_key = -entry["priority"]
-            
-            # Earlier deadline comes first (if specified)
-            deadline_key = entry["deadline"] if entry["deadline"] is not None else float("inf")
-            
-            return (priority_key, deadline_key)
+        Build the heap key ordering the schedule by priority and deadline.
+        
+        Args:
+            entry: Schedule entry
             
-        self.current_schedule.sort(key=sort_key)
+        Returns:
+            Heap key; ties are broken by scheduling order
+        """
+        # Higher priority comes first
+        priority_key = -entry["priority"]
+        
+        # Earlier deadline comes first (if specified)
+        deadline_key = entry["deadline"] if entry["deadline"] is not None else float("inf")
+        
+        return (priority_key, deadline_key, self._schedule_seq, entry["schedule_id"])
 
 
 class ResourceOptimizationLayer:
@@ -717,39 +1128,31 @@ class ResourceOptimizationLayer:
         Returns:
             Dictionary containing optimization results
         """
-        # Get current allocations
-        current_allocations = self.credit_manager.get_usage_report()["current_allocations"]
-        
-        # Get usage history
+        # Get usage history and current allocations
         usage_report = self.credit_manager.get_usage_report()
+        current_allocations = usage_report["current_allocations"]
         
         # Simple optimization: reallocate based on usage ratio
-        optimized_allocations = {}
-        total_used = 0.0
-        
-        for component_id, usage in usage_report["component_usage"].items():
-            allocated = usage["allocated"]
-            used = usage["used"]
-            
-            # Calculate usage ratio (with minimum to avoid division by zero)
-            usage_ratio = used / max(allocated, 0.001)
-            
-            # Store for later normalization
-            optimized_allocations[component_id] = usage_ratio
-            total_used += used
+        component_usage = usage_report["component_usage"]
+        total_used = sum(usage["used"] for usage in component_usage.values())
         
         # Normalize to maintain total allocation
         total_allocation = sum(current_allocations.values())
         
-        for component_id in optimized_allocations:
-            # Allocate proportionally to usage ratio
-            if total_used > 0:
-                optimized_allocations[component_id] = (
-                    optimized_allocations[component_id] / total_used * total_allocation
-                )
-            else:
-                # Equal allocation if no usage data
-                optimized_allocations[component_id] = total_allocation / len(optimized_allocations)
+        if total_used > 0:
+            # Allocate proportionally to usage ratio (with minimum allocated
+            # to avoid division by zero), scaling by a factor computed once
+            scale = total_allocation / total_used
+            optimized_allocations = {
+                component_id: usage["used"] / max(usage["allocated"], 0.001) * scale
+                for component_id, usage in component_usage.items()
+            }
+        elif component_usage:
+            # Equal allocation if no usage data
+            equal_share = total_allocation / len(component_usage)
+            optimized_allocations = dict.fromkeys(component_usage, equal_share)
+        else:
+            optimized_allocations = {}
         
         # Return optimization results
         return {
@@ -8,16 +8,45 @@ idle periods.
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union, Callable, Tuple
+import sys
 import time
 import asyncio
 import uuid
 import threading
 import heapq
-from enum import Enum
+import itertools
+import operator
+import types
+from array import array
+from collections import deque
+from enum import IntEnum
 from datetime import datetime, timedelta
 
+# uvloop is optional; when installed the worker's event loop runs on libuv
+# instead of the stdlib selector loop.
+try:
+    import uvloop
+    
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+
+# Expected idle windows by hour of day, as (hours until the window ends,
+# available resources, confidence), or None for busy hours. The system is
+# assumed idle during night hours (0-6) and lunch (12-13), with more
+# resources and higher confidence at night.
+_NIGHT_RESOURCES = {"cpu": 90.0, "memory": 900.0, "credits": 100.0}
+_LUNCH_RESOURCES = {"cpu": 50.0, "memory": 500.0, "credits": 20.0}
+_IDLE_WINDOWS = tuple(
+    (6 - hour, _NIGHT_RESOURCES, 0.8) if hour < 6
+    else (13 - hour, _LUNCH_RESOURCES, 0.6) if hour == 12
+    else None
+    for hour in range(24)
+)
 
-class TaskPriority(Enum):
+
+class TaskPriority(IntEnum):
     """Enum representing different priority levels for sleep-time tasks."""
     LOW = 0
     MEDIUM = 1
@@ -25,14 +54,49 @@ class TaskPriority(Enum):
     CRITICAL = 3
 
 
+# Priorities indexed by value
+_PRIORITIES = tuple(TaskPriority)
+
+# Task statuses, interned so comparisons against restored statuses are
+# identity checks
+_PENDING, _SCHEDULED, _RUNNING, _COMPLETED, _FAILED = map(
+    sys.intern, ("pending", "scheduled", "running", "completed", "failed")
+)
+
+# Shared read-only mapping for tasks without metadata or resource estimates
+_EMPTY_MAPPING = types.MappingProxyType({})
+
+# Timestamps are kept on the monotonic clock, which is cheap to read and
+# immune to wall-clock jumps, and converted to wall-clock time only where
+# they are exposed
+_WALL_CLOCK_OFFSET = time.time() - time.monotonic()
+
+
+def _to_wall_clock(timestamp: Optional[float]) -> Optional[float]:
+    """Convert a monotonic timestamp to wall-clock time."""
+    return None if timestamp is None else timestamp + _WALL_CLOCK_OFFSET
+
+
+def _from_wall_clock(timestamp: Optional[float]) -> Optional[float]:
+    """Convert a wall-clock timestamp to the monotonic clock."""
+    return None if timestamp is None else timestamp - _WALL_CLOCK_OFFSET
+
+
 class SleepTimeTask:
     """
     Represents a task to be executed during sleep time.
     
     Sleep-time tasks are executed when the system is idle or has
-    excess capacity.
+    excess capacity. Estimated resources and metadata are exposed as
+    read-only views of the dictionaries passed in, which are not copied.
     """
     
+    __slots__ = (
+        "task_id", "name", "description", "priority", "estimated_duration",
+        "estimated_resources", "dependencies", "metadata", "created_at",
+        "scheduled_at", "started_at", "completed_at", "status", "result", "error"
+    )
+    
     def __init__(self,
                 task_id: Optional[str] = None,
                 name: str = "",
@@ -51,23 +115,27 @@ class SleepTimeTask:
             description: Detailed description
             priority: Priority level
             estimated_duration: Estimated duration in seconds
-            estimated_resources: Dictionary of estimated resource requirements
+            estimated_resources: Dictionary of estimated resource requirements;
+                callers that keep mutating it should pass a copy
             dependencies: List of task IDs that must complete before this task
-            metadata: Additional metadata
+            metadata: Additional metadata; callers that keep mutating it
+                should pass a copy
         """
         self.task_id = task_id or str(uuid.uuid4())
         self.name = name
         self.description = description
         self.priority = priority
         self.estimated_duration = estimated_duration
-        self.estimated_resources = estimated_resources or {}
+        self.estimated_resources = (
+            types.MappingProxyType(estimated_resources) if estimated_resources else _EMPTY_MAPPING
+        )
         self.dependencies = dependencies or []
-        self.metadata = metadata or {}
-        self.created_at = time.time()
+        self.metadata = types.MappingProxyType(metadata) if metadata else _EMPTY_MAPPING
+        self.created_at = time.monotonic()
         self.scheduled_at = None
         self.started_at = None
         self.completed_at = None
-        self.status = "pending"  # pending, scheduled, running, completed, failed
+        self.status = _PENDING  # pending, scheduled, running, completed, failed
         self.result = None
         self.error = None
     
@@ -78,23 +146,37 @@ class SleepTimeTask:
         Returns:
             Dictionary containing all task data
         """
-        return {
-            "task_id": self.task_id,
-            "name": self.name,
-            "description": self.description,
-            "priority": self.priority.value,
-            "estimated_duration": self.estimated_duration,
-            "estimated_resources": self.estimated_resources,
-            "dependencies": self.dependencies,
-            "metadata": self.metadata,
-            "created_at": self.created_at,
-            "scheduled_at": self.scheduled_at,
-            "started_at": self.started_at,
-            "completed_at": self.completed_at,
-            "status": self.status,
-            "result": self.result,
-            "error": self.error
-        }
+        return self.to_dict_into({})
+    
+    def to_dict_into(self, buf: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write the dictionary representation into an existing dictionary.
+        
+        Lets callers that serialize tasks repeatedly reuse one buffer
+        instead of allocating a new dictionary per call.
+        
+        Args:
+            buf: Dictionary to overwrite with task data
+            
+        Returns:
+            The updated buffer
+        """
+        buf["task_id"] = self.task_id
+        buf["name"] = self.name
+        buf["description"] = self.description
+        buf["priority"] = self.priority.value
+        buf["estimated_duration"] = self.estimated_duration
+        buf["estimated_resources"] = dict(self.estimated_resources)
+        buf["dependencies"] = self.dependencies
+        buf["metadata"] = dict(self.metadata)
+        buf["created_at"] = _to_wall_clock(self.created_at)
+        buf["scheduled_at"] = _to_wall_clock(self.scheduled_at)
+        buf["started_at"] = _to_wall_clock(self.started_at)
+        buf["completed_at"] = _to_wall_clock(self.completed_at)
+        buf["status"] = self.status
+        buf["result"] = self.result
+        buf["error"] = self.error
+        return buf
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SleepTimeTask':
@@ -118,11 +200,11 @@ class SleepTimeTask:
             metadata=data.get("metadata", {})
         )
         
-        task.created_at = data.get("created_at", time.time())
-        task.scheduled_at = data.get("scheduled_at")
-        task.started_at = data.get("started_at")
-        task.completed_at = data.get("completed_at")
-        task.status = data.get("status", "pending")
+        task.created_at = _from_wall_clock(data.get("created_at", time.time()))
+        task.scheduled_at = _from_wall_clock(data.get("scheduled_at"))
+        task.started_at = _from_wall_clock(data.get("started_at"))
+        task.completed_at = _from_wall_clock(data.get("completed_at"))
+        task.status = sys.intern(data.get("status", _PENDING))
         task.result = data.get("result")
         task.error = data.get("error")
         
@@ -161,8 +243,13 @@ class ResourceMonitor:
     scheduling decisions.
     """
     
-    def __init__(self):
-        """Initialize resource monitor."""
+    def __init__(self, history_size: int = 1000):
+        """
+        Initialize resource monitor.
+        
+        Args:
+            history_size: Maximum number of usage samples kept
+        """
         self.resource_usage = {
             "cpu": 0.0,
             "memory": 0.0,
@@ -173,8 +260,42 @@ class ResourceMonitor:
             "memory": 1000.0,  # MB
             "credits": float("inf")  # unlimited by default
         }
-        self.usage_history = []
-        self.last_update = time.time()
+        self.history_size = history_size
+        self.last_update = time.monotonic()
+        
+        # Usage samples stored column-wise in preallocated ring buffers;
+        # _history_head is the next slot to be written
+        self._history_timestamps = array("d", [0.0]) * history_size
+        self._history_columns = {
+            resource: array("d", [0.0]) * history_size
+            for resource in self.resource_usage
+        }
+        self._history_head = 0
+        self._history_count = 0
+        
+        # Running sums over the newest samples that fall within the last
+        # minute, so idle checks do not rescan the history
+        self._window_count = 0
+        self._window_sums = {resource: 0.0 for resource in self.resource_usage}
+        self._window_sumsq = {resource: 0.0 for resource in self.resource_usage}
+        
+        self._release_listeners = []  # Callbacks invoked when usage drops
+        
+        # Available amount per resource, in resource_usage order; recomputed
+        # whenever usage or limits are set rather than on every check
+        self._available = ()
+        self._refresh_available()
+    
+    def add_release_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked whenever resource usage decreases.
+        
+        Callbacks run on the thread that calls update_usage.
+        
+        Args:
+            callback: Function taking no arguments
+        """
+        self._release_listeners.append(callback)
     
     def update_usage(self, 
                     cpu: Optional[float] = None,
@@ -188,26 +309,117 @@ class ResourceMonitor:
             memory: Memory usage in MB
             credits: Credit usage
         """
+        released = False
+        
         if cpu is not None:
+            released = released or cpu < self.resource_usage["cpu"]
             self.resource_usage["cpu"] = cpu
             
         if memory is not None:
+            released = released or memory < self.resource_usage["memory"]
             self.resource_usage["memory"] = memory
             
         if credits is not None:
+            released = released or credits < self.resource_usage["credits"]
             self.resource_usage["credits"] = credits
             
-        # Record history
-        self.usage_history.append({
-            "timestamp": time.time(),
-            "usage": self.resource_usage.copy()
-        })
+        self._refresh_available()
+        
+        # Record history, overwriting the oldest sample once the buffer is full
+        head = self._history_head
+        if self._window_count == self.history_size:
+            # The slot being overwritten holds the oldest windowed sample
+            self._drop_window_sample(head)
+            
+        now = time.monotonic()
+        self._history_timestamps[head] = now
+        for resource, column in self._history_columns.items():
+            value = self.resource_usage[resource]
+            column[head] = value
+            self._window_sums[resource] += value
+            self._window_sumsq[resource] += value * value
+        
+        self._history_head = (head + 1) % self.history_size
+        if self._history_count < self.history_size:
+            self._history_count += 1
+        self._window_count += 1
+        self._expire_window(now - 60)
+            
+        self.last_update = now
+        
+        if released:
+            for callback in self._release_listeners:
+                callback()
+    
+    def _expire_window(self, cutoff: float) -> None:
+        """
+        Remove samples older than the cutoff from the running window sums.
+        
+        Args:
+            cutoff: Oldest timestamp still counted in the window
+        """
+        size = self.history_size
+        index = (self._history_head - self._window_count) % size
+        while self._window_count and self._history_timestamps[index] < cutoff:
+            self._drop_window_sample(index)
+            index = (index + 1) % size
+    
+    def _drop_window_sample(self, index: int) -> None:
+        """
+        Subtract the oldest windowed sample from the running window sums.
+        
+        Args:
+            index: Ring buffer slot of the sample
+        """
+        self._window_count -= 1
+        if not self._window_count:
+            # Reset rather than subtract, so rounding errors do not accumulate
+            for resource in self._window_sums:
+                self._window_sums[resource] = 0.0
+                self._window_sumsq[resource] = 0.0
+            return
+            
+        for resource, column in self._history_columns.items():
+            value = column[index]
+            self._window_sums[resource] -= value
+            self._window_sumsq[resource] -= value * value
+    
+    @property
+    def usage_history(self) -> List[Dict[str, Any]]:
+        """Recorded usage samples with wall-clock timestamps, oldest first."""
+        timestamps = self._recent_samples(self._history_timestamps, 0)
+        columns = {
+            resource: self._recent_samples(column, 0)
+            for resource, column in self._history_columns.items()
+        }
+        return [
+            {
+                "timestamp": _to_wall_clock(timestamp),
+                "usage": {resource: values[i] for resource, values in columns.items()}
+            }
+            for i, timestamp in enumerate(timestamps)
+        ]
+    
+    def _recent_samples(self, column: array, start: int) -> array:
+        """
+        Copy samples out of a history ring buffer in chronological order.
         
-        # Trim history if it gets too large
-        if len(self.usage_history) > 1000:
-            self.usage_history = self.usage_history[-1000:]
+        Args:
+            column: Ring buffer column to read
+            start: Number of oldest samples to skip
             
-        self.last_update = time.time()
+        Returns:
+            Array of the remaining samples, oldest first
+        """
+        count = self._history_count - start
+        if count <= 0:
+            return array("d")
+            
+        end = self._history_head
+        first = (end - count) % self.history_size
+        if first < end:
+            return column[first:end]
+        return column[first:] + column[:end]
     
     def set_limits(self, 
                   cpu: Optional[float] = None,
@@ -229,6 +441,15 @@ class ResourceMonitor:
             
         if credits is not None:
             self.resource_limits["credits"] = credits
+            
+        self._refresh_available()
+    
+    def _refresh_available(self) -> None:
+        """Recompute available resources after usage or limits change."""
+        self._available = tuple(
+            max(0.0, self.resource_limits[resource] - usage)
+            for resource, usage in self.resource_usage.items()
+        )
     
     def get_available_resources(self) -> Dict[str, float]:
         """
@@ -237,10 +458,7 @@ class ResourceMonitor:
         Returns:
             Dictionary of available resources
         """
-        return {
-            resource: max(0.0, self.resource_limits[resource] - self.resource_usage[resource])
-            for resource in self.resource_usage
-        }
+        return dict(zip(self.resource_usage, self._available))
     
     def can_execute_task(self, task: SleepTimeTask) -> bool:
         """
@@ -252,52 +470,67 @@ class ResourceMonitor:
         Returns:
             True if task can be executed, False otherwise
         """
-        available = self.get_available_resources()
-        estimated = task.estimated_resources
+        return self.fits(self.requirement_vector(task.estimated_resources))
+    
+    def requirement_vector(self, requirements: Dict[str, float]) -> Tuple[float, ...]:
+        """
+        Arrange resource requirements in the monitor's resource order.
         
-        for resource, required in estimated.items():
-            if resource in available and available[resource] < required:
-                return False
-                
-        return True
+        Requirements for resources that are not monitored are ignored.
+        
+        Args:
+            requirements: Dictionary of required resources
+            
+        Returns:
+            Tuple of required amounts, one per monitored resource
+        """
+        return tuple(requirements.get(resource, 0.0) for resource in self.resource_usage)
     
-    def get_idle_status(self) -> Dict[str, Any]:
+    def fits(self, requirement_vector: Tuple[float, ...]) -> bool:
+        """
+        Check if a requirement vector fits within the available resources.
+        
+        Args:
+            requirement_vector: Requirements from requirement_vector()
+            
+        Returns:
+            True if every requirement is available, False otherwise
+        """
+        return all(map(operator.le, requirement_vector, self._available))
+    
+    def get_idle_status(self, now: Optional[float] = None) -> Dict[str, Any]:
         """
         Get system idle status.
         
+        Args:
+            now: Optional current time.monotonic() reading, so callers
+                making several checks per tick can share one clock read
+        
         Returns:
             Dictionary with idle status information
         """
         # Calculate average usage over the last minute
-        now = time.time()
-        recent_history = [
-            entry for entry in self.usage_history
-            if entry["timestamp"] >= now - 60
-        ]
+        if now is None:
+            now = time.monotonic()
+        self._expire_window(now - 60)
+        sample_count = self._window_count
         
-        if not recent_history:
+        if not sample_count:
             return {
                 "is_idle": True,
                 "idle_resources": self.get_available_resources(),
                 "confidence": 0.5  # Medium confidence due to lack of data
             }
             
-        avg_usage = {}
-        for resource in self.resource_usage:
-            avg_usage[resource] = sum(
-                entry["usage"].get(resource, 0) for entry in recent_history
-            ) / len(recent_history)
-            
-        # Calculate idle threshold (30% of limit)
-        idle_threshold = {
-            resource: limit * 0.3
-            for resource, limit in self.resource_limits.items()
+        avg_usage = {
+            resource: total / sample_count
+            for resource, total in self._window_sums.items()
         }
-        
-        # Check if system is idle
+            
+        # Check if system is idle (usage within 30% of each limit)
         is_idle = all(
-            avg_usage.get(resource, 0) <= threshold
-            for resource, threshold in idle_threshold.items()
+            avg_usage.get(resource, 0) <= limit * 0.3
+            for resource, limit in self.resource_limits.items()
         )
         
         # Calculate idle resources
@@ -312,19 +545,15 @@ class ResourceMonitor:
         
         # Consistency factor based on standard deviation
         consistency = 1.0  # Default high consistency
-        if len(recent_history) > 1:
-            for resource in self.resource_usage:
-                values = [entry["usage"].get(resource, 0) for entry in recent_history]
-                mean = sum(values) / len(values)
-                variance = sum((x - mean) ** 2 for x in values) / len(values)
-                std_dev = variance ** 0.5
-                
-                # Normalize std_dev relative to the resource limit
-                normalized_std_dev = std_dev / max(1.0, self.resource_limits[resource])
-                
-                # Lower consistency for higher std_dev
-                resource_consistency = max(0.0, 1.0 - normalized_std_dev * 5.0)
-                consistency = min(consistency, resource_consistency)
+        if sample_count > 1:
+            # Consistency falls with std_dev normalized to the resource limit,
+            # so only the least consistent resource matters
+            max_normalized_std_dev = max(
+                max(0.0, total_sq / sample_count - avg_usage[resource] ** 2) ** 0.5
+                / max(1.0, self.resource_limits[resource])
+                for resource, total_sq in self._window_sumsq.items()
+            )
+            consistency = max(0.0, 1.0 - max_normalized_std_dev * 5.0)
                 
         confidence = (age_factor + consistency) / 2.0
         
@@ -352,11 +581,34 @@ class TaskScheduler:
             resource_monitor: ResourceMonitor instance
         """
         self.resource_monitor = resource_monitor
-        self.task_queue = []  # Priority queue of (priority_score, task_id)
+        self.task_queue = []  # Binary heap of (priority_score, created_at, task_id) for ready tasks
+        self._heap_pos = {}  # task_id -> index in task_queue
+        self._requirements = {}  # task_id -> resource requirement vector
         self.tasks = {}  # task_id -> SleepTimeTask
         self.scheduled_tasks = set()  # Set of scheduled task IDs
         self.completed_tasks = set()  # Set of completed task IDs
         self.failed_tasks = set()  # Set of failed task IDs
+        
+        # Tasks waiting on dependencies are kept out of the queue until
+        # their last dependency completes
+        self._pending_deps = {}  # task_id -> number of uncompleted dependencies
+        self._dependents = {}  # dependency task_id -> set of blocked task IDs
+        
+        # Pending (queued or blocked) task counts and total estimated
+        # duration, kept up to date as tasks change state so status polls
+        # and predictions do not walk the queue
+        self._priority_counts = {priority.name: 0 for priority in TaskPriority}
+        self._pending_count = 0
+        self._pending_duration_sum = 0.0
+        self._counted = set()  # IDs of the tasks included in these totals
+        
+        # Incremented whenever the set of pending tasks or their priorities
+        # change, so callers can cache results derived from them
+        self.generation = 0
+        
+        # Tasks are added from callers' threads and taken by the worker
+        # thread; the heap and its index are updated in several steps
+        self._lock = threading.Lock()
     
     def add_task(self, task: SleepTimeTask) -> str:
         """
@@ -371,19 +623,167 @@ class TaskScheduler:
         Raises:
             ValueError: If task with same ID already exists
         """
-        if task.task_id in self.tasks:
-            raise ValueError(f"Task with ID '{task.task_id}' already exists")
+        with self._lock:
+            if task.task_id in self.tasks:
+                raise ValueError(f"Task with ID '{task.task_id}' already exists")
+                
+            self.tasks[task.task_id] = task
+            self._requirements[task.task_id] = self.resource_monitor.requirement_vector(
+                task.estimated_resources)
+            self._add_pending(task)
+            self.generation += 1
             
-        self.tasks[task.task_id] = task
+            unmet_dependencies = set(task.dependencies) - self.completed_tasks
+            if unmet_dependencies:
+                # Queue the task once its dependencies have completed
+                self._pending_deps[task.task_id] = len(unmet_dependencies)
+                for dep_id in unmet_dependencies:
+                    self._dependents.setdefault(dep_id, set()).add(task.task_id)
+                return task.task_id
+            
+            self._enqueue(task)
+            
+            return task.task_id
+    
+    def _add_pending(self, task: SleepTimeTask) -> None:
+        """
+        Count a task as pending.
+        
+        Args:
+            task: Task entering the pending state
+        """
+        if task.task_id in self._counted:
+            return
+        self._counted.add(task.task_id)
+        self._priority_counts[task.priority.name] += 1
+        self._pending_count += 1
+        self._pending_duration_sum += task.estimated_duration
+    
+    def _remove_pending(self, task: SleepTimeTask) -> None:
+        """
+        Stop counting a task as pending.
+        
+        Args:
+            task: Task leaving the pending state
+        """
+        if task.task_id not in self._counted:
+            return
+        self._counted.remove(task.task_id)
+        self._priority_counts[task.priority.name] -= 1
+        self._pending_count -= 1
+        if self._pending_count:
+            self._pending_duration_sum -= task.estimated_duration
+        else:
+            # Reset rather than subtract, so rounding error cannot build up
+            self._pending_duration_sum = 0.0
+    
+    def average_pending_duration(self, default: float = 60.0) -> float:
+        """
+        Get the mean estimated duration of pending tasks.
+        
+        Args:
+            default: Value returned when no tasks are pending
+            
+        Returns:
+            Average estimated duration in seconds
+        """
+        if not self._pending_count:
+            return default
+        return self._pending_duration_sum / self._pending_count
+    
+    def _enqueue(self, task: SleepTimeTask) -> None:
+        """
+        Add a task whose dependencies are met to the priority queue.
+        
+        A task that is already queued is re-keyed rather than duplicated.
+        
+        Args:
+            task: Task to enqueue
+        """
+        self._dequeue(task.task_id)
         
         # Calculate priority score (lower is higher priority)
-        # Inverted priority value (so HIGH is lower score than LOW)
-        priority_score = -task.priority.value
+        # Inverted priority value (so HIGH is lower score than LOW); equal
+        # priorities run in creation order
+        priority_score = -task.priority
         
-        # Add to priority queue
-        heapq.heappush(self.task_queue, (priority_score, task.task_id))
+        self.task_queue.append((priority_score, task.created_at, task.task_id))
+        self._sift_up(len(self.task_queue) - 1)
+    
+    def _dequeue(self, task_id: str) -> bool:
+        """
+        Remove a task from the priority queue.
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            True if the task was queued, False otherwise
+        """
+        pos = self._heap_pos.pop(task_id, None)
+        if pos is None:
+            return False
+            
+        last = self.task_queue.pop()
+        if pos < len(self.task_queue):
+            # Fill the hole with the last entry and restore the heap order
+            self.task_queue[pos] = last
+            self._sift_up(self._sift_down(pos))
+            
+        return True
+    
+    def _sift_up(self, pos: int) -> int:
+        """
+        Move a queue entry towards the root until its parent is smaller.
         
-        return task.task_id
+        Args:
+            pos: Index of the entry
+            
+        Returns:
+            Final index of the entry
+        """
+        queue = self.task_queue
+        entry = queue[pos]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if queue[parent] <= entry:
+                break
+            queue[pos] = queue[parent]
+            self._heap_pos[queue[pos][-1]] = pos
+            pos = parent
+            
+        queue[pos] = entry
+        self._heap_pos[entry[-1]] = pos
+        return pos
+    
+    def _sift_down(self, pos: int) -> int:
+        """
+        Move a queue entry towards the leaves until its children are larger.
+        
+        Args:
+            pos: Index of the entry
+            
+        Returns:
+            Final index of the entry
+        """
+        queue = self.task_queue
+        size = len(queue)
+        entry = queue[pos]
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and queue[child + 1] < queue[child]:
+                child += 1
+            if entry <= queue[child]:
+                break
+            queue[pos] = queue[child]
+            self._heap_pos[queue[pos][-1]] = pos
+            pos = child
+            
+        queue[pos] = entry
+        self._heap_pos[entry[-1]] = pos
+        return pos
     
     def get_task(self, task_id: str) -> Optional[SleepTimeTask]:
         """
@@ -404,45 +804,29 @@ class TaskScheduler:
         Returns:
             SleepTimeTask instance or None if no tasks are ready
         """
-        # Check if there are any tasks in the queue
-        if not self.task_queue:
-            return None
-            
-        # Find the highest priority task that is ready to execute
-        while self.task_queue:
-            _, task_id = self.task_queue[0]  # Peek at the top task
-            task = self.tasks[task_id]
-            
-            # Skip tasks that are already scheduled or completed
-            if task_id in self.scheduled_tasks or task_id in self.completed_tasks:
-                heapq.heappop(self.task_queue)  # Remove from queue
-                continue
+        with self._lock:
+            # Check if there are any tasks in the queue
+            if not self.task_queue:
+                return None
                 
-            # Check if all dependencies are completed
-            dependencies_met = all(
-                dep_id in self.completed_tasks
-                for dep_id in task.dependencies
-            )
+            # The highest priority task; only pending tasks with all dependencies
+            # completed are in the queue
+            task_id = self.task_queue[0][-1]
+            task = self.tasks[task_id]
             
-            if not dependencies_met:
-                # Move this task to the back of the queue
-                heapq.heappop(self.task_queue)  # Remove from queue
-                heapq.heappush(self.task_queue, (-task.priority.value, task_id))  # Add back with same priority
-                continue
-                
             # Check if resources are available
-            if not self.resource_monitor.can_execute_task(task):
+            if not self.resource_monitor.fits(self._requirements[task_id]):
                 # No resources available, return None
                 return None
                 
             # Task is ready to execute
-            heapq.heappop(self.task_queue)  # Remove from queue
+            self._dequeue(task_id)
+            self._remove_pending(task)
+            self.generation += 1
             self.scheduled_tasks.add(task_id)
-            task.status = "scheduled"
-            task.scheduled_at = time.time()
+            task.status = _SCHEDULED
+            task.scheduled_at = time.monotonic()
             return task
-            
-        return None
     
     def mark_task_completed(self, 
                           task_id: str,
@@ -457,58 +841,106 @@ class TaskScheduler:
         Returns:
             True if task was marked as completed, False if not found
         """
-        task = self.get_task(task_id)
-        if not task:
-            return False
+        with self._lock:
+            task = self.get_task(task_id)
+            if not task:
+                return False
+                
+            self.generation += 1
+            if task.status == _PENDING:
+                self._remove_pending(task)
+                self._dequeue(task_id)
+                
+            task.status = _COMPLETED
+            task.completed_at = time.monotonic()
+            task.result = result
+            self._unblock(task_id)
             
-        task.status = "completed"
-        task.completed_at = time.time()
-        task.result = result
-        
-        self.scheduled_tasks.discard(task_id)
-        self.completed_tasks.add(task_id)
-        
-        return True
+            self.scheduled_tasks.discard(task_id)
+            if task_id in self.completed_tasks:
+                return True
+            self.completed_tasks.add(task_id)
+            
+            # Queue dependents whose last dependency this was
+            for dependent_id in self._dependents.pop(task_id, ()):
+                self._pending_deps[dependent_id] -= 1
+                if not self._pending_deps[dependent_id]:
+                    del self._pending_deps[dependent_id]
+                    dependent = self.tasks[dependent_id]
+                    if dependent.status == _PENDING:
+                        self._enqueue(dependent)
+            
+            return True
     
     def mark_task_failed(self, 
                        task_id: str,
-                       error: Optional[str] = None) -> bool:
+                       error: Optional[str] = None,
+                       now: Optional[float] = None) -> bool:
         """
         Mark a task as failed.
         
         Args:
             task_id: ID of the task
             error: Optional error message
+            now: Optional current time.monotonic() reading
             
         Returns:
             True if task was marked as failed, False if not found
         """
-        task = self.get_task(task_id)
-        if not task:
-            return False
+        with self._lock:
+            task = self.get_task(task_id)
+            if not task:
+                return False
+                
+            self.generation += 1
+            if task.status == _PENDING:
+                self._remove_pending(task)
+                self._dequeue(task_id)
+                
+            task.status = _FAILED
+            task.completed_at = time.monotonic() if now is None else now
+            task.error = error
+            
+            self.scheduled_tasks.discard(task_id)
+            self.failed_tasks.add(task_id)
             
-        task.status = "failed"
-        task.completed_at = time.time()
-        task.error = error
+            # Re-queue the task with lower priority if it's not a critical failure
+            if not error or "critical" in error.lower():
+                # Failed for good, so it no longer waits on its dependencies
+                self._unblock(task_id)
+            else:
+                # Calculate new priority (one level lower)
+                new_priority = max(0, task.priority - 1)
+                task.priority = _PRIORITIES[new_priority]
+                
+                # Reset task status
+                task.status = _PENDING
+                task.scheduled_at = None
+                task.completed_at = None
+                self._add_pending(task)
+                
+                # Add back to queue, unless it is still waiting on dependencies
+                if task_id not in self._pending_deps:
+                    self._enqueue(task)
+                
+            return True
+    
+    def _unblock(self, task_id: str) -> None:
+        """
+        Stop a task waiting on its dependencies, once it has finished.
         
-        self.scheduled_tasks.discard(task_id)
-        self.failed_tasks.add(task_id)
+        Args:
+            task_id: ID of the task
+        """
+        if self._pending_deps.pop(task_id, None) is None:
+            return
         
-        # Re-queue the task with lower priority if it's not a critical failure
-        if error and "critical" not in error.lower():
-            # Calculate new priority (one level lower)
-            new_priority = max(0, task.priority.value - 1)
-            task.priority = TaskPriority(new_priority)
-            
-            # Reset task status
-            task.status = "pending"
-            task.scheduled_at = None
-            task.completed_at = None
-            
-            # Add back to queue
-            heapq.heappush(self.task_queue, (-task.priority.value, task_id))
-            
-        return True
+        for dep_id in self.tasks[task_id].dependencies:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task_id)
+                if not dependents:
+                    del self._dependents[dep_id]
     
     def get_queue_status(self) -> Dict[str, Any]:
         """
@@ -517,28 +949,17 @@ class TaskScheduler:
         Returns:
             Dictionary with queue status information
         """
-        pending_count = len(self.task_queue)
-        scheduled_count = len(self.scheduled_tasks)
-        completed_count = len(self.completed_tasks)
-        failed_count = len(self.failed_tasks)
-        
-        # Count tasks by priority
-        priority_counts = {
-            priority.name: 0 for priority in TaskPriority
-        }
-        
-        for _, task_id in self.task_queue:
-            task = self.tasks[task_id]
-            priority_counts[task.priority.name] += 1
+        with self._lock:
+            priority_counts = dict(self._priority_counts)
             
-        return {
-            "pending_count": pending_count,
-            "scheduled_count": scheduled_count,
-            "completed_count": completed_count,
-            "failed_count": failed_count,
-            "priority_counts": priority_counts,
-            "total_tasks": len(self.tasks)
-        }
+            return {
+                "pending_count": self._pending_count,
+                "scheduled_count": len(self.scheduled_tasks),
+                "completed_count": len(self.completed_tasks),
+                "failed_count": len(self.failed_tasks),
+                "priority_counts": priority_counts,
+                "total_tasks": len(self.tasks)
+            }
 
 
 class SleepDetector:
@@ -567,21 +988,24 @@ class SleepDetector:
         self.idle_start_time = None
         self.is_idle = False
     
-    def check_idle_state(self) -> Dict[str, Any]:
+    def check_idle_state(self, now: Optional[float] = None) -> Dict[str, Any]:
         """
         Check if the system is in an idle state.
         
+        Args:
+            now: Optional current time.monotonic() reading
+        
         Returns:
             Dictionary with idle state information
         """
-        idle_status = self.resource_monitor.get_idle_status()
+        # Update idle state
+        current_time = time.monotonic() if now is None else now
+        
+        idle_status = self.resource_monitor.get_idle_status(current_time)
         
         # Check if system is idle based on resource usage
         current_is_idle = idle_status["is_idle"]
         
-        # Update idle state
-        current_time = time.time()
-        
         if current_is_idle:
             # System is currently idle
             if not self.is_idle:
@@ -624,56 +1048,30 @@ class SleepDetector:
         # Simple prediction based on time of day
         # In a real implementation, this would use more sophisticated analysis
         
-        # Get current time
-        now = datetime.now()
-        
-        # Predict idle periods for each hour
+        # Walk the hours from the start of the current one, emitting one
+        # period per contiguous idle window
+        base_time = datetime.now().replace(minute=0, second=0, microsecond=0)
         idle_periods = []
         
-        for hour_offset in range(lookahead_hours):
-            future_time = now + timedelta(hours=hour_offset)
-            hour = future_time.hour
-            
-            # Assume system is idle during night hours (0-6) and lunch (12-13)
-            is_night = 0 <= hour < 6
-            is_lunch = 12 <= hour < 13
-            
-            if is_night or is_lunch:
-                # Predict idle period
-                start_time = future_time.replace(minute=0, second=0)
-                
-                # Set end time
-                if is_night:
-                    end_hour = 6
-                    if hour >= end_hour:
-                        # Skip this period (already past end time)
-                        continue
-                    end_time = start_time.replace(hour=end_hour, minute=0, second=0)
-                else:  # is_lunch
-                    end_hour = 13
-                    if hour >= end_hour:
-                        # Skip this period (already past end time)
-                        continue
-                    end_time = start_time.replace(hour=end_hour, minute=0, second=0)
-                
-                # Calculate duration
-                duration = (end_time - start_time).total_seconds()
-                
-                # Estimate available resources during this period
-                # Assume more resources available during night than lunch
-                available_resources = {
-                    "cpu": 90.0 if is_night else 50.0,
-                    "memory": 900.0 if is_night else 500.0,
-                    "credits": 100.0 if is_night else 20.0
-                }
+        hour_offset = 0
+        while hour_offset < lookahead_hours:
+            window = _IDLE_WINDOWS[(base_time.hour + hour_offset) % 24]
+            if window is None:
+                hour_offset += 1
+                continue
                 
-                idle_periods.append({
-                    "start_time": start_time.timestamp(),
-                    "end_time": end_time.timestamp(),
-                    "duration": duration,
-                    "available_resources": available_resources,
-                    "confidence": 0.8 if is_night else 0.6  # Higher confidence for night
-                })
+            hours_left, available_resources, confidence = window
+            start_time = base_time + timedelta(hours=hour_offset)
+            end_time = start_time + timedelta(hours=hours_left)
+            
+            idle_periods.append({
+                "start_time": start_time.timestamp(),
+                "end_time": end_time.timestamp(),
+                "duration": float(hours_left * 3600),
+                "available_resources": dict(available_resources),
+                "confidence": confidence
+            })
+            hour_offset += hours_left
                 
         return idle_periods
 
@@ -742,7 +1140,9 @@ class SleepTimeOptimizer:
                 resource_monitor: ResourceMonitor,
                 task_scheduler: TaskScheduler,
                 sleep_detector: SleepDetector,
-                task_registry: BackgroundTaskRegistry):
+                task_registry: BackgroundTaskRegistry,
+                max_concurrent_tasks: int = 1,
+                execution_history_limit: int = 10000):
         """
         Initialize optimizer.
         
@@ -751,27 +1151,45 @@ class SleepTimeOptimizer:
             task_scheduler: TaskScheduler instance
             sleep_detector: SleepDetector instance
             task_registry: BackgroundTaskRegistry instance
+            max_concurrent_tasks: Maximum number of tasks executing at once
+            execution_history_limit: Maximum number of execution history
+                entries kept
         """
         self.resource_monitor = resource_monitor
         self.task_scheduler = task_scheduler
         self.sleep_detector = sleep_detector
         self.task_registry = task_registry
+        self.max_concurrent_tasks = max_concurrent_tasks
         self.running = False
         self.worker_thread = None
-        self.execution_history = []
+        self.execution_history = deque(maxlen=execution_history_limit)
+        self._running_jobs = set()  # asyncio tasks executing sleep-time tasks
+        
+        # Last completion time prediction, keyed by (scheduler generation,
+        # current second)
+        self._prediction_key = None
+        self._prediction = {}
+        
+        # Worker event loop and the event that wakes it; set while running
+        self._loop = None
+        self._wake = None
+        
+        # Freed resources may let a waiting task run
+        self.resource_monitor.add_release_listener(self._notify_worker)
     
     def start(self) -> None:
         """
         Start the optimizer.
         
-        This method starts the background worker thread that monitors
-        system state and executes tasks during idle periods.
+        This method starts the background worker thread, which runs an
+        event loop that monitors system state and executes tasks during
+        idle periods.
         """
         if self.running:
             return
             
         self.running = True
-        self.worker_thread = threading.Thread(target=self._worker_loop)
+        self.worker_thread = threading.Thread(target=self._run_worker)
         self.worker_thread.daemon = True
         self.worker_thread.start()
     
@@ -782,6 +1200,7 @@ class SleepTimeOptimizer:
         This method stops the background worker thread.
         """
         self.running = False
+        self._notify_worker()
         if self.worker_thread:
             self.worker_thread.join(timeout=5.0)
             self.worker_thread = None
@@ -828,7 +1247,10 @@ class SleepTimeOptimizer:
             }
         )
         
-        return self.task_scheduler.add_task(task)
+        task_id = self.task_scheduler.add_task(task)
+        self._notify_worker()
+        
+        return task_id
     
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -879,12 +1301,9 @@ class SleepTimeOptimizer:
         Returns:
             List of execution history entries
         """
-        # Return most recent entries first
-        return sorted(
-            self.execution_history[-max_entries:],
-            key=lambda entry: entry["timestamp"],
-            reverse=True
-        )
+        # Return most recent entries first; entries are appended as tasks
+        # finish, so the history is already in timestamp order
+        return list(itertools.islice(reversed(self.execution_history), max_entries))
     
     def predict_completion_times(self) -> Dict[str, float]:
         """
@@ -896,138 +1315,287 @@ class SleepTimeOptimizer:
         # Get current time
         now = time.time()
         
+        # Reuse the last prediction while no task has changed state within
+        # the same second
+        prediction_key = (self.task_scheduler.generation, int(now))
+        if prediction_key != self._prediction_key:
+            self._prediction = self._simulate_completion_times(now)
+            self._prediction_key = prediction_key
+            
+        return dict(self._prediction)
+    
+    def _simulate_completion_times(self, now: float) -> Dict[str, float]:
+        """
+        Simulate pending task execution over the predicted idle periods.
+        
+        Args:
+            now: Current wall-clock time
+            
+        Returns:
+            Dictionary mapping task IDs to predicted completion timestamps
+        """
         # Get idle periods
         idle_periods = self.sleep_detector.predict_idle_periods()
         
-        # Get pending tasks
-        pending_tasks = []
+        # Get pending tasks, bucketed by priority; there are only a few
+        # levels, so this replaces a comparison sort
+        buckets = [[] for _ in _PRIORITIES]
+        scheduled_tasks = self.task_scheduler.scheduled_tasks  # a set
         for task_id, task in self.task_scheduler.tasks.items():
-            if task.status == "pending" and task_id not in self.task_scheduler.scheduled_tasks:
-                pending_tasks.append(task)
+            if task.status == _PENDING and task_id not in scheduled_tasks:
+                buckets[task.priority].append(task)
                 
-        # Sort tasks by priority
-        pending_tasks.sort(key=lambda t: -t.priority.value)
-        
-        # Simulate task execution during idle periods
-        completion_times = {}
-        remaining_tasks = pending_tasks.copy()
-        
-        for period in idle_periods:
-            start_time = period["start_time"]
-            end_time = period["end_time"]
-            available_resources = period["available_resources"]
-            
-            # Skip periods in the past
-            if end_time <= now:
+        # Highest priority first, in insertion order within a priority
+        pending_tasks = [task for bucket in reversed(buckets) for task in bucket]
+        
+        # Count each task's pending dependencies, with a reverse index to
+        # release dependents as tasks complete in the simulation. A
+        # dependency that is not itself pending never completes, so such
+        # tasks never become ready.
+        order_of = {task.task_id: order for order, task in enumerate(pending_tasks)}
+        unmet_dependencies = {}
+        dependents = {}
+        ready = []  # Heap of (priority_score, order, task) for ready tasks
+        
+        for order, task in enumerate(pending_tasks):
+            dependencies = set(task.dependencies)
+            if not all(dep_id in order_of for dep_id in dependencies):
                 continue
                 
-            # Adjust start time if period has already started
-            if start_time < now:
-                start_time = now
+            if dependencies:
+                unmet_dependencies[task.task_id] = len(dependencies)
+                for dep_id in dependencies:
+                    dependents.setdefault(dep_id, []).append(task)
+            else:
+                ready.append((-task.priority, order, task))
                 
-            # Calculate available time
-            available_time = end_time - start_time
-            
+        heapq.heapify(ready)
+        
+        # Resource requirements as tuples in a fixed resource order, so each
+        # feasibility check is one comparison of two tuples. Resources a
+        # task does not need never constrain it, and resources a period does
+        # not list are unlimited.
+        resource_names = sorted({
+            resource for task in pending_tasks for resource in task.estimated_resources
+        })
+        requirements = {
+            task.task_id: tuple(
+                task.estimated_resources.get(resource, float("-inf"))
+                for resource in resource_names
+            )
+            for task in pending_tasks
+        }
+        
+        # Simulate task execution during idle periods, tracking the latest
+        # completion for the estimate of unscheduled tasks
+        completion_times = {}
+        last_completion = now
+        
+        # Drop periods in the past and clip one that has already started,
+        # in a single pass before simulating
+        periods = [
+            (
+                max(period["start_time"], now),
+                period["end_time"],
+                tuple(
+                    period["available_resources"].get(resource, float("inf"))
+                    for resource in resource_names
+                )
+            )
+            for period in idle_periods if period["end_time"] > now
+        ]
+        
+        # Bound once; the loop below runs once per simulated task
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        le = operator.le
+        no_dependents = ()
+        
+        for start_time, end_time, available in periods:
             # Simulate task execution
             current_time = start_time
             
-            while remaining_tasks and current_time < end_time:
-                # Find the next task that can be executed
-                executable_task = None
+            # Ready tasks that do not fit this period's resources; they are
+            # set aside until the next period
+            deferred = []
+            
+            while ready and current_time < end_time:
+                # Take the highest priority ready task that fits
+                entry = heappop(ready)
+                executable_task = entry[2]
+                task_id = executable_task.task_id
                 
-                for i, task in enumerate(remaining_tasks):
-                    # Check if all dependencies are completed
-                    dependencies_met = all(
-                        dep_id in completion_times
-                        for dep_id in task.dependencies
-                    )
-                    
-                    if not dependencies_met:
-                        continue
-                        
-                    # Check if resources are available
-                    can_execute = True
-                    for resource, required in task.estimated_resources.items():
-                        if resource in available_resources and available_resources[resource] < required:
-                            can_execute = False
-                            break
-                            
-                    if can_execute:
-                        executable_task = task
-                        remaining_tasks.pop(i)
-                        break
-                        
-                if not executable_task:
-                    # No tasks can be executed in this period
-                    break
+                if not all(map(le, requirements[task_id], available)):
+                    deferred.append(entry)
+                    continue
                     
                 # Simulate task execution
-                execution_time = min(executable_task.estimated_duration, end_time - current_time)
-                completion_time = current_time + execution_time
+                completion_time = current_time + executable_task.estimated_duration
+                if completion_time > end_time:
+                    completion_time = end_time
                 
                 # Record completion time
-                completion_times[executable_task.task_id] = completion_time
+                completion_times[task_id] = completion_time
+                if completion_time > last_completion:
+                    last_completion = completion_time
+                
+                # Release dependents whose last dependency this was
+                for dependent in dependents.get(task_id, no_dependents):
+                    dependent_id = dependent.task_id
+                    unmet_dependencies[dependent_id] -= 1
+                    if not unmet_dependencies[dependent_id]:
+                        heappush(ready, (-dependent.priority, order_of[dependent_id], dependent))
                 
                 # Update current time
                 current_time = completion_time
                 
+            for entry in deferred:
+                heappush(ready, entry)
+                
         # For tasks that couldn't be scheduled, estimate based on average task duration
+        remaining_tasks = [
+            task for task in pending_tasks if task.task_id not in completion_times
+        ]
         if remaining_tasks:
-            # Calculate average task duration
-            if pending_tasks:
-                avg_duration = sum(task.estimated_duration for task in pending_tasks) / len(pending_tasks)
-            else:
-                avg_duration = 60.0  # Default 1 minute
+            # Average task duration, maintained by the scheduler
+            avg_duration = self.task_scheduler.average_pending_duration()
                 
             # Estimate completion times for remaining tasks
-            last_completion = max(completion_times.values()) if completion_times else now
-            
             for task in remaining_tasks:
                 last_completion += avg_duration
                 completion_times[task.task_id] = last_completion
                 
         return completion_times
     
-    def _worker_loop(self) -> None:
+    def _run_worker(self) -> None:
+        """
+        Run the worker loop on a long-lived event loop for this thread.
+        
+        The loop is created once per start() and reused for every task.
+        """
+        loop = _new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._worker_loop())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+    
+    def _notify_worker(self) -> None:
+        """
+        Wake the worker loop from any thread.
+        
+        Called when something happens that may let a task run: a task is
+        added or finishes, resources are freed, or the optimizer stops.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+            
+        try:
+            loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            # Loop closed while the worker was shutting down
+            pass
+    
+    async def _worker_loop(self) -> None:
         """
         Background worker loop.
         
-        This method runs in a separate thread and monitors system state,
-        executing tasks during idle periods.
+        This coroutine runs on the worker thread's event loop and monitors
+        system state, dispatching tasks during idle periods. Executors run
+        as concurrent asyncio tasks on the same loop.
+        
+        While tasks are ready the loop re-checks the idle state every
+        second, since the system can become idle without any notification.
+        Otherwise it sleeps until woken by _notify_worker.
         """
-        while self.running:
-            try:
-                # Check if system is idle
-                idle_status = self.sleep_detector.check_idle_state()
+        wake = self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        
+        # Bound once; the loop body runs on every tick
+        check_idle_state = self.sleep_detector.check_idle_state
+        dispatch_pending_tasks = self._dispatch_pending_tasks
+        ready_queue = self.task_scheduler.task_queue
+        monotonic = time.monotonic
+        
+        try:
+            while self.running:
+                # Clear before checking, so a notification that arrives
+                # during the check is not lost
+                wake.clear()
                 
-                if idle_status["is_idle"]:
-                    # System is idle, execute tasks
-                    self._execute_pending_tasks()
+                try:
+                    # Check if system is idle, reading the clock once per tick
+                    idle_status = check_idle_state(monotonic())
                     
-                # Sleep for a short time
-                time.sleep(1.0)
+                    if idle_status["is_idle"]:
+                        # System is idle, execute tasks
+                        dispatch_pending_tasks()
+                        
+                    poll_interval = 1.0 if ready_queue else None
+                    try:
+                        await asyncio.wait_for(wake.wait(), poll_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    
+                except Exception as e:
+                    # Log error and continue
+                    print(f"Error in sleep-time optimizer worker: {e}")
+                    await asyncio.sleep(5.0)
+                    
+            # Let tasks that are already executing finish
+            if self._running_jobs:
+                await asyncio.gather(*self._running_jobs, return_exceptions=True)
                 
-            except Exception as e:
-                # Log error and continue
-                print(f"Error in sleep-time optimizer worker: {e}")
-                time.sleep(5.0)
+        finally:
+            self._loop = None
     
-    def _execute_pending_tasks(self) -> None:
+    def _dispatch_pending_tasks(self) -> None:
         """
-        Execute pending tasks.
+        Start executing pending tasks.
         
-        This method executes tasks from the scheduler during idle periods.
+        This method takes ready tasks from the scheduler and runs each one
+        as an asyncio task, up to the concurrency limit. It must be called
+        from a running event loop.
         """
-        # Get the next task to execute
-        task = self.task_scheduler.get_next_task()
+        running_jobs = self._running_jobs
+        get_next_task = self.task_scheduler.get_next_task
         
-        if not task:
-            # No tasks ready to execute
-            return
+        while len(running_jobs) < self.max_concurrent_tasks:
+            # Get the next task to execute
+            task = get_next_task()
             
+            if not task:
+                # No tasks ready to execute
+                return
+                
+            job = asyncio.create_task(self._execute_task(task))
+            running_jobs.add(job)
+            job.add_done_callback(self._job_done)
+    
+    def _job_done(self, job: asyncio.Task) -> None:
+        """
+        Forget a finished execution and wake the worker.
+        
+        A finished task frees a concurrency slot and may unblock dependents.
+        
+        Args:
+            job: Finished asyncio task
+        """
+        self._running_jobs.discard(job)
+        self._wake.set()
+    
+    async def _execute_task(self, task: SleepTimeTask) -> None:
+        """
+        Execute a scheduled task and record the outcome.
+        
+        Args:
+            task: Task returned by the scheduler
+        """
         # Get task executor
         task_type = task.metadata.get("task_type")
-        parameters = task.metadata.get("parameters", {})
         
         executor = self.task_registry.get_executor(task_type)
         if not executor:
@@ -1039,43 +1607,38 @@ class SleepTimeOptimizer:
             return
             
         # Execute task
-        task.status = "running"
-        task.started_at = time.time()
+        task.status = _RUNNING
+        task.started_at = time.monotonic()
         
         try:
-            # Create asyncio event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Execute task
-            result = loop.run_until_complete(executor.execute(task))
+            result = await executor.execute(task)
             
             # Mark task as completed
             self.task_scheduler.mark_task_completed(task.task_id, result)
             
             # Record execution
             self.execution_history.append({
-                "timestamp": time.time(),
+                "timestamp": _to_wall_clock(task.completed_at),
                 "task_id": task.task_id,
                 "task_type": task_type,
-                "status": "completed",
-                "duration": time.time() - task.started_at
+                "status": _COMPLETED,
+                "duration": task.completed_at - task.started_at
             })
             
         except Exception as e:
-            # Mark task as failed
-            self.task_scheduler.mark_task_failed(task.task_id, str(e))
+            # Mark task as failed, reading the clock once for both the task
+            # and its history entry
+            finished_at = time.monotonic()
+            error = str(e)
+            started_at = task.started_at
+            self.task_scheduler.mark_task_failed(task.task_id, error, finished_at)
             
             # Record execution
             self.execution_history.append({
-                "timestamp": time.time(),
+                "timestamp": _to_wall_clock(finished_at),
                 "task_id": task.task_id,
                 "task_type": task_type,
-                "status": "failed",
-                "error": str(e),
-                "duration": time.time() - task.started_at
+                "status": _FAILED,
+                "error": error,
+                "duration": finished_at - started_at
             })
-            
-        finally:
-            # Close event loop
-            loop.close()
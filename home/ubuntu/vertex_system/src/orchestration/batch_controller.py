@@ -11,12 +11,22 @@ from typing import Dict, Any, List, Optional, Union, Type
 import time
 import asyncio
 import importlib
+import itertools
+import threading
+from collections import deque, OrderedDict
 from enum import Enum
 
 # Import Task definition
 from .task_orchestrator import Task
 
 
+# Rule classes by (module_path, class_name), shared across controllers.
+# The lock keeps concurrent first lookups from importing the same module
+# twice.
+_rule_class_cache = {}
+_rule_lock = threading.Lock()
+
+
 class BatchRule(ABC):
     """
     Abstract base class for batch sizing rules.
@@ -86,23 +96,44 @@ class BatchController:
     system state.
     """
     
-    def __init__(self, task_orchestrator=None, resource_optimization=None):
+    def __init__(self,
+                task_orchestrator=None,
+                resource_optimization=None,
+                completed_history_limit: int = 10000,
+                evaluation_cache_size: int = 256,
+                decision_ttl: float = 0.5):
         """
         Initialize batch controller with empty state.
         
         Args:
             task_orchestrator: TaskOrchestrator instance for executing tasks
             resource_optimization: ResourceOptimizationLayer instance for resource management
+            completed_history_limit: Maximum number of finished batches to
+                retain (oldest are evicted first)
+            evaluation_cache_size: Maximum number of cached results for
+                rules registered with {"pure": True} metadata
+            decision_ttl: Seconds for which form_optimal_batch reuses its
+                last batch size for the same queue and system state
         """
         self.task_orchestrator = task_orchestrator
         self.resource_optimization = resource_optimization
-        self.pending_tasks = []
-        self.active_batches = []
-        self.completed_batches = []
+        self.pending_tasks = deque()
+        self.active_batches = {}
+        self.completed_batches = deque(maxlen=completed_history_limit)
         self.rule_registry = {}
         self.rule_metadata = {}
         self.rule_cache = {}
+        self.evaluation_cache_size = evaluation_cache_size
+        self._evaluation_cache = OrderedDict()  # (rule_id, task IDs, state) -> batch size, LRU order
         self.default_config = BatchConfig()
+        self._batch_seq = itertools.count()
+        self.decision_ttl = decision_ttl
+        self._last_decision = (None, 0, 0.0)  # (signature, batch size, expires_at)
+        
+        # Running totals over completed_batches for get_stats
+        self._total_completed_tasks = 0
+        self._total_processing_time = 0.0
+        self._completed_with_times_count = 0
     
     def get_batch_scheduler(self):
         """
@@ -173,23 +204,84 @@ class BatchController:
         if not module_path or not class_name:
             raise ValueError(f"Invalid metadata for rule ID {rule_id}")
         
-        # Load rule implementation dynamically
-        try:
-            # This assumes module_path is importable (e.g., "vertex_system.strategies.batch_rules.memory_rule")
-            module = importlib.import_module(module_path)
-            rule_class = getattr(module, class_name)
+        with _rule_lock:
+            # Another thread may have loaded the rule while we waited
+            cached = self.rule_cache.get(rule_id)
+            if cached is not None:
+                cached["last_accessed"] = time.time()
+                return cached["implementation"]
+            
+            # Load rule class dynamically, importing each module only once
+            class_key = (module_path, class_name)
+            rule_class = _rule_class_cache.get(class_key)
+            if rule_class is None:
+                try:
+                    # This assumes module_path is importable (e.g., "vertex_system.strategies.batch_rules.memory_rule")
+                    module = importlib.import_module(module_path)
+                    rule_class = getattr(module, class_name)
+                except (ImportError, AttributeError) as e:
+                    raise ValueError(f"Failed to load rule {rule_id} from {module_path}.{class_name}: {e}")
+                _rule_class_cache[class_key] = rule_class
+            
             rule_implementation = rule_class() # Instantiate the rule
-        except (ImportError, AttributeError) as e:
-            raise ValueError(f"Failed to load rule {rule_id} from {module_path}.{class_name}: {e}")
-        
-        # Add to cache
-        self.rule_cache[rule_id] = {
-            "implementation": rule_implementation,
-            "last_accessed": time.time()
-        }
+            
+            # Add to cache
+            self.rule_cache[rule_id] = {
+                "implementation": rule_implementation,
+                "last_accessed": time.time()
+            }
         
         return rule_implementation
     
+    def evaluate_rule(self,
+                      rule_id: str,
+                      tasks: List[Task],
+                      system_state: Dict[str, Any]) -> int:
+        """
+        Evaluate a batch rule, reusing earlier results for pure rules.
+        
+        A rule registered with {"pure": True} in its metadata must return
+        the same size for the same tasks and system state, so its results
+        are cached by task IDs and state.
+        
+        Args:
+            rule_id: ID of the rule to apply
+            tasks: Tasks to potentially batch
+            system_state: Current system state
+            
+        Returns:
+            Recommended batch size (number of tasks)
+            
+        Raises:
+            ValueError: If rule not found or cannot be loaded
+        """
+        rule = self.get_rule(rule_id)
+        
+        if not self.rule_metadata[rule_id]["metadata"].get("pure"):
+            return rule.evaluate(tasks, system_state)
+        
+        try:
+            cache_key = (rule_id,
+                         tuple(task.task_id for task in tasks),
+                         frozenset(system_state.items()))
+            hash(cache_key)
+        except TypeError:
+            # Unhashable state values; evaluate without caching
+            return rule.evaluate(tasks, system_state)
+        
+        cache = self._evaluation_cache
+        batch_size = cache.get(cache_key)
+        if batch_size is not None:
+            cache.move_to_end(cache_key)
+            return batch_size
+        
+        batch_size = rule.evaluate(tasks, system_state)
+        cache[cache_key] = batch_size
+        if len(cache) > self.evaluation_cache_size:
+            cache.popitem(last=False)
+        
+        return batch_size
+    
     def form_batch(self, config: Optional[BatchConfig] = None) -> List[Task]:
         """
         Form a batch from pending tasks based on configuration.
@@ -212,8 +304,9 @@ class BatchController:
         if batch_size < config.min_batch_size:
             return []
         
-        batch = self.pending_tasks[:batch_size]
-        self.pending_tasks = self.pending_tasks[batch_size:]
+        # Drain from the head of the queue rather than re-slicing it
+        pop_task = self.pending_tasks.popleft
+        batch = [pop_task() for _ in range(batch_size)]
         
         return batch
     
@@ -233,51 +326,103 @@ class BatchController:
         if not self.pending_tasks:
             return []
         
-        # Apply each rule to get batch size recommendations
-        batch_sizes = []
+        # A queue too small to split needs no rules
+        if len(self.pending_tasks) <= self.default_config.min_batch_size:
+            return self.form_batch()
         
-        for rule_id in rule_ids:
-            try:
-                rule = self.get_rule(rule_id)
-                batch_size = rule.evaluate(self.pending_tasks, system_state)
-                batch_sizes.append(batch_size)
-            except Exception as e:
-                # Log error and continue with other rules
-                print(f"Error applying rule {rule_id}: {e}")
+        # Reuse a fresh decision for the same rules, queue and state
+        signature = self._decision_signature(rule_ids, system_state)
+        now = time.monotonic()
+        last_signature, last_batch_size, expires_at = self._last_decision
         
-        if not batch_sizes:
-            # No valid rules, use default
-            return self.form_batch()
+        if signature is not None and signature == last_signature and now < expires_at:
+            avg_batch_size = last_batch_size
+        else:
+            # Apply each rule to get batch size recommendations; rules take
+            # a list, so they get a snapshot of the queue
+            tasks = list(self.pending_tasks)
+            batch_sizes = []
+            
+            for rule_id in rule_ids:
+                try:
+                    batch_size = self.evaluate_rule(rule_id, tasks, system_state)
+                    batch_sizes.append(batch_size)
+                except Exception as e:
+                    # Log error and continue with other rules
+                    print(f"Error applying rule {rule_id}: {e}")
+            
+            if not batch_sizes:
+                # No valid rules, use default
+                return self.form_batch()
+            
+            # Use average of recommended batch sizes
+            avg_batch_size = int(sum(batch_sizes) / len(batch_sizes))
+            if signature is not None:
+                self._last_decision = (signature, avg_batch_size, now + self.decision_ttl)
         
-        # Use average of recommended batch sizes
-        avg_batch_size = int(sum(batch_sizes) / len(batch_sizes))
         batch_size = min(avg_batch_size, len(self.pending_tasks))
         
-        batch = self.pending_tasks[:batch_size]
-        self.pending_tasks = self.pending_tasks[batch_size:]
+        pop_task = self.pending_tasks.popleft
+        batch = [pop_task() for _ in range(batch_size)]
         
         return batch
     
+    def _decision_signature(self,
+                            rule_ids: List[str],
+                            system_state: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Summarize the inputs of a form_optimal_batch decision.
+        
+        Float state values are rounded to one decimal place, so small
+        fluctuations still match the previous decision.
+        
+        Args:
+            rule_ids: List of rule IDs to apply
+            system_state: Current system state
+            
+        Returns:
+            Hashable signature, or None if the state cannot be hashed
+        """
+        try:
+            state_key = frozenset(
+                (key, round(value, 1) if isinstance(value, float) else value)
+                for key, value in system_state.items()
+            )
+        except TypeError:
+            return None
+        
+        return (tuple(rule_ids), len(self.pending_tasks),
+                self.pending_tasks[0].task_id, state_key)
+    
     async def process_batches(self, 
                             processor_func: callable, 
                             config: Optional[BatchConfig] = None,
                             rule_ids: Optional[List[str]] = None,
-                            system_state: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                            system_state: Optional[Dict[str, Any]] = None,
+                            max_inflight: int = 4) -> List[Dict[str, Any]]:
         """
         Process tasks in batches.
         
+        Up to max_inflight batches are processed concurrently. A new batch is
+        formed only when a slot frees up, so tasks added in the meantime can
+        still join it.
+        
         Args:
             processor_func: Function to process each batch
             config: Optional batch configuration
             rule_ids: Optional list of rule IDs for optimal batching
             system_state: Optional system state for rules
+            max_inflight: Maximum number of batches processed at once
             
         Returns:
-            List of batch processing results
+            List of batch processing results, in batch formation order
         """
-        results = []
+        slots = asyncio.Semaphore(max_inflight)
+        jobs = []
         
         while self.pending_tasks:
+            await slots.acquire()
+            
             # Form batch
             if rule_ids and system_state:
                 batch = self.form_optimal_batch(rule_ids, system_state)
@@ -285,53 +430,100 @@ class BatchController:
                 batch = self.form_batch(config)
             
             if not batch:
+                slots.release()
                 break
             
-            # Process batch
-            batch_id = f"batch_{int(time.time())}_{len(self.active_batches)}"
-            batch_info = {
+            jobs.append(asyncio.create_task(self._process_batch(processor_func, batch, slots)))
+        
+        return list(await asyncio.gather(*jobs))
+    
+    async def _process_batch(self,
+                             processor_func: callable,
+                             batch: List[Task],
+                             slots: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        Process one batch and record it as completed or failed.
+        
+        Args:
+            processor_func: Function to process the batch
+            batch: Tasks forming the batch
+            slots: Semaphore slot held for this batch, released when done
+            
+        Returns:
+            Batch processing result
+        """
+        batch_id = f"batch_{int(time.time())}_{next(self._batch_seq)}"
+        batch_info = {
+            "batch_id": batch_id,
+            "tasks": batch,
+            "start_time": time.time()
+        }
+        
+        self.active_batches[batch_id] = batch_info
+        
+        try:
+            batch_result = await processor_func(batch)
+            
+            # Record completion
+            batch_info["end_time"] = time.time()
+            batch_info["result"] = batch_result
+            batch_info["status"] = "completed"
+            
+            self._finish_batch(batch_info)
+            
+            return {
                 "batch_id": batch_id,
-                "tasks": batch,
-                "start_time": time.time()
+                "task_count": len(batch),
+                "processing_time": batch_info["end_time"] - batch_info["start_time"],
+                "result": batch_result
             }
             
-            self.active_batches.append(batch_info)
+        except Exception as e:
+            # Record failure
+            batch_info["end_time"] = time.time()
+            batch_info["error"] = str(e)
+            batch_info["status"] = "failed"
+            
+            self._finish_batch(batch_info)
+            
+            return {
+                "batch_id": batch_id,
+                "task_count": len(batch),
+                "processing_time": batch_info["end_time"] - batch_info["start_time"],
+                "error": str(e)
+            }
             
-            try:
-                batch_result = await processor_func(batch)
-                
-                # Record completion
-                batch_info["end_time"] = time.time()
-                batch_info["result"] = batch_result
-                batch_info["status"] = "completed"
-                
-                self.completed_batches.append(batch_info)
-                self.active_batches.remove(batch_info)
-                
-                results.append({
-                    "batch_id": batch_id,
-                    "task_count": len(batch),
-                    "processing_time": batch_info["end_time"] - batch_info["start_time"],
-                    "result": batch_result
-                })
-                
-            except Exception as e:
-                # Record failure
-                batch_info["end_time"] = time.time()
-                batch_info["error"] = str(e)
-                batch_info["status"] = "failed"
-                
-                self.completed_batches.append(batch_info)
-                self.active_batches.remove(batch_info)
-                
-                results.append({
-                    "batch_id": batch_id,
-                    "task_count": len(batch),
-                    "processing_time": batch_info["end_time"] - batch_info["start_time"],
-                    "error": str(e)
-                })
-        
-        return results
+        finally:
+            slots.release()
+    
+    def _finish_batch(self, batch_info: Dict[str, Any]) -> None:
+        """
+        Move a batch from the active set to the completed history.
+        
+        Args:
+            batch_info: Batch record with its final status set
+        """
+        del self.active_batches[batch_info["batch_id"]]
+        
+        completed = self.completed_batches
+        if len(completed) == completed.maxlen:
+            # The append below evicts the oldest batch
+            self._update_totals(completed[0], -1)
+        completed.append(batch_info)
+        self._update_totals(batch_info, 1)
+    
+    def _update_totals(self, batch_info: Dict[str, Any], sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a batch from the running totals.
+        
+        Args:
+            batch_info: Finished batch record
+            sign: Direction of the update
+        """
+        self._total_completed_tasks += sign * len(batch_info["tasks"])
+        if "start_time" in batch_info and "end_time" in batch_info:
+            self._total_processing_time += sign * (batch_info["end_time"] - batch_info["start_time"])
+            self._completed_with_times_count += sign
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -351,20 +543,10 @@ class BatchController:
                 "avg_processing_time": 0
             }
         
-        total_tasks = sum(len(batch["tasks"]) for batch in self.completed_batches)
-        avg_batch_size = total_tasks / completed_count
+        avg_batch_size = self._total_completed_tasks / completed_count
         
-        completed_with_times = [
-            batch for batch in self.completed_batches
-            if "start_time" in batch and "end_time" in batch
-        ]
-        
-        if completed_with_times:
-            total_time = sum(
-                batch["end_time"] - batch["start_time"]
-                for batch in completed_with_times
-            )
-            avg_time = total_time / len(completed_with_times)
+        if self._completed_with_times_count:
+            avg_time = self._total_processing_time / self._completed_with_times_count
         else:
             avg_time = 0
         
@@ -6,12 +6,25 @@ task execution, and state management across the system.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, List, Optional, Union, Callable, Iterable, NamedTuple, Tuple
 from enum import Enum
+from dataclasses import dataclass
 import uuid
 import time
 import asyncio
-from datetime import datetime
+import contextlib
+import copy
+import functools
+import graphlib
+import hashlib
+import heapq
+import inspect
+import random
+import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 # Import interfaces
 from ..interfaces.model_provider import ModelProvider, ProviderRegistry, ModelRole, ModelRoleManager
@@ -34,6 +47,81 @@ class TaskPriority(Enum):
     CRITICAL = 3
 
 
+def _ns_to_datetime(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    """Convert a time.time_ns() reading to a local datetime."""
+    if timestamp_ns is None:
+        return None
+    seconds, remainder_ns = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds) + timedelta(microseconds=remainder_ns // 1000)
+
+
+def _datetime_to_ns(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to nanoseconds since the epoch, to the microsecond."""
+    return None if value is None else round(value.timestamp() * 1_000_000) * 1000
+
+
+class TraceEntry(NamedTuple):
+    """A single attempt to execute a task on a model."""
+    ts_ns: int  # time.time_ns() when the attempt finished
+    provider: str
+    model: str
+    execution_time: Optional[float] = None  # Seconds, for successful attempts
+    success: bool = True
+    error: Optional[str] = None
+    cached: bool = False  # Result reused from an identical earlier prompt
+
+
+def _parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp, treating empty values as missing."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _iso_to_ns(value: Optional[str]) -> Optional[int]:
+    """Convert an ISO timestamp to nanoseconds since the epoch."""
+    return _datetime_to_ns(datetime.fromisoformat(value)) if value else None
+
+
+def _trace_entry_to_dict(entry: Union[TraceEntry, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert a stored trace entry to its serialized form."""
+    if not isinstance(entry, TraceEntry):
+        return entry
+    serialized = {
+        "timestamp": _ns_to_datetime(entry.ts_ns).isoformat(),
+        "provider": entry.provider,
+        "model": entry.model
+    }
+    if entry.execution_time is not None:
+        serialized["execution_time"] = entry.execution_time
+    if entry.error is not None:
+        serialized["error"] = entry.error
+    serialized["success"] = entry.success
+    if entry.cached:
+        serialized["cached"] = True
+    return serialized
+
+
+def _trace_entry_from_dict(entry: Dict[str, Any]) -> Union[TraceEntry, Dict[str, Any]]:
+    """Convert a serialized trace entry to its stored form."""
+    if not entry.get("timestamp") or not entry.keys() <= _TRACE_ENTRY_KEYS:
+        return entry
+    return TraceEntry(
+        ts_ns=_iso_to_ns(entry["timestamp"]),
+        provider=sys.intern(entry.get("provider", "")),
+        model=sys.intern(entry.get("model", "")),
+        execution_time=entry.get("execution_time"),
+        success=entry.get("success", True),
+        error=entry.get("error"),
+        cached=entry.get("cached", False)
+    )
+
+
+_TRACE_ENTRY_KEYS = frozenset(("timestamp", "provider", "model", "execution_time", "success",
+                               "error", "cached"))
+
+
+_TERMINAL_STATUSES = frozenset((TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED))
+
+
 class Task:
     """
     Represents a task to be executed by the orchestration engine.
@@ -42,6 +130,14 @@ class Task:
     execution requirements, dependencies, and state.
     """
     
+    __slots__ = (
+        "task_id", "name", "description", "input_data", "priority", "dependencies",
+        "required_capabilities", "max_retries", "timeout_seconds", "idempotent", "status",
+        "created_at_ns", "started_at", "completed_at", "result", "error",
+        "retry_count", "assigned_provider", "assigned_model", "execution_trace",
+        "_unsatisfied_deps", "_cached_dict"
+    )
+    
     def __init__(self, 
                 task_id: Optional[str] = None,
                 name: str = "",
@@ -51,7 +147,8 @@ class Task:
                 dependencies: Optional[List[str]] = None,
                 required_capabilities: Optional[List[str]] = None,
                 max_retries: int = 3,
-                timeout_seconds: Optional[int] = None):
+                timeout_seconds: Optional[int] = None,
+                idempotent: bool = False):
         """
         Initialize a task.
         
@@ -65,6 +162,8 @@ class Task:
             required_capabilities: Capabilities required to execute this task
             max_retries: Maximum number of retry attempts on failure
             timeout_seconds: Maximum execution time in seconds
+            idempotent: Whether the result may be reused for an identical
+                prompt to the same model
         """
         self.task_id = task_id or str(uuid.uuid4())
         self.name = name
@@ -75,10 +174,11 @@ class Task:
         self.required_capabilities = required_capabilities or []
         self.max_retries = max_retries
         self.timeout_seconds = timeout_seconds
+        self.idempotent = idempotent
         
         # Runtime state
         self.status = TaskStatus.PENDING
-        self.created_at = datetime.now()
+        self.created_at_ns = time.time_ns()  # Read through created_at
         self.started_at = None
         self.completed_at = None
         self.result = None
@@ -86,16 +186,42 @@ class Task:
         self.retry_count = 0
         self.assigned_provider = None
         self.assigned_model = None
-        self.execution_trace = []
+        self.execution_trace = []  # TraceEntry per execution attempt
+        
+        # Dependencies not yet completed, kept up to date by TaskOrchestrator
+        self._unsatisfied_deps = len(self.dependencies)
+        
+        # (state key, dictionary) from to_dict for a task in a terminal state
+        self._cached_dict = None
+    
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """Creation time as a local datetime."""
+        return _ns_to_datetime(self.created_at_ns)
+    
+    @created_at.setter
+    def created_at(self, value: Optional[datetime]) -> None:
+        self.created_at_ns = _datetime_to_ns(value)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert task to dictionary representation.
         
+        The dictionary of a completed, failed or cancelled task is cached
+        until the task is run again, so it must not be modified.
+        
         Returns:
             Dictionary containing all task data
         """
-        return {
+        terminal = self.status in _TERMINAL_STATUSES
+        if terminal:
+            key = (self.status, self.completed_at, self.error, self.retry_count,
+                   len(self.execution_trace))
+            if self._cached_dict is not None and self._cached_dict[0] == key:
+                return self._cached_dict[1]
+        
+        created_at = self.created_at
+        data = {
             "task_id": self.task_id,
             "name": self.name,
             "description": self.description,
@@ -105,8 +231,9 @@ class Task:
             "required_capabilities": self.required_capabilities,
             "max_retries": self.max_retries,
             "timeout_seconds": self.timeout_seconds,
+            "idempotent": self.idempotent,
             "status": self.status.value,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "result": self.result,
@@ -114,8 +241,10 @@ class Task:
             "retry_count": self.retry_count,
             "assigned_provider": self.assigned_provider,
             "assigned_model": self.assigned_model,
-            "execution_trace": self.execution_trace
+            "execution_trace": [_trace_entry_to_dict(entry) for entry in self.execution_trace]
         }
+        self._cached_dict = (key, data) if terminal else None
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
@@ -128,33 +257,71 @@ class Task:
         Returns:
             Task instance
         """
-        task = cls(
-            task_id=data.get("task_id"),
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            input_data=data.get("input_data", {}),
-            priority=TaskPriority(data.get("priority", 1)),
-            dependencies=data.get("dependencies", []),
-            required_capabilities=data.get("required_capabilities", []),
-            max_retries=data.get("max_retries", 3),
-            timeout_seconds=data.get("timeout_seconds")
-        )
+        # Fill the slots directly rather than through __init__, which would
+        # generate an ID and timestamp only for them to be overwritten
+        get = data.get
+        task = cls.__new__(cls)
+        task.task_id = get("task_id") or str(uuid.uuid4())
+        task.name = get("name", "")
+        task.description = get("description", "")
+        task.input_data = get("input_data") or {}
+        task.priority = TaskPriority(get("priority", 1))
+        task.dependencies = get("dependencies") or []
+        task.required_capabilities = get("required_capabilities") or []
+        task.max_retries = get("max_retries", 3)
+        task.timeout_seconds = get("timeout_seconds")
+        task.idempotent = get("idempotent", False)
         
         # Set runtime state
-        task.status = TaskStatus(data.get("status", "pending"))
-        task.created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
-        task.started_at = datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None
-        task.completed_at = datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None
-        task.result = data.get("result")
-        task.error = data.get("error")
-        task.retry_count = data.get("retry_count", 0)
-        task.assigned_provider = data.get("assigned_provider")
-        task.assigned_model = data.get("assigned_model")
-        task.execution_trace = data.get("execution_trace", [])
+        task.status = TaskStatus(get("status", "pending"))
+        task.created_at_ns = _iso_to_ns(get("created_at"))
+        task.started_at = _parse_iso(get("started_at"))
+        task.completed_at = _parse_iso(get("completed_at"))
+        task.result = get("result")
+        task.error = get("error")
+        task.retry_count = get("retry_count", 0)
+        task.assigned_provider = get("assigned_provider")
+        task.assigned_model = get("assigned_model")
+        task.execution_trace = [_trace_entry_from_dict(entry) for entry in get("execution_trace", [])]
+        task._unsatisfied_deps = len(task.dependencies)
+        task._cached_dict = None
         
         return task
 
 
+# Description keywords in order of precedence, matched anywhere in the text
+_ROLE_KEYWORDS = (
+    ("analyze", ModelRole.ANALYZER),
+    ("generate", ModelRole.GENERATOR),
+    ("validate", ModelRole.VALIDATOR),
+    ("optimize", ModelRole.OPTIMIZER),
+)
+_ROLE_PATTERN = re.compile("|".join(keyword for keyword, _ in _ROLE_KEYWORDS), re.IGNORECASE)
+_ROLE_RANKS = {keyword: rank for rank, (keyword, _) in enumerate(_ROLE_KEYWORDS)}
+
+
+@functools.lru_cache(maxsize=4096)
+def _role_for_description(description: str) -> ModelRole:
+    """
+    Pick the model role for a task description in a single scan.
+    
+    Args:
+        description: Task description
+        
+    Returns:
+        Role of the highest-precedence keyword present, or EXECUTOR
+    """
+    best = len(_ROLE_KEYWORDS)
+    for match in _ROLE_PATTERN.finditer(description):
+        rank = _ROLE_RANKS[match.group().lower()]
+        if rank < best:
+            best = rank
+            if not rank:
+                break
+                
+    return _ROLE_KEYWORDS[best][1] if best < len(_ROLE_KEYWORDS) else ModelRole.EXECUTOR
+
+
 class TaskExecutor(ABC):
     """
     Abstract base class for task executors.
@@ -190,16 +357,43 @@ class ModelTaskExecutor(TaskExecutor):
     
     def __init__(self, 
                 provider_registry: ProviderRegistry,
-                role_manager: ModelRoleManager):
+                role_manager: ModelRoleManager,
+                provider_concurrency: Optional[Dict[str, int]] = None,
+                max_prompt_batch_size: int = 8,
+                prompt_batch_linger: float = 0.01,
+                role_cache_ttl: float = 1.0,
+                result_cache_size: int = 1024,
+                prompt_workers: int = 32):
         """
         Initialize the model task executor.
         
         Args:
             provider_registry: Registry of available model providers
             role_manager: Manager for model role assignments
+            provider_concurrency: Optional per-provider limits on concurrent
+                prompt executions, keyed by provider ID
+            max_prompt_batch_size: Maximum number of prompts sent in one
+                call to providers that support batching
+            prompt_batch_linger: Seconds to wait for more prompts before
+                sending a partial batch
+            role_cache_ttl: Seconds to reuse the best model chosen for a role
+            result_cache_size: Maximum number of idempotent task results kept
+                for reuse
+            prompt_workers: Maximum number of threads running synchronous
+                providers' prompts
         """
         self.provider_registry = provider_registry
         self.role_manager = role_manager
+        self.provider_concurrency = provider_concurrency or {}
+        self._limits = _LoopLocalSemaphores()
+        self._batcher = _PromptBatcher(max_prompt_batch_size, prompt_batch_linger,
+                                       self._get_prompt_pool)
+        self.role_cache_ttl = role_cache_ttl
+        self._role_cache = {}  # role -> (expires_at, registry generation, provider_id, model_id)
+        self.result_cache_size = result_cache_size
+        self._result_cache = OrderedDict()  # Prompt digest -> result, least recent first
+        self.prompt_workers = prompt_workers
+        self._prompt_pool = None  # Created on first synchronous prompt
     
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """
@@ -218,9 +412,7 @@ class ModelTaskExecutor(TaskExecutor):
         role = self._determine_role_for_task(task)
         
         # Get best model for the role
-        model_info = self.role_manager.get_best_model_for_role(role)
-        provider_id = model_info["provider_id"]
-        model_id = model_info["model_id"]
+        provider_id, model_id = self._get_model_for_role(role)
         
         # Get provider
         provider = self.provider_registry.get_provider(provider_id)
@@ -232,37 +424,102 @@ class ModelTaskExecutor(TaskExecutor):
         # Prepare prompt from task
         prompt = self._prepare_prompt_for_task(task)
         
-        # Execute prompt
+        # Reuse the result of an identical idempotent prompt
+        cache_key = None
+        if task.idempotent and self.result_cache_size > 0:
+            cache_key = hashlib.blake2b(f"{provider_id}|{model_id}|{prompt}".encode(),
+                                        digest_size=16).digest()
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                task.execution_trace.append(TraceEntry(time.time_ns(), provider_id, model_id,
+                                                       execution_time=0.0, cached=True))
+                return copy.deepcopy(cached)
+        
+        # Execute prompt, within the provider's concurrency limit if it has one
+        limit = self.provider_concurrency.get(provider_id)
+        slot = self._limits.get(provider_id, limit) if limit else contextlib.nullcontext()
+        
         try:
-            start_time = time.time()
-            response = provider.execute_prompt(model_id, prompt)
-            end_time = time.time()
+            async with slot:
+                start_ns = time.time_ns()
+                if hasattr(provider, "execute_prompt_batch"):
+                    # Share a call with other tasks for the same model
+                    response = await self._batcher.submit(provider, provider_id, model_id, prompt)
+                elif getattr(provider, "is_async", False) or inspect.iscoroutinefunction(provider.execute_prompt):
+                    response = provider.execute_prompt(model_id, prompt)
+                    if inspect.isawaitable(response):
+                        response = await response
+                else:
+                    # Run blocking providers in a thread so other tasks keep going
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        self._get_prompt_pool(), provider.execute_prompt, model_id, prompt)
+                end_ns = time.time_ns()
             
-            # Record execution trace
-            task.execution_trace.append({
-                "timestamp": datetime.now().isoformat(),
-                "provider": provider_id,
-                "model": model_id,
-                "execution_time": end_time - start_time,
-                "success": True
-            })
+            # Record execution trace; timestamps are formatted by to_dict
+            task.execution_trace.append(TraceEntry(end_ns, provider_id, model_id,
+                                                   execution_time=(end_ns - start_ns) / 1e9))
             
             # Parse and return result
-            return self._parse_response(response)
+            result = self._parse_response(response)
+            if cache_key is not None:
+                self._result_cache[cache_key] = copy.deepcopy(result)
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
+            return result
         
         except Exception as e:
             # Record execution trace
-            task.execution_trace.append({
-                "timestamp": datetime.now().isoformat(),
-                "provider": provider_id,
-                "model": model_id,
-                "error": str(e),
-                "success": False
-            })
+            task.execution_trace.append(TraceEntry(time.time_ns(), provider_id, model_id,
+                                                   success=False, error=str(e)))
             
             # Re-raise exception
             raise
     
+    def _get_prompt_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool for synchronous providers, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor instance
+        """
+        if self._prompt_pool is None:
+            self._prompt_pool = ThreadPoolExecutor(max_workers=self.prompt_workers,
+                                                   thread_name_prefix="prompt")
+        return self._prompt_pool
+    
+    def _get_model_for_role(self, role: ModelRole, now: Optional[float] = None) -> Tuple[str, str]:
+        """
+        Get the best model for a role, reusing recent choices.
+        
+        A choice is reused for role_cache_ttl seconds, or until a provider
+        is registered or removed.
+        
+        Args:
+            role: The role to find a model for
+            now: Current time.monotonic() reading (read if not provided)
+            
+        Returns:
+            Tuple of (provider_id, model_id)
+            
+        Raises:
+            ValueError: If no models are available for the role
+        """
+        if now is None:
+            now = time.monotonic()
+        generation = self.provider_registry.generation
+        
+        cached = self._role_cache.get(role)
+        if cached is not None and now < cached[0] and cached[1] == generation:
+            return cached[2], cached[3]
+        
+        model_info = self.role_manager.get_best_model_for_role(role)
+        # Interned since every trace entry repeats them
+        provider_id = sys.intern(model_info["provider_id"])
+        model_id = sys.intern(model_info["model_id"])
+        self._role_cache[role] = (now + self.role_cache_ttl, generation, provider_id, model_id)
+        return provider_id, model_id
+    
     def _determine_role_for_task(self, task: Task) -> ModelRole:
         """
         Determine the appropriate model role for a task.
@@ -275,16 +532,7 @@ class ModelTaskExecutor(TaskExecutor):
         """
         # Simple mapping based on task description for now
         # In a real implementation, this would use more sophisticated analysis
-        if "analyze" in task.description.lower():
-            return ModelRole.ANALYZER
-        elif "generate" in task.description.lower():
-            return ModelRole.GENERATOR
-        elif "validate" in task.description.lower():
-            return ModelRole.VALIDATOR
-        elif "optimize" in task.description.lower():
-            return ModelRole.OPTIMIZER
-        else:
-            return ModelRole.EXECUTOR
+        return _role_for_description(task.description)
     
     def _prepare_prompt_for_task(self, task: Task) -> str:
         """
@@ -331,6 +579,34 @@ class ModelTaskExecutor(TaskExecutor):
         }
 
 
+@dataclass
+class WorkflowGraph:
+    """
+    Dependency graph of a workflow, precomputed when the workflow is created.
+    
+    Attributes:
+        task_ids: IDs of the tasks in the workflow, in workflow order
+        dependents: Mapping of task ID to IDs of workflow tasks that depend on it
+        dependency_counts: Mapping of task ID to its number of dependencies
+            within the workflow
+        initial_ready: IDs of tasks with no dependencies within the workflow
+        transitive_dependents: Mapping of task ID to its number of direct and
+            indirect dependents
+        positions: Mapping of task ID to its index in the workflow
+        cycle: Task IDs forming a dependency cycle, or None if there is none
+        fully_parallel: Whether no task has any dependencies, in which case
+            only task_ids and initial_ready are filled in
+    """
+    task_ids: List[str]
+    dependents: Dict[str, List[str]]
+    dependency_counts: Dict[str, int]
+    initial_ready: List[str]
+    transitive_dependents: Dict[str, int]
+    positions: Dict[str, int]
+    cycle: Optional[List[str]] = None
+    fully_parallel: bool = False
+
+
 class TaskOrchestrator:
     """
     Orchestrates task execution across the system.
@@ -340,26 +616,56 @@ class TaskOrchestrator:
     
     def __init__(self, 
                 provider_registry: ProviderRegistry = None, 
-                resource_optimization = None):
+                resource_optimization = None,
+                max_concurrency: int = 16,
+                provider_concurrency: Optional[Dict[str, int]] = None,
+                retry_base_delay: float = 0.1,
+                retry_max_delay: float = 10.0,
+                retry_budget_capacity: int = 20,
+                retry_budget_rate: float = 10.0):
         """
         Initialize the task orchestrator.
         
         Args:
             provider_registry: ProviderRegistry instance for model access
             resource_optimization: ResourceOptimizationLayer instance for resource management
+            max_concurrency: Maximum number of tasks executing at once
+            provider_concurrency: Optional per-provider limits on concurrent
+                prompt executions, keyed by provider ID
+            retry_base_delay: Upper bound on the random delay before a task's
+                first retry in seconds, doubled for each further retry
+            retry_max_delay: Maximum delay between retries in seconds
+            retry_budget_capacity: Number of retries each provider allows in
+                a burst
+            retry_budget_rate: Retries per second each provider allows once
+                its burst is used up
         """
         self.provider_registry = provider_registry
         self.resource_optimization = resource_optimization
+        self.max_concurrency = max_concurrency
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_budget_capacity = retry_budget_capacity
+        self.retry_budget_rate = retry_budget_rate
+        self._retry_budgets = {}  # provider_id -> _RetryBudget
         
         # Create a default executor if needed
         if provider_registry:
             role_manager = ModelRoleManager(provider_registry)
-            self.executor = ModelTaskExecutor(provider_registry, role_manager)
+            self.executor = ModelTaskExecutor(provider_registry, role_manager,
+                                              provider_concurrency)
         else:
             self.executor = None
             
         self.tasks = {}  # task_id -> Task
-        self.workflows = {}  # workflow_id -> List[task_id]
+        self.workflows = {}  # workflow_id -> WorkflowGraph
+        self._task_workflows = {}  # task_id -> IDs of workflows containing it
+        self._stale_workflows = set()  # Workflows whose graph must be rebuilt
+        self._dependents_of = {}  # task_id -> IDs of tasks depending on it
+        self._finished_events = {}  # task_id -> [Event set when the task finishes, waiter count]
+        
+        # Created on first use, since a semaphore belongs to one event loop
+        self._limits = _LoopLocalSemaphores()
     
     def get_cost_selector(self):
         """
@@ -381,9 +687,67 @@ class TaskOrchestrator:
         Returns:
             Task ID
         """
-        self.tasks[task.task_id] = task
+        task_id = task.task_id
+        previous = self.tasks.get(task_id)
+        self.tasks[task_id] = task
+        
+        # Track which dependencies are still to complete
+        if previous is not None:
+            for dep_id in previous.dependencies:
+                self._dependents_of.get(dep_id, set()).discard(task_id)
+        dependencies = dict.fromkeys(task.dependencies)
+        for dep_id in dependencies:
+            self._dependents_of.setdefault(dep_id, set()).add(task_id)
+        task._unsatisfied_deps = sum(1 for dep_id in dependencies if not self._is_completed(dep_id))
+        
+        was_completed = previous is not None and previous.status == TaskStatus.COMPLETED
+        if was_completed != (task.status == TaskStatus.COMPLETED):
+            self._update_dependents(task_id, 1 if was_completed else -1)
+        
+        # Replacing a workflow's task may change its dependencies
+        self._stale_workflows.update(self._task_workflows.get(task.task_id, ()))
         return task.task_id
     
+    def _is_completed(self, task_id: str) -> bool:
+        """
+        Check whether a task exists and has completed.
+        
+        Args:
+            task_id: ID of the task to check
+            
+        Returns:
+            True if the task has completed, False otherwise
+        """
+        task = self.tasks.get(task_id)
+        return task is not None and task.status == TaskStatus.COMPLETED
+    
+    def _update_dependents(self, task_id: str, delta: int) -> None:
+        """
+        Adjust the unsatisfied dependency counts of a task's dependents.
+        
+        Args:
+            task_id: ID of the task that completed or stopped being completed
+            delta: -1 when it completed, 1 when it stopped being completed
+        """
+        for dependent_id in self._dependents_of.get(task_id, ()):
+            dependent = self.tasks.get(dependent_id)
+            if dependent is not None:
+                dependent._unsatisfied_deps += delta
+    
+    def _set_status(self, task: Task, status: TaskStatus) -> None:
+        """
+        Change a registered task's status, keeping its dependents' counts
+        in step when it becomes or stops being completed.
+        
+        Args:
+            task: The task to update
+            status: The new status
+        """
+        was_completed = task.status == TaskStatus.COMPLETED
+        task.status = status
+        if was_completed != (status == TaskStatus.COMPLETED):
+            self._update_dependents(task.task_id, 1 if was_completed else -1)
+    
     def get_task(self, task_id: str) -> Optional[Task]:
         """
         Get a task by ID.
@@ -414,11 +778,71 @@ class TaskOrchestrator:
             self.add_task(task)
             task_ids.append(task.task_id)
         
-        # Store workflow
-        self.workflows[workflow_id] = task_ids
+        # Store workflow along with its dependency graph
+        self.workflows[workflow_id] = self._build_workflow_graph(task_ids)
+        for task_id in task_ids:
+            self._task_workflows.setdefault(task_id, []).append(workflow_id)
         
         return workflow_id
     
+    def _get_workflow_graph(self, workflow_id: str) -> Optional['WorkflowGraph']:
+        """
+        Get a workflow's dependency graph, rebuilding it if any of its tasks were replaced.
+        
+        Args:
+            workflow_id: ID of the workflow
+            
+        Returns:
+            WorkflowGraph instance or None if not found
+        """
+        graph = self.workflows.get(workflow_id)
+        if graph is not None and workflow_id in self._stale_workflows:
+            graph = self._build_workflow_graph(graph.task_ids)
+            self.workflows[workflow_id] = graph
+            self._stale_workflows.discard(workflow_id)
+        return graph
+    
+    def _build_workflow_graph(self, task_ids: List[str]) -> 'WorkflowGraph':
+        """
+        Build the dependency graph of a workflow.
+        
+        Only dependencies within the workflow are part of the graph;
+        dependencies outside it are checked by execute_task.
+        
+        Args:
+            task_ids: IDs of the tasks in the workflow
+            
+        Returns:
+            WorkflowGraph instance
+        """
+        workflow_tasks = dict.fromkeys(task_ids)
+        if not any(self.get_task(task_id).dependencies for task_id in workflow_tasks):
+            return WorkflowGraph(task_ids, {}, {}, list(workflow_tasks), {}, {},
+                                 fully_parallel=True)
+        
+        predecessors = {}
+        dependents = {task_id: [] for task_id in workflow_tasks}
+        for task_id in workflow_tasks:
+            task = self.get_task(task_id)
+            predecessors[task_id] = [dep_id for dep_id in dict.fromkeys(task.dependencies)
+                                     if dep_id in workflow_tasks]
+            for dep_id in predecessors[task_id]:
+                dependents[dep_id].append(task_id)
+        
+        try:
+            order = list(graphlib.TopologicalSorter(predecessors).static_order())
+        except graphlib.CycleError as e:
+            return WorkflowGraph(task_ids, {}, {}, [], {}, {}, cycle=e.args[1])
+        
+        return WorkflowGraph(
+            task_ids=task_ids,
+            dependents=dependents,
+            dependency_counts={task_id: len(deps) for task_id, deps in predecessors.items()},
+            initial_ready=[task_id for task_id, deps in predecessors.items() if not deps],
+            transitive_dependents=_count_transitive_dependents(order, dependents),
+            positions={task_id: index for index, task_id in enumerate(workflow_tasks)}
+        )
+    
     async def execute_task(self, task_id: str) -> Dict[str, Any]:
         """
         Execute a single task.
@@ -437,40 +861,131 @@ class TaskOrchestrator:
         if not task:
             raise ValueError(f"Task not found: {task_id}")
         
-        # Check dependencies
-        for dep_id in task.dependencies:
-            dep_task = self.get_task(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
-                raise ValueError(f"Dependency not satisfied: {dep_id}")
+        # Check dependencies; the count misses status changes made outside
+        # the orchestrator, so recheck each one before refusing to run
+        if task._unsatisfied_deps > 0:
+            for dep_id in task.dependencies:
+                if not self._is_completed(dep_id):
+                    raise ValueError(f"Dependency not satisfied: {dep_id}")
+            task._unsatisfied_deps = 0
         
         # Update task status
-        task.status = TaskStatus.RUNNING
+        self._set_status(task, TaskStatus.RUNNING)
         task.started_at = datetime.now()
         
+        while True:
+            try:
+                # Execute task, at most max_concurrency at a time
+                async with self._limits.get(None, self.max_concurrency):
+                    result = await self._execute_with_timeout(task)
+                break
+            
+            except Exception as e:
+                # Handle retry logic
+                task.retry_count += 1
+                task.error = str(e)
+                
+                if task.retry_count >= task.max_retries:
+                    # Mark as failed
+                    self._set_status(task, TaskStatus.FAILED)
+                    task.completed_at = datetime.now()
+                    self._notify_finished(task_id)
+                    raise
+                
+                # Wait for the provider's retry budget, so a failing provider
+                # is not flooded, then back off exponentially with full jitter
+                # so failed tasks don't retry in lockstep
+                budget = self._retry_budgets.get(task.assigned_provider)
+                if budget is None:
+                    budget = _RetryBudget(self.retry_budget_capacity, self.retry_budget_rate)
+                    self._retry_budgets[task.assigned_provider] = budget
+                await budget.acquire()
+                await asyncio.sleep(random.uniform(0, min(self.retry_base_delay * 2 ** (task.retry_count - 1),
+                                                          self.retry_max_delay)))
+        
+        # Update task status
+        self._set_status(task, TaskStatus.COMPLETED)
+        task.completed_at = datetime.now()
+        task.result = result
+        self._notify_finished(task_id)
+        
+        return result
+    
+    def _notify_finished(self, task_id: str) -> None:
+        """
+        Wake callers waiting for a task to finish.
+        
+        Args:
+            task_id: ID of the task that finished
+        """
+        entry = self._finished_events.pop(task_id, None)
+        if entry is not None:
+            entry[0].set()
+    
+    async def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> Optional[Task]:
+        """
+        Wait until a task has completed, failed or been cancelled.
+        
+        Status changes made outside the orchestrator are only seen once
+        the timeout expires.
+        
+        Args:
+            task_id: ID of the task to wait for
+            timeout: Maximum time to wait in seconds, or None to wait
+                indefinitely
+            
+        Returns:
+            Task instance, finished unless the timeout expired, or None if
+            not found
+        """
+        task = self.get_task(task_id)
+        if task is None or task.status in _TERMINAL_STATUSES:
+            return task
+        
+        entry = self._finished_events.get(task_id)
+        if entry is None:
+            entry = self._finished_events[task_id] = [asyncio.Event(), 0]
+        entry[1] += 1
+        
         try:
-            # Execute task
-            result = await self.executor.execute_task(task)
+            await asyncio.wait_for(entry[0].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # Drop the event once its last waiter gives up, so tasks that
+            # never finish do not keep one
+            entry[1] -= 1
+            if not entry[1] and self._finished_events.get(task_id) is entry:
+                del self._finished_events[task_id]
+        
+        return self.get_task(task_id)
+    
+    async def _execute_with_timeout(self, task: Task) -> Dict[str, Any]:
+        """
+        Run a task on the executor, within its timeout if it has one.
+        
+        Args:
+            task: The task to execute
             
-            # Update task status
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.now()
-            task.result = result
+        Returns:
+            Task execution result
             
-            return result
+        Raises:
+            asyncio.TimeoutError: If the task runs longer than its timeout
+            Exception: If task execution fails
+        """
+        if not task.timeout_seconds:
+            return await self.executor.execute_task(task)
         
-        except Exception as e:
-            # Handle retry logic
-            task.retry_count += 1
-            task.error = str(e)
-            
-            if task.retry_count < task.max_retries:
-                # Retry task
-                return await self.execute_task(task_id)
-            else:
-                # Mark as failed
-                task.status = TaskStatus.FAILED
-                task.completed_at = datetime.now()
-                raise
+        try:
+            return await asyncio.wait_for(self.executor.execute_task(task), task.timeout_seconds)
+        except asyncio.TimeoutError:
+            # The executor was cancelled before it could record the attempt
+            message = f"Task timed out after {task.timeout_seconds} seconds"
+            task.execution_trace.append(TraceEntry(time.time_ns(), task.assigned_provider or "",
+                                                   task.assigned_model or "",
+                                                   success=False, error=message))
+            raise asyncio.TimeoutError(message) from None
     
     async def execute_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """
@@ -483,83 +998,122 @@ class TaskOrchestrator:
             Dictionary mapping task IDs to results
             
         Raises:
-            ValueError: If workflow not found
+            ValueError: If workflow not found or its dependencies form a cycle
         """
-        task_ids = self.workflows.get(workflow_id)
-        if not task_ids:
+        graph = self._get_workflow_graph(workflow_id)
+        if not graph or not graph.task_ids:
             raise ValueError(f"Workflow not found: {workflow_id}")
+        if graph.cycle is not None:
+            raise ValueError(f"Workflow {workflow_id} has a dependency cycle: {graph.cycle}")
+        if graph.fully_parallel:
+            return await self._execute_independent_tasks(graph.initial_ready)
         
-        # Build dependency graph
-        graph = {}
-        for task_id in task_ids:
+        # Among ready tasks, run higher priority first, then those that
+        # unblock the most downstream work, then in workflow order
+        fan_out = graph.transitive_dependents
+        position = graph.positions
+        ready = []  # Heap of (-priority, -fan_out, position, task_id)
+        
+        def push_ready(task_id):
             task = self.get_task(task_id)
-            graph[task_id] = {
-                "task": task,
-                "dependencies": task.dependencies,
-                "dependents": []
-            }
+            heapq.heappush(ready, (-task.priority.value, -fan_out[task_id],
+                                   position[task_id], task_id))
         
-        # Populate dependents
-        for task_id, node in graph.items():
-            for dep_id in node["dependencies"]:
-                if dep_id in graph:
-                    graph[dep_id]["dependents"].append(task_id)
-        
-        # Find tasks with no dependencies
-        ready_tasks = [
-            task_id for task_id, node in graph.items()
-            if not node["dependencies"] or all(
-                dep_id not in graph for dep_id in node["dependencies"]
-            )
-        ]
-        
-        # Execute tasks in dependency order
+        # Count each task's unfinished dependencies within the workflow
+        remaining = dict(graph.dependency_counts)
+        
+        def finish(task_id):
+            for dependent_id in graph.dependents[task_id]:
+                remaining[dependent_id] -= 1
+                if not remaining[dependent_id]:
+                    push_ready(dependent_id)
+        
+        for task_id in graph.initial_ready:
+            push_ready(task_id)
+        
+        # Execute tasks in dependency order, starting each one as soon as its
+        # dependencies have finished rather than waiting for a whole layer
         results = {}
-        while ready_tasks:
-            # Execute ready tasks in parallel
-            current_tasks = ready_tasks.copy()
-            ready_tasks = []
-            
-            # Create execution tasks
-            execution_tasks = [
-                self.execute_task(task_id) for task_id in current_tasks
-            ]
-            
-            # Wait for all tasks to complete
-            task_results = await asyncio.gather(
-                *execution_tasks, return_exceptions=True
-            )
-            
-            # Process results
-            for task_id, result in zip(current_tasks, task_results):
-                if isinstance(result, Exception):
-                    # Task failed
-                    results[task_id] = {"error": str(result)}
+        failed = set()  # Tasks that raised
+        blocked = set()  # Tasks skipped because a dependency did not complete
+        running = {}  # asyncio.Task -> task_id
+        
+        try:
+            while ready or running:
+                # Start ready tasks up to the concurrency limit; the rest
+                # stay queued in priority order
+                while ready and len(running) < self.max_concurrency:
+                    task_id = heapq.heappop(ready)[-1]
+                    task = self.get_task(task_id)
+                    failed_deps = [dep_id for dep_id in task.dependencies if dep_id in failed]
                     
-                    # Mark dependents as failed
-                    for dependent_id in graph[task_id]["dependents"]:
-                        dependent_task = self.get_task(dependent_id)
-                        dependent_task.status = TaskStatus.FAILED
-                        dependent_task.error = f"Dependency failed: {task_id}"
-                else:
-                    # Task succeeded
-                    results[task_id] = result
+                    if failed_deps:
+                        # Mark dependents of failed tasks as failed
+                        self._set_status(task, TaskStatus.FAILED)
+                        task.error = f"Dependency failed: {failed_deps[-1]}"
+                        self._notify_finished(task_id)
+                        blocked.add(task_id)
+                        finish(task_id)
+                    elif any(dep_id in blocked for dep_id in task.dependencies):
+                        blocked.add(task_id)
+                        finish(task_id)
+                    else:
+                        running[asyncio.create_task(self.execute_task(task_id))] = task_id
+                
+                if not running:
+                    # Nothing left to run or wait for
+                    continue
+                
+                # Wait for the next task to finish
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                
+                # Process results
+                for job in done:
+                    task_id = running.pop(job)
+                    error = job.exception()
                     
-                    # Check if dependents are ready
-                    for dependent_id in graph[task_id]["dependents"]:
-                        dependent_node = graph[dependent_id]
-                        dependent_task = dependent_node["task"]
+                    if error is not None:
+                        # Task failed
+                        results[task_id] = {"error": str(error)}
+                        failed.add(task_id)
+                    else:
+                        # Task succeeded
+                        results[task_id] = job.result()
                         
-                        # Check if all dependencies are satisfied
-                        if all(
-                            dep_id in results
-                            for dep_id in dependent_task.dependencies
-                            if dep_id in graph
-                        ):
-                            ready_tasks.append(dependent_id)
+                    finish(task_id)
+        finally:
+            # Don't leave tasks running if the workflow itself is cancelled
+            for job in running:
+                job.cancel()
         
         return results
     
+    async def _execute_independent_tasks(self, task_ids: List[str]) -> Dict[str, Any]:
+        """
+        Execute tasks that have no dependencies, without building a schedule.
+        
+        Args:
+            task_ids: IDs of the tasks to execute
+            
+        Returns:
+            Dictionary mapping task IDs to results
+        """
+        # Higher priority first, then in workflow order
+        queue = iter(sorted(task_ids, key=lambda task_id: -self.get_task(task_id).priority.value))
+        results = {}
+        
+        async def worker():
+            for task_id in queue:
+                try:
+                    results[task_id] = await self.execute_task(task_id)
+                except Exception as e:
+                    results[task_id] = {"error": str(e)}
+        
+        # Workers share the queue, so at most max_concurrency tasks run at once
+        # and the rest stay pending until a worker takes them
+        await asyncio.gather(*(worker() for _ in range(min(self.max_concurrency, len(task_ids)))))
+        return results
+    
     def cancel_task(self, task_id: str) -> bool:
         """
         Cancel a task.
@@ -575,7 +1129,8 @@ class TaskOrchestrator:
             return False
         
         if task.status in [TaskStatus.PENDING, TaskStatus.RUNNING]:
-            task.status = TaskStatus.CANCELLED
+            self._set_status(task, TaskStatus.CANCELLED)
+            self._notify_finished(task_id)
             return True
         
         return False
@@ -593,13 +1148,216 @@ class TaskOrchestrator:
         Raises:
             ValueError: If workflow not found
         """
-        task_ids = self.workflows.get(workflow_id)
-        if not task_ids:
+        graph = self.workflows.get(workflow_id)
+        if not graph or not graph.task_ids:
             raise ValueError(f"Workflow not found: {workflow_id}")
         
         cancelled_tasks = []
-        for task_id in task_ids:
+        for task_id in graph.task_ids:
             if self.cancel_task(task_id):
                 cancelled_tasks.append(task_id)
         
         return cancelled_tasks
+
+
+class _LoopLocalSemaphores:
+    """
+    Semaphores keyed by name, recreated for each event loop.
+    
+    An asyncio semaphore is bound to the loop it is first used on, while an
+    orchestrator may be driven by several loops in turn.
+    """
+    
+    def __init__(self):
+        """Initialize with no semaphores."""
+        self._loop = None
+        self._semaphores = {}
+    
+    def get(self, key: Optional[str], limit: int) -> asyncio.Semaphore:
+        """
+        Get the semaphore for a key on the running loop, creating it if needed.
+        
+        Args:
+            key: Name of the limit (e.g. a provider ID)
+            limit: Number of concurrent holders for a new semaphore
+            
+        Returns:
+            asyncio.Semaphore instance
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphores = {}
+            
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(limit)
+        return semaphore
+
+
+class _RetryBudget:
+    """
+    Token bucket limiting how often tasks on one provider are retried.
+    
+    Callers that find the bucket empty each reserve the next token, so they
+    are released in order as it refills.
+    """
+    
+    def __init__(self, capacity: int, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Take a token, waiting for one to be refilled if necessary."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class _PromptBatcher:
+    """
+    Coalesces concurrent prompts for the same provider and model.
+    
+    Used for providers that implement the optional
+    execute_prompt_batch(model_id, prompts) method, which returns one
+    response per prompt. A batch is sent once it is full or has waited
+    max_linger seconds, and runs on a thread pool so the blocking call
+    does not stall the event loop.
+    """
+    
+    def __init__(self,
+                 max_batch_size: int,
+                 max_linger: float,
+                 get_pool: Callable[[], ThreadPoolExecutor]):
+        """
+        Initialize the batcher.
+        
+        Args:
+            max_batch_size: Maximum number of prompts per call
+            max_linger: Seconds to wait for a batch to fill
+            get_pool: Returns the thread pool that runs batch calls
+        """
+        self.max_batch_size = max_batch_size
+        self.max_linger = max_linger
+        self._get_pool = get_pool
+        self._loop = None
+        self._pending = {}  # (provider_id, model_id) -> (provider, [(prompt, future)], timer)
+    
+    async def submit(self,
+                     provider: ModelProvider,
+                     provider_id: str,
+                     model_id: str,
+                     prompt: str) -> Dict[str, Any]:
+        """
+        Queue a prompt and wait for its response.
+        
+        Args:
+            provider: Provider to execute the prompt
+            provider_id: ID of the provider
+            model_id: ID of the model to use
+            prompt: Prompt text
+            
+        Returns:
+            The model's response to this prompt
+            
+        Raises:
+            Exception: If the batch call fails
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Batches never span event loops
+            self._loop = loop
+            self._pending = {}
+            
+        key = (provider_id, model_id)
+        future = loop.create_future()
+        
+        pending = self._pending.get(key)
+        if pending is None:
+            timer = loop.call_later(self.max_linger, self._flush, key)
+            pending = self._pending[key] = (provider, [], timer)
+        pending[1].append((prompt, future))
+        
+        if len(pending[1]) >= self.max_batch_size:
+            self._flush(key)
+            
+        return await future
+    
+    def _flush(self, key: tuple) -> None:
+        """
+        Send the pending batch for a provider and model.
+        
+        Args:
+            key: (provider_id, model_id) of the batch
+        """
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+            
+        provider, entries, timer = pending
+        timer.cancel()
+        
+        call = self._loop.run_in_executor(self._get_pool(), provider.execute_prompt_batch,
+                                          key[1], [prompt for prompt, _ in entries])
+        call.add_done_callback(functools.partial(self._deliver, key[0], entries))
+    
+    @staticmethod
+    def _deliver(provider_id: str, entries: list, call: asyncio.Future) -> None:
+        """
+        Hand the responses of a finished batch call to its waiters.
+        
+        Args:
+            provider_id: ID of the provider that ran the batch
+            entries: (prompt, future) pairs of the batch
+            call: Future of the batch call
+        """
+        if call.cancelled():
+            for _, future in entries:
+                future.cancel()
+            return
+            
+        try:
+            responses = call.result()
+            if len(responses) != len(entries):
+                raise ValueError(
+                    f"Provider {provider_id} returned {len(responses)} responses for {len(entries)} prompts")
+        except Exception as e:
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+            
+        for (_, future), response in zip(entries, responses):
+            if not future.done():
+                future.set_result(response)
+
+
+def _count_transitive_dependents(order: Iterable[str],
+                                 dependents: Dict[str, List[str]]) -> Dict[str, int]:
+    """
+    Count the tasks that depend on each task, directly or indirectly.
+    
+    Args:
+        order: Task IDs in topological order (dependencies first)
+        dependents: Mapping of task ID to IDs of tasks that depend on it
+        
+    Returns:
+        Dictionary mapping task IDs to their number of transitive dependents
+    """
+    # Descendant sets as int bitsets, built from the leaves up
+    order = list(order)
+    bit = {task_id: 1 << index for index, task_id in enumerate(order)}
+    descendants = {}
+    for task_id in reversed(order):
+        mask = 0
+        for dependent_id in dependents[task_id]:
+            mask |= bit[dependent_id] | descendants[dependent_id]
+        descendants[task_id] = mask
+        
+    return {task_id: mask.bit_count() for task_id, mask in descendants.items()}
@@ -6,17 +6,32 @@ recursive strategies for handling complex tasks efficiently.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Type, Callable
+from typing import Dict, Any, List, Optional, Union, Type, Callable, Iterable, Iterator, FrozenSet, Tuple
+import copy
+import functools
+import hashlib
+import heapq
+import os
 import importlib
 import time
 import asyncio
+import re
+import sys
+import threading
+import types
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 # Import Task definition
 from ..orchestration.task_orchestrator import Task, TaskStatus
 
 
+# Strategy classes by (module_path, class_name), shared across proxies
+_strategy_class_cache = {}
+
+
 class RecursionType(Enum):
     """Enum representing different types of recursion strategies."""
     TAIL = "tail_recursion"
@@ -91,6 +106,12 @@ class StrategyMetadata:
     and performance characteristics.
     """
     
+    __slots__ = (
+        "strategy_id", "name", "recursion_type", "problem_types", "problem_type_set", "description",
+        "module_path", "class_name", "complexity_profile", "resource_requirements",
+        "input_schema", "output_schema", "deterministic", "_cached_dict"
+    )
+    
     def __init__(self,
                 strategy_id: str,
                 name: str,
@@ -102,7 +123,8 @@ class StrategyMetadata:
                 complexity_profile: Dict[str, str],
                 resource_requirements: Dict[str, Any],
                 input_schema: Optional[Dict[str, Any]] = None,
-                output_schema: Optional[Dict[str, Any]] = None):
+                output_schema: Optional[Dict[str, Any]] = None,
+                deterministic: bool = False):
         """
         Initialize strategy metadata.
         
@@ -118,11 +140,14 @@ class StrategyMetadata:
             resource_requirements: Estimated resource needs
             input_schema: Expected input data format
             output_schema: Expected output data format
+            deterministic: Whether the strategy's result depends only on its
+                input data, so it may be reused for an identical input
         """
         self.strategy_id = strategy_id
         self.name = name
         self.recursion_type = recursion_type
         self.problem_types = problem_types
+        self.problem_type_set = frozenset(problem_types)  # For membership tests
         self.description = description
         self.module_path = module_path
         self.class_name = class_name
@@ -130,26 +155,46 @@ class StrategyMetadata:
         self.resource_requirements = resource_requirements
         self.input_schema = input_schema or {}
         self.output_schema = output_schema or {}
+        self.deterministic = deterministic
+        self._cached_dict = None  # Built by the first to_dict call
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert metadata to dictionary.
         
+        Metadata is treated as immutable once created, so the dictionary
+        is built once and copied on later calls. Each call gets its own
+        problem_types list.
+        
         Returns:
             Dictionary representation
         """
+        if self._cached_dict is None:
+            self._cached_dict = self._build_dict()
+        data = dict(self._cached_dict)
+        data["problem_types"] = list(data["problem_types"])
+        return data
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """
+        Build the dictionary representation returned by to_dict.
+        
+        Returns:
+            Dictionary representation, with problem_types as a tuple
+        """
         return {
             "strategy_id": self.strategy_id,
             "name": self.name,
             "recursion_type": self.recursion_type.value,
-            "problem_types": [pt.value for pt in self.problem_types],
+            "problem_types": tuple(pt.value for pt in self.problem_types),
             "description": self.description,
             "module_path": self.module_path,
             "class_name": self.class_name,
             "complexity_profile": self.complexity_profile,
             "resource_requirements": self.resource_requirements,
             "input_schema": self.input_schema,
-            "output_schema": self.output_schema
+            "output_schema": self.output_schema,
+            "deterministic": self.deterministic
         }
     
     @classmethod
@@ -174,7 +219,8 @@ class StrategyMetadata:
             complexity_profile=data["complexity_profile"],
             resource_requirements=data["resource_requirements"],
             input_schema=data.get("input_schema"),
-            output_schema=data.get("output_schema")
+            output_schema=data.get("output_schema"),
+            deterministic=data.get("deterministic", False)
         )
 
 
@@ -207,12 +253,22 @@ class StrategyProxy:
             AttributeError: If class cannot be found in module
         """
         if self._strategy is None:
+            # Resolve each strategy class only once, however many proxies use it
+            class_key = (self.metadata.module_path, self.metadata.class_name)
+            strategy_class = _strategy_class_cache.get(class_key)
             try:
-                module = importlib.import_module(self.metadata.module_path)
-                strategy_class = getattr(module, self.metadata.class_name)
+                if strategy_class is None:
+                    module = importlib.import_module(self.metadata.module_path)
+                    strategy_class = getattr(module, self.metadata.class_name)
+                    _strategy_class_cache[class_key] = strategy_class
                 self._strategy = strategy_class()
             except (ImportError, AttributeError) as e:
                 raise ValueError(f"Failed to load strategy {self.metadata.strategy_id}: {e}")
+            
+            # Later calls go straight to the strategy, bypassing this proxy
+            self.process = self._strategy.process
+            self.validate_input = self._strategy.validate_input
+            self.health_check = self._strategy.health_check
         
         return self._strategy
     
@@ -266,8 +322,19 @@ class StrategyRegistry:
     
     def __init__(self):
         """Initialize an empty strategy registry."""
-        self._strategies = {}  # strategy_id -> StrategyProxy
-        self._metadata = {}    # strategy_id -> StrategyMetadata
+        # Registration replaces these read-only snapshots rather than
+        # mutating them, so lookups need no lock and never see a
+        # half-registered strategy
+        self._strategies = types.MappingProxyType({})  # strategy_id -> StrategyProxy
+        self._metadata = types.MappingProxyType({})    # strategy_id -> StrategyMetadata
+        
+        # Strategy IDs by type, in registration order; dicts serve as ordered sets
+        self._by_problem_type = types.MappingProxyType({})    # ProblemType -> {strategy_id: None}
+        self._by_recursion_type = types.MappingProxyType({})  # RecursionType -> {strategy_id: None}
+        self._recursion_types_by_problem_type = types.MappingProxyType({})  # ProblemType -> frozenset
+        
+        self._register_lock = threading.Lock()
+        self.generation = 0  # Incremented on every registration
     
     def register_strategy(self, metadata: StrategyMetadata) -> None:
         """
@@ -279,11 +346,38 @@ class StrategyRegistry:
         Raises:
             ValueError: If strategy with same ID already registered
         """
-        if metadata.strategy_id in self._metadata:
-            raise ValueError(f"Strategy with ID '{metadata.strategy_id}' already registered")
-        
-        self._metadata[metadata.strategy_id] = metadata
-        self._strategies[metadata.strategy_id] = StrategyProxy(metadata)
+        with self._register_lock:
+            if metadata.strategy_id in self._metadata:
+                raise ValueError(f"Strategy with ID '{metadata.strategy_id}' already registered")
+            
+            # Intern strings used as lookup keys so comparisons against them
+            # can short-circuit on identity. The caller's profile dict is
+            # left untouched; the metadata gets an interned copy.
+            strategy_id = metadata.strategy_id = sys.intern(metadata.strategy_id)
+            metadata.class_name = sys.intern(metadata.class_name)
+            metadata.complexity_profile = {
+                key: sys.intern(value) if isinstance(value, str) else value
+                for key, value in metadata.complexity_profile.items()
+            }
+            metadata._cached_dict = None
+            
+            by_problem_type = dict(self._by_problem_type)
+            recursion_types_by_problem_type = dict(self._recursion_types_by_problem_type)
+            for problem_type in metadata.problem_types:
+                by_problem_type[problem_type] = {**by_problem_type.get(problem_type, {}), strategy_id: None}
+                recursion_types_by_problem_type[problem_type] = (
+                    recursion_types_by_problem_type.get(problem_type, frozenset()) | {metadata.recursion_type})
+            by_recursion_type = dict(self._by_recursion_type)
+            by_recursion_type[metadata.recursion_type] = {
+                **by_recursion_type.get(metadata.recursion_type, {}), strategy_id: None}
+            
+            # Publish the proxy before the metadata that makes it listable
+            self._strategies = types.MappingProxyType({**self._strategies, strategy_id: StrategyProxy(metadata)})
+            self._metadata = types.MappingProxyType({**self._metadata, strategy_id: metadata})
+            self._by_problem_type = types.MappingProxyType(by_problem_type)
+            self._by_recursion_type = types.MappingProxyType(by_recursion_type)
+            self._recursion_types_by_problem_type = types.MappingProxyType(recursion_types_by_problem_type)
+            self.generation += 1
     
     def get_strategy(self, strategy_id: str) -> Strategy:
         """
@@ -298,10 +392,10 @@ class StrategyRegistry:
         Raises:
             KeyError: If strategy not found
         """
-        if strategy_id not in self._strategies:
-            raise KeyError(f"No strategy registered with ID '{strategy_id}'")
-        
-        return self._strategies[strategy_id]
+        try:
+            return self._strategies[strategy_id]
+        except KeyError:
+            raise KeyError(f"No strategy registered with ID '{strategy_id}'") from None
     
     def get_strategy_metadata(self, strategy_id: str) -> StrategyMetadata:
         """
@@ -316,10 +410,10 @@ class StrategyRegistry:
         Raises:
             KeyError: If strategy not found
         """
-        if strategy_id not in self._metadata:
-            raise KeyError(f"No strategy registered with ID '{strategy_id}'")
-        
-        return self._metadata[strategy_id]
+        try:
+            return self._metadata[strategy_id]
+        except KeyError:
+            raise KeyError(f"No strategy registered with ID '{strategy_id}'") from None
     
     def list_strategies(self, 
                        problem_type: Optional[ProblemType] = None,
@@ -334,18 +428,36 @@ class StrategyRegistry:
         Returns:
             List of strategy IDs
         """
-        result = []
+        if not problem_type and not recursion_type:
+            return list(self._metadata)
         
-        for strategy_id, metadata in self._metadata.items():
-            if problem_type and problem_type not in metadata.problem_types:
-                continue
-                
-            if recursion_type and metadata.recursion_type != recursion_type:
-                continue
-                
-            result.append(strategy_id)
+        by_problem_type = self._by_problem_type.get(problem_type, {}) if problem_type else None
+        by_recursion_type = self._by_recursion_type.get(recursion_type, {}) if recursion_type else None
+        
+        if by_recursion_type is None:
+            return list(by_problem_type)
+        if by_problem_type is None:
+            return list(by_recursion_type)
+        
+        # Both filters: walk the smaller index, keeping registration order
+        smaller, larger = sorted((by_problem_type, by_recursion_type), key=len)
+        return [strategy_id for strategy_id in smaller if strategy_id in larger]
+
+
+    def list_recursion_types(self, problem_type: Optional[ProblemType] = None) -> FrozenSet[RecursionType]:
+        """
+        List the recursion types used by registered strategies.
+        
+        Args:
+            problem_type: Optional filter by problem type
             
-        return result
+        Returns:
+            Set of recursion types
+        """
+        if not problem_type:
+            return frozenset(self._by_recursion_type)
+        
+        return self._recursion_types_by_problem_type.get(problem_type, frozenset())
 
 
 class ProblemProfile:
@@ -356,6 +468,11 @@ class ProblemProfile:
     the most appropriate strategy.
     """
     
+    __slots__ = (
+        "problem_id", "problem_type", "input_size", "estimated_complexity",
+        "constraints", "features"
+    )
+    
     def __init__(self,
                 problem_id: str,
                 problem_type: ProblemType,
@@ -398,6 +515,45 @@ class ProblemProfile:
         }
 
 
+# Description keywords in order of precedence, matched anywhere in the text
+_PROBLEM_KEYWORDS = (
+    (ProblemType.TRANSFORMATION, ("transform", "convert", "process")),
+    (ProblemType.SEARCH, ("search", "find", "locate")),
+    (ProblemType.OPTIMIZATION, ("optimize", "maximize", "minimize")),
+    (ProblemType.GENERATION, ("generate", "create", "produce")),
+    (ProblemType.ANALYSIS, ("analyze", "examine", "assess")),
+    (ProblemType.VALIDATION, ("validate", "verify", "check")),
+)
+_PROBLEM_RANKS = {keyword: rank for rank, (_, keywords) in enumerate(_PROBLEM_KEYWORDS)
+                  for keyword in keywords}
+# A lookahead finds keywords overlapping one another, as substring tests would
+_PROBLEM_PATTERN = re.compile("(?=(" + "|".join(map(re.escape, _PROBLEM_RANKS)) + "))")
+
+
+@functools.lru_cache(maxsize=4096)
+def _problem_type_for_description(description: str) -> ProblemType:
+    """
+    Classify a lowercased task description in a single scan.
+    
+    Args:
+        description: Lowercased task description
+        
+    Returns:
+        Problem type of the highest-precedence keyword present, or
+        TRANSFORMATION
+    """
+    best = len(_PROBLEM_KEYWORDS)
+    for match in _PROBLEM_PATTERN.finditer(description):
+        rank = _PROBLEM_RANKS[match.group(1)]
+        if rank < best:
+            best = rank
+            if not rank:
+                break
+    
+    # Default to transformation
+    return _PROBLEM_KEYWORDS[best][0] if best < len(_PROBLEM_KEYWORDS) else ProblemType.TRANSFORMATION
+
+
 class ProblemAnalyzer:
     """
     Analyzes problems to create profiles for strategy selection.
@@ -453,23 +609,7 @@ class ProblemAnalyzer:
             ProblemType enum value
         """
         # Simple keyword-based classification for now
-        description = task.description.lower()
-        
-        if any(kw in description for kw in ["transform", "convert", "process"]):
-            return ProblemType.TRANSFORMATION
-        elif any(kw in description for kw in ["search", "find", "locate"]):
-            return ProblemType.SEARCH
-        elif any(kw in description for kw in ["optimize", "maximize", "minimize"]):
-            return ProblemType.OPTIMIZATION
-        elif any(kw in description for kw in ["generate", "create", "produce"]):
-            return ProblemType.GENERATION
-        elif any(kw in description for kw in ["analyze", "examine", "assess"]):
-            return ProblemType.ANALYSIS
-        elif any(kw in description for kw in ["validate", "verify", "check"]):
-            return ProblemType.VALIDATION
-        else:
-            # Default to transformation
-            return ProblemType.TRANSFORMATION
+        return _problem_type_for_description(task.description.lower())
     
     def _estimate_input_size(self, input_data: Dict[str, Any]) -> int:
         """
@@ -483,7 +623,7 @@ class ProblemAnalyzer:
         """
         # Simple estimation based on dictionary size
         # In a real implementation, this would be more sophisticated
-        return len(str(input_data))
+        return _estimate_repr_length(input_data)
     
     def _estimate_complexity(self, 
                            task: Task, 
@@ -530,6 +670,23 @@ class ProblemAnalyzer:
         return features
 
 
+# Marks a cache miss, since None is a valid strategy result
+_NOT_CACHED = object()
+
+# Inputs larger than this are handled by a workflow of strategies
+_WORKFLOW_INPUT_SIZE = 10000
+
+# Scores for (strategy complexity, problem complexity) pairs that differ
+_COMPLEXITY_MATCH_SCORES = {
+    # Strategy with better complexity than needed is good
+    ("O(n)", "O(n log n)"): 3.0,
+    ("O(n)", "O(n^2)"): 3.0,
+    # Strategy with worse complexity than ideal is less good
+    ("O(n log n)", "O(n)"): 1.0,
+    ("O(n^2)", "O(n)"): 1.0,
+}
+
+
 class StrategySelector:
     """
     Selects the most appropriate strategy for a problem.
@@ -538,14 +695,18 @@ class StrategySelector:
     the optimal strategy or sequence of strategies.
     """
     
-    def __init__(self, registry: StrategyRegistry):
+    def __init__(self, registry: StrategyRegistry, selection_cache_size: int = 1024):
         """
         Initialize with strategy registry.
         
         Args:
             registry: StrategyRegistry instance
+            selection_cache_size: Maximum number of selections remembered
+                for problems with the same profile
         """
         self.registry = registry
+        self.selection_cache_size = selection_cache_size
+        self._selection_cache = OrderedDict()  # Profile key -> selection, least recent first
     
     def select_strategy(self, 
                        profile: ProblemProfile, 
@@ -553,6 +714,50 @@ class StrategySelector:
         """
         Select the best strategy for a problem.
         
+        Args:
+            profile: Problem profile
+            historical_data: Optional historical performance data
+            
+        Returns:
+            Strategy ID or list of strategy IDs (for a workflow)
+            
+        Raises:
+            ValueError: If no suitable strategy found
+        """
+        # Without historical data the selection depends only on the profile
+        # and the registered strategies, so identical profiles can share it
+        key = None
+        if not historical_data and self.selection_cache_size > 0:
+            try:
+                key = (self.registry.generation, profile.problem_type,
+                       profile.estimated_complexity,
+                       profile.input_size > _WORKFLOW_INPUT_SIZE,
+                       frozenset(profile.constraints.items()),
+                       frozenset(profile.features.items()))
+                selection = self._selection_cache.get(key)
+            except TypeError:
+                # Unhashable constraint or feature values
+                key = selection = None
+            
+            if selection is not None:
+                self._selection_cache.move_to_end(key)
+                return list(selection) if isinstance(selection, tuple) else selection
+        
+        selection = self._select_uncached(profile, historical_data)
+        
+        if key is not None:
+            self._selection_cache[key] = tuple(selection) if isinstance(selection, list) else selection
+            if len(self._selection_cache) > self.selection_cache_size:
+                self._selection_cache.popitem(last=False)
+                
+        return selection
+    
+    def _select_uncached(self, 
+                        profile: ProblemProfile, 
+                        historical_data: Optional[Dict[str, Any]]) -> Union[str, List[str]]:
+        """
+        Select the best strategy for a problem without consulting the cache.
+        
         Args:
             profile: Problem profile
             historical_data: Optional historical performance data
@@ -582,47 +787,55 @@ class StrategySelector:
             return self._create_workflow(ranked_candidates, profile)
         else:
             # Return the top-ranked strategy
-            return ranked_candidates[0]
+            return next(ranked_candidates)[0]
     
     def _rank_candidates(self, 
                         candidates: List[str], 
                         profile: ProblemProfile,
-                        historical_data: Optional[Dict[str, Any]]) -> List[str]:
+                        historical_data: Optional[Dict[str, Any]]) -> Iterator[Tuple[str, StrategyMetadata]]:
         """
         Rank candidate strategies based on suitability.
         
+        Candidates are scored up front but only ordered as they are
+        consumed, since callers need just the first few.
+        
         Args:
             candidates: List of candidate strategy IDs
             profile: Problem profile
             historical_data: Optional historical performance data
             
         Returns:
-            List of strategy IDs, sorted by rank (best first)
-        """
-        scores = {}
-        
-        for strategy_id in candidates:
-            metadata = self.registry.get_strategy_metadata(strategy_id)
+            Iterator over (strategy ID, metadata) pairs, best first; equal
+            scores keep candidate order
+        """
+        # Bind per-call invariants once rather than per candidate
+        get_metadata = self.registry.get_strategy_metadata
+        score_complexity_match = self._score_complexity_match
+        score_constraint_match = self._score_constraint_match
+        problem_type = profile.problem_type
+        
+        heap = []  # (-score, position, strategy_id, metadata), popped best first
+        for position, strategy_id in enumerate(candidates):
+            metadata = get_metadata(strategy_id)
             
-            # Base score: problem type match
-            scores[strategy_id] = 10 if profile.problem_type in metadata.problem_types else 0
+            # Base score: problem type match, adjusted for complexity match
+            # and resource constraints
+            score = ((10 if problem_type in metadata.problem_type_set else 0)
+                     + score_complexity_match(metadata, profile)
+                     + score_constraint_match(metadata, profile))
             
-            # Adjust for complexity match
-            complexity_score = self._score_complexity_match(metadata, profile)
-            scores[strategy_id] += complexity_score
-            
-            # Adjust for resource constraints
-            constraint_score = self._score_constraint_match(metadata, profile)
-            scores[strategy_id] += constraint_score
-            
-            # Adjust for historical performance if available
-            if historical_data and strategy_id in historical_data:
-                history_score = self._score_historical_performance(
-                    strategy_id, profile, historical_data)
-                scores[strategy_id] += history_score
-        
-        # Sort candidates by score (descending)
-        return sorted(candidates, key=lambda sid: scores[sid], reverse=True)
+            heap.append((-score, position, strategy_id, metadata))
+        
+        # Adjust for historical performance if available; kept out of the
+        # loop above so the common no-history case skips the check entirely
+        if historical_data:
+            for index, (neg_score, position, strategy_id, metadata) in enumerate(heap):
+                if strategy_id in historical_data:
+                    heap[index] = (neg_score - self._score_historical_performance(
+                        strategy_id, profile, historical_data), position, strategy_id, metadata)
+        
+        heapq.heapify(heap)
+        return (heapq.heappop(heap)[2:] for _ in range(len(heap)))
     
     def _score_complexity_match(self, 
                               metadata: StrategyMetadata, 
@@ -645,17 +858,9 @@ class StrategySelector:
         # Exact match is best
         if strategy_complexity == problem_complexity:
             return 5.0
-            
-        # Strategy with better complexity than needed is good
-        if strategy_complexity == "O(n)" and problem_complexity in ["O(n log n)", "O(n^2)"]:
-            return 3.0
-            
-        # Strategy with worse complexity than ideal is less good
-        if strategy_complexity in ["O(n log n)", "O(n^2)"] and problem_complexity == "O(n)":
-            return 1.0
-            
-        # Default score
-        return 0.0
+        
+        # Otherwise look the pair up, defaulting to no score
+        return _COMPLEXITY_MATCH_SCORES.get((strategy_complexity, problem_complexity), 0.0)
     
     def _score_constraint_match(self, 
                               metadata: StrategyMetadata, 
@@ -741,7 +946,7 @@ class StrategySelector:
         if profile.estimated_complexity in ["O(n^2)", "O(n^3)"]:
             return True
             
-        if profile.input_size > 10000:
+        if profile.input_size > _WORKFLOW_INPUT_SIZE:
             return True
             
         # Check for specific features that suggest workflow need
@@ -751,43 +956,49 @@ class StrategySelector:
         return False
     
     def _create_workflow(self, 
-                       ranked_candidates: List[str], 
+                       ranked_candidates: Iterable[Tuple[str, StrategyMetadata]], 
                        profile: ProblemProfile) -> List[str]:
         """
         Create a workflow of complementary strategies.
         
         Args:
-            ranked_candidates: List of strategy IDs, ranked by suitability
+            ranked_candidates: (strategy ID, metadata) pairs, ranked by
+                suitability
             profile: Problem profile
             
         Returns:
             List of strategy IDs forming a workflow
         """
         workflow = []
+        ranked_candidates = iter(ranked_candidates)
         
         # Start with the top-ranked strategy
-        if ranked_candidates:
-            workflow.append(ranked_candidates[0])
+        top_candidate = next(ranked_candidates, None)
+        if top_candidate is not None:
+            workflow.append(top_candidate[0])
         
         # Add complementary strategies based on recursion type
         # Try to create a balanced workflow with different recursion types
         recursion_types_in_workflow = set()
         
-        if workflow:
-            top_metadata = self.registry.get_strategy_metadata(workflow[0])
-            recursion_types_in_workflow.add(top_metadata.recursion_type)
+        # Candidates span the problem type's strategies, or all of them if
+        # it has none; once each of their recursion types is in the
+        # workflow, no later candidate can be added
+        available_types = (self.registry.list_recursion_types(profile.problem_type)
+                           or self.registry.list_recursion_types())
+        
+        if top_candidate is not None:
+            recursion_types_in_workflow.add(top_candidate[1].recursion_type)
         
         # Add strategies with different recursion types
-        for strategy_id in ranked_candidates[1:]:
-            metadata = self.registry.get_strategy_metadata(strategy_id)
+        for strategy_id, metadata in ranked_candidates:
+            # Limit workflow size
+            if len(workflow) >= 3 or len(recursion_types_in_workflow) >= len(available_types):
+                break
             
             if metadata.recursion_type not in recursion_types_in_workflow:
                 workflow.append(strategy_id)
                 recursion_types_in_workflow.add(metadata.recursion_type)
-                
-                # Limit workflow size
-                if len(workflow) >= 3:
-                    break
         
         return workflow
 
@@ -799,24 +1010,70 @@ class StrategyExecutor:
     Manages the execution of individual strategies or workflows of strategies.
     """
     
-    def __init__(self, registry: StrategyRegistry):
+    def __init__(self, 
+                registry: StrategyRegistry, 
+                max_workers: Optional[int] = None,
+                result_cache_size: int = 1024):
         """
         Initialize with strategy registry.
         
         Args:
             registry: StrategyRegistry instance
+            max_workers: Maximum number of threads running strategies at
+                once (defaults to the number of CPUs)
+            result_cache_size: Maximum number of deterministic strategy
+                results kept for reuse
         """
         self.registry = registry
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = None  # Created on first execution
+        self.result_cache_size = result_cache_size
+        self._result_cache = OrderedDict()  # Input digest -> result, least recent first
+        self._in_flight = {}  # Input digest -> running execution
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool strategies run in, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor instance
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="strategy")
+        return self._pool
+    
+    async def execute_many(self, 
+                         items: List[Tuple[Union[str, List[Union[str, List[str]]]], Any, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Execute several strategies or workflows concurrently.
+        
+        Args:
+            items: (strategy ID or workflow, input data, context) tuples
+            
+        Returns:
+            Execution results in the order of items; an item that failed
+            has a result of {"error": message}
+        """
+        results = await asyncio.gather(
+            *(self.execute(strategy_id_or_workflow, data, context)
+              for strategy_id_or_workflow, data, context in items),
+            return_exceptions=True)
+        
+        return [{"error": str(result)} if isinstance(result, Exception) else result
+                for result in results]
     
     async def execute(self, 
-                    strategy_id_or_workflow: Union[str, List[str]], 
+                    strategy_id_or_workflow: Union[str, List[Union[str, List[str]]]], 
                     data: Any, 
                     context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a strategy or workflow.
         
         Args:
-            strategy_id_or_workflow: Strategy ID or list of strategy IDs
+            strategy_id_or_workflow: Strategy ID or workflow; each workflow
+                step is a strategy ID or a list of strategy IDs to run
+                concurrently
             data: Input data
             context: Execution context
             
@@ -859,17 +1116,43 @@ class StrategyExecutor:
             if not strategy.validate_input(data):
                 raise ValueError(f"Invalid input for strategy {strategy_id}")
             
-            # Execute strategy
-            start_time = time.time()
-            result = strategy.process(data, context)
-            end_time = time.time()
+            # Reuse the result of a deterministic strategy for an identical
+            # input, or share the execution already running for it
+            cache_key = None
+            if self.result_cache_size > 0 and self.registry.get_strategy_metadata(strategy_id).deterministic:
+                cache_key = _input_digest(strategy_id, data)
+            
+            if cache_key is None:
+                result, elapsed_ns = await self._run_strategy(strategy, data, context)
+            else:
+                cached = self._result_cache.get(cache_key, _NOT_CACHED)
+                if cached is not _NOT_CACHED:
+                    self._result_cache.move_to_end(cache_key)
+                    return {
+                        "result": copy.deepcopy(cached),
+                        "metadata": {
+                            "strategy_id": strategy_id,
+                            "execution_time": 0.0,
+                            "cached": True
+                        }
+                    }
+                
+                job = self._in_flight.get(cache_key)
+                if job is None:
+                    job = asyncio.ensure_future(self._run_strategy(strategy, data, context))
+                    job.add_done_callback(functools.partial(self._finish_shared_run, cache_key))
+                    self._in_flight[cache_key] = job
+                
+                # Shielded so a cancelled caller doesn't cancel the others
+                result, elapsed_ns = await asyncio.shield(job)
+                result = copy.deepcopy(result)
             
             # Return result with metadata
             return {
                 "result": result,
                 "metadata": {
                     "strategy_id": strategy_id,
-                    "execution_time": end_time - start_time
+                    "execution_time": elapsed_ns * 1e-9
                 }
             }
         
@@ -877,15 +1160,59 @@ class StrategyExecutor:
             # Handle strategy execution failure
             raise ValueError(f"Strategy execution failed: {e}")
     
+    async def _run_strategy(self, 
+                          strategy: Strategy, 
+                          data: Any, 
+                          context: Dict[str, Any]) -> Tuple[Any, int]:
+        """
+        Run a strategy in the thread pool.
+        
+        Args:
+            strategy: Strategy to run
+            data: Input data
+            context: Execution context
+            
+        Returns:
+            Tuple of the strategy's result and its execution time in
+            nanoseconds
+        """
+        # Strategies are synchronous and would otherwise block the event loop
+        start_ns = time.perf_counter_ns()
+        result = await asyncio.get_running_loop().run_in_executor(
+            self._get_pool(), strategy.process, data, context)
+        return result, time.perf_counter_ns() - start_ns
+    
+    def _finish_shared_run(self, cache_key: bytes, job: asyncio.Future) -> None:
+        """
+        Record the outcome of a deterministic strategy run shared by callers.
+        
+        Args:
+            cache_key: Digest of the strategy and its input
+            job: The finished run
+        """
+        del self._in_flight[cache_key]
+        
+        # Failed and cancelled runs are not cached, so the next call retries
+        if job.cancelled() or job.exception() is not None:
+            return
+        
+        self._result_cache[cache_key] = copy.deepcopy(job.result()[0])
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+    
     async def _execute_workflow(self, 
-                              workflow: List[str], 
+                              workflow: List[Union[str, List[str]]], 
                               data: Any, 
                               context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a workflow of strategies.
         
+        Each step is a strategy ID or a list of independent strategy IDs.
+        The strategies of a list step run concurrently on the same input,
+        and their results are passed on as a dictionary keyed by ID.
+        
         Args:
-            workflow: List of strategy IDs
+            workflow: List of steps
             data: Input data
             context: Execution context
             
@@ -896,29 +1223,48 @@ class StrategyExecutor:
             ValueError: If any strategy not found or execution fails
         """
         current_data = data
-        results = []
+        completed_strategies = []
         
-        # Execute strategies in sequence, passing output to next strategy
-        for strategy_id in workflow:
+        # Execute steps in sequence, passing output to next step
+        for step in workflow:
             try:
-                # Execute strategy
-                result = await self._execute_strategy(strategy_id, current_data, context)
-                
-                # Update data for next strategy
-                current_data = result["result"]
-                
-                # Record result
-                results.append(result)
+                if isinstance(step, list):
+                    # Execute independent strategies together
+                    step_results = await asyncio.gather(
+                        *(self._execute_strategy(strategy_id, current_data, context)
+                          for strategy_id in step),
+                        return_exceptions=True)
+                    
+                    # Record the strategies that succeeded, then fail the
+                    # step if any did not
+                    completed_strategies.extend(strategy_id for strategy_id, r in zip(step, step_results)
+                                                if not isinstance(r, Exception))
+                    for r in step_results:
+                        if isinstance(r, Exception):
+                            raise r
+                    
+                    # Update data for next step
+                    current_data = {strategy_id: r["result"]
+                                    for strategy_id, r in zip(step, step_results)}
+                else:
+                    # Execute strategy
+                    result = await self._execute_strategy(step, current_data, context)
+                    
+                    # Update data for next step
+                    current_data = result["result"]
+                    
+                    # Record result
+                    completed_strategies.append(step)
             
             except ValueError as e:
                 # Handle strategy failure
                 # If this is not the first strategy, we can still return partial results
-                if results:
+                if completed_strategies:
                     return {
                         "result": current_data,
                         "metadata": {
                             "workflow": workflow,
-                            "completed_strategies": [r["metadata"]["strategy_id"] for r in results],
+                            "completed_strategies": completed_strategies,
                             "error": str(e),
                             "partial": True
                         }
@@ -932,7 +1278,7 @@ class StrategyExecutor:
             "result": current_data,
             "metadata": {
                 "workflow": workflow,
-                "completed_strategies": [r["metadata"]["strategy_id"] for r in results],
+                "completed_strategies": completed_strategies,
                 "partial": False
             }
         }
@@ -993,3 +1339,97 @@ class TieredProblemSolver:
         }
         
         return await self.executor.execute(strategy_id_or_workflow, task.input_data, context)
+
+
+def _estimate_repr_length(value: Any) -> int:
+    """
+    Estimate len(str(value)) by walking the value instead of formatting it.
+    
+    Strings are assumed to need no escaping, and a container reached more
+    than once (including through a cycle) is only counted the first time.
+    
+    Args:
+        value: Value to measure
+        
+    Returns:
+        Estimated length of the value's string representation
+    """
+    size = 0
+    seen = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item) + 2  # Quotes
+        elif isinstance(item, (bytes, bytearray)):
+            size += len(item) + 3  # b and quotes
+        elif isinstance(item, (dict, list, tuple, set, frozenset)):
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            
+            # Brackets, plus ", " between elements
+            size += 2 + 2 * max(len(item) - 1, 0)
+            if isinstance(item, dict):
+                size += 2 * len(item)  # ": " after each key
+                for key, element in item.items():
+                    stack.append(key)
+                    stack.append(element)
+            else:
+                stack.extend(item)
+        else:
+            size += len(repr(item))
+            
+    return size
+
+
+# Scalar types whose repr identifies the value, for _canonical_input
+_CANONICAL_SCALARS = (str, int, float, bool, type(None), bytes)
+
+
+def _input_digest(strategy_id: str, data: Any) -> Optional[bytes]:
+    """
+    Digest a strategy ID and input for reusing deterministic results.
+    
+    Args:
+        strategy_id: Strategy ID
+        data: Input data
+        
+    Returns:
+        Digest, or None if the input contains values that cannot be
+        canonicalized
+    """
+    try:
+        canonical = _canonical_input(data)
+    except (TypeError, RecursionError):
+        return None
+    return hashlib.blake2b(repr((strategy_id, canonical)).encode(), digest_size=16).digest()
+
+
+def _canonical_input(value: Any) -> Any:
+    """
+    Build an order-independent representation of a value that keeps types.
+    
+    Values of different types, such as 1 and "1" or a tuple and a list of
+    the same items, never share a representation.
+    
+    Args:
+        value: Value built from dicts, lists, tuples, sets and scalars
+        
+    Returns:
+        Nested tuples tagged with type names
+        
+    Raises:
+        TypeError: If the value contains any other type
+    """
+    value_type = type(value)
+    if value_type in _CANONICAL_SCALARS:
+        return (value_type.__name__, value)
+    if value_type is dict:
+        items = [(_canonical_input(key), _canonical_input(item)) for key, item in value.items()]
+        return ("dict", tuple(sorted(items, key=repr)))
+    if value_type is list or value_type is tuple:
+        return (value_type.__name__, tuple(_canonical_input(item) for item in value))
+    if value_type is set or value_type is frozenset:
+        return (value_type.__name__, tuple(sorted((_canonical_input(item) for item in value), key=repr)))
+    raise TypeError(f"Cannot canonicalize {value_type.__name__}")
@@ -3,10 +3,26 @@ Backend API integration tests for Vertex Full-Stack System.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import sys
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+# Prefer orjson for request and response bodies; the stdlib json module is
+# the fallback
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    
+    _loads = json.loads
 
 # Load test configuration
 with open("test_config.json", "r") as f:
@@ -15,49 +31,76 @@ with open("test_config.json", "r") as f:
 API_URL = config["api_url"]
 TEST_TIMEOUT = config["test_timeout"]
 
+# Reuse keep-alive connections across requests rather than opening one per
+# call. Sessions are not thread-safe, so each test thread gets its own.
+_local = threading.local()
+
+def _session() -> requests.Session:
+    """Get the calling thread's session, creating it on first use."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+        session.mount(API_URL, HTTPAdapter())
+    return session
+
+def _post(url: str, payload: Any) -> requests.Response:
+    """POST a JSON payload to a URL."""
+    return _session().post(url, data=_dumps(payload), headers={"Content-Type": "application/json"})
+
+def _get(url: str, **kwargs) -> Tuple[int, Any]:
+    """GET a URL, returning the status code and the JSON body, if any."""
+    response = _session().get(url, **kwargs)
+    is_json = response.headers.get("content-type", "").startswith("application/json")
+    return response.status_code, _loads(response.content) if is_json else None
+
+def _require_fields(data: Dict[str, Any], fields: List[str], what: str) -> None:
+    """Assert that a response has all the given fields, naming any missing."""
+    missing = [field for field in fields if field not in data]
+    assert not missing, f"{what} missing fields: {', '.join(missing)}"
+
 def test_health_endpoint():
     """Test the health check endpoint."""
-    print("Testing health endpoint...")
+    log = []
+    log.append("Testing health endpoint...")
     try:
-        response = requests.get(f"{API_URL}/health")
+        response = _session().get(f"{API_URL}/health")
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         
-        assert "status" in data, "Health response missing status field"
+        _require_fields(data, ["status", "timestamp"], "Health response")
         assert data["status"] == "healthy", f"Unexpected health status: {data['status']}"
-        assert "timestamp" in data, "Health response missing timestamp field"
         
-        print("✅ Health endpoint test passed")
-        return True
+        log.append("✅ Health endpoint test passed")
+        return "Health endpoint", True, log
     except Exception as e:
-        print(f"❌ Health endpoint test failed: {e}")
-        return False
+        log.append(f"❌ Health endpoint test failed: {e}")
+        return "Health endpoint", False, log
 
 def test_providers_endpoint():
     """Test the providers endpoint."""
-    print("Testing providers endpoint...")
+    log = []
+    log.append("Testing providers endpoint...")
     try:
-        response = requests.get(f"{API_URL}/providers")
+        response = _session().get(f"{API_URL}/providers")
         response.raise_for_status()
-        providers = response.json()
+        providers = _loads(response.content)
         
         assert isinstance(providers, list), "Providers response is not a list"
         
         if len(providers) > 0:
             provider = providers[0]
-            assert "provider_id" in provider, "Provider missing provider_id field"
-            assert "name" in provider, "Provider missing name field"
-            assert "capabilities" in provider, "Provider missing capabilities field"
+            _require_fields(provider, ["provider_id", "name", "capabilities"], "Provider")
         
-        print("✅ Providers endpoint test passed")
-        return True
+        log.append("✅ Providers endpoint test passed")
+        return "Providers endpoint", True, log
     except Exception as e:
-        print(f"❌ Providers endpoint test failed: {e}")
-        return False
+        log.append(f"❌ Providers endpoint test failed: {e}")
+        return "Providers endpoint", False, log
 
 def test_task_creation_and_retrieval():
     """Test task creation and retrieval."""
-    print("Testing task creation and retrieval...")
+    log = []
+    log.append("Testing task creation and retrieval...")
     try:
         # Create a test task
         task_data = {
@@ -70,37 +113,40 @@ def test_task_creation_and_retrieval():
             "max_retries": 1
         }
         
-        response = requests.post(f"{API_URL}/tasks", json=task_data)
+        response = _post(f"{API_URL}/tasks", task_data)
         response.raise_for_status()
-        task = response.json()
+        task = _loads(response.content)
         
         assert "task_id" in task, "Task response missing task_id field"
         task_id = task["task_id"]
         
-        # Wait for task to complete or timeout
-        start_time = time.time()
-        while time.time() - start_time < TEST_TIMEOUT:
-            response = requests.get(f"{API_URL}/tasks/{task_id}")
-            response.raise_for_status()
-            task_status = response.json()
+        # Wait for task to complete or timeout; the server holds each
+        # request until the task finishes or the wait runs out
+        deadline = time.time() + TEST_TIMEOUT
+        while True:
+            wait = min(max(0, deadline - time.time()), 60)  # Server allows up to 60s
+            status_code, task_status = _get(f"{API_URL}/tasks/{task_id}", params={"wait": wait},
+                                            timeout=wait + 10)
+            if status_code >= 400:
+                raise RuntimeError(f"Task status request failed with status {status_code}")
             
-            if task_status["status"] in ["COMPLETED", "FAILED"]:
+            # The server reports statuses in lower case
+            if task_status["status"].upper() in ["COMPLETED", "FAILED", "CANCELLED"] or time.time() >= deadline:
                 break
-                
-            time.sleep(1)
         
         assert "status" in task_status, "Task status response missing status field"
-        print(f"Task status: {task_status['status']}")
+        log.append(f"Task status: {task_status['status']}")
         
-        print("✅ Task creation and retrieval test passed")
-        return True
+        log.append("✅ Task creation and retrieval test passed")
+        return "Task creation and retrieval", True, log
     except Exception as e:
-        print(f"❌ Task creation and retrieval test failed: {e}")
-        return False
+        log.append(f"❌ Task creation and retrieval test failed: {e}")
+        return "Task creation and retrieval", False, log
 
 def test_batch_creation_and_retrieval():
     """Test batch creation and retrieval."""
-    print("Testing batch creation and retrieval...")
+    log = []
+    log.append("Testing batch creation and retrieval...")
     try:
         # Create a test batch
         batch_data = {
@@ -132,43 +178,52 @@ def test_batch_creation_and_retrieval():
             }
         }
         
-        response = requests.post(f"{API_URL}/batches", json=batch_data)
+        response = _post(f"{API_URL}/batches", batch_data)
         
         # If feature is not enabled, this is expected to fail
         if response.status_code == 403:
-            print("Batch feature is not enabled, skipping test")
-            return True
+            log.append("Batch feature is not enabled, skipping test")
+            return "Batch creation and retrieval", True, log
             
         response.raise_for_status()
-        batch = response.json()
+        batch = _loads(response.content)
         
         assert "batch_id" in batch, "Batch response missing batch_id field"
         batch_id = batch["batch_id"]
         
-        # Wait for batch to complete or timeout
+        # Wait for batch to complete or timeout, polling quickly at first and
+        # backing off while the status stays the same
         start_time = time.time()
+        delay = 0.05
+        last_status = None
         while time.time() - start_time < TEST_TIMEOUT:
-            response = requests.get(f"{API_URL}/batches/{batch_id}")
-            response.raise_for_status()
-            batch_status = response.json()
+            status_code, batch_status = _get(f"{API_URL}/batches/{batch_id}")
+            if status_code >= 400:
+                raise RuntimeError(f"Batch status request failed with status {status_code}")
             
             if batch_status["status"] in ["COMPLETED", "FAILED"]:
                 break
+            
+            if batch_status["status"] != last_status:
+                last_status = batch_status["status"]
+                delay = 0.05
                 
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 1.7, 2.0)
         
         assert "status" in batch_status, "Batch status response missing status field"
-        print(f"Batch status: {batch_status['status']}")
+        log.append(f"Batch status: {batch_status['status']}")
         
-        print("✅ Batch creation and retrieval test passed")
-        return True
+        log.append("✅ Batch creation and retrieval test passed")
+        return "Batch creation and retrieval", True, log
     except Exception as e:
-        print(f"❌ Batch creation and retrieval test failed: {e}")
-        return False
+        log.append(f"❌ Batch creation and retrieval test failed: {e}")
+        return "Batch creation and retrieval", False, log
 
 def test_knowledge_query():
     """Test knowledge query endpoint."""
-    print("Testing knowledge query...")
+    log = []
+    log.append("Testing knowledge query...")
     try:
         # Create a test query
         query_data = {
@@ -176,24 +231,23 @@ def test_knowledge_query():
             "max_results": 10
         }
         
-        response = requests.post(f"{API_URL}/knowledge/query", json=query_data)
+        response = _post(f"{API_URL}/knowledge/query", query_data)
         
         # If feature is not enabled, this is expected to fail
         if response.status_code == 403:
-            print("Knowledge graph feature is not enabled, skipping test")
-            return True
+            log.append("Knowledge graph feature is not enabled, skipping test")
+            return "Knowledge query", True, log
             
         response.raise_for_status()
-        results = response.json()
+        results = _loads(response.content)
         
-        assert "entities" in results, "Query response missing entities field"
-        assert "relations" in results, "Query response missing relations field"
+        _require_fields(results, ["entities", "relations"], "Query response")
         
-        print("✅ Knowledge query test passed")
-        return True
+        log.append("✅ Knowledge query test passed")
+        return "Knowledge query", True, log
     except Exception as e:
-        print(f"❌ Knowledge query test failed: {e}")
-        return False
+        log.append(f"❌ Knowledge query test failed: {e}")
+        return "Knowledge query", False, log
 
 def run_all_tests():
     """Run all integration tests."""
@@ -205,16 +259,28 @@ def run_all_tests():
         test_knowledge_query
     ]
     
+    # The tests are independent, so run them concurrently. Each returns its
+    # (name, passed, log), and the logs are printed in order once all finish.
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(test) for test in tests]
+    outcomes = [future.result() for future in futures]
+    
     results = []
-    for test in tests:
-        results.append(test())
+    failed = []
+    for name, passed, log in outcomes:
+        print("\n".join(log))
         print()  # Add a blank line between tests
+        results.append(passed)
+        if not passed:
+            failed.append(name)
     
     # Print summary
     print("Test Summary:")
     print(f"Total tests: {len(tests)}")
     print(f"Passed: {results.count(True)}")
     print(f"Failed: {results.count(False)}")
+    if failed:
+        print(f"Failed tests: {', '.join(failed)}")
     
     # Return exit code based on test results
     return 0 if all(results) else 1
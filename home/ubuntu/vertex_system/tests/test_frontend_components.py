@@ -2,52 +2,73 @@
 Frontend component tests for Vertex Full-Stack System.
 """
 
+import contextlib
+import functools
+import io
 import os
 import json
+import mmap
 import sys
 from typing import Dict, Any, List, Optional
 
+@functools.lru_cache(maxsize=None)
+def _load_json(path: str) -> Dict[str, Any]:
+    """Load a JSON file, reading each path from disk only once."""
+    with open(path, "rb") as f:
+        return json.load(f)
+
+REQUIRED_DIRS = frozenset({
+    "src",
+    "src/components",
+    "src/views",
+    "src/router",
+    "src/store",
+    "src/services",
+    "src/assets"
+})
+
+REQUIRED_FILES = frozenset({
+    "src/main.js",
+    "src/App.vue",
+    "src/router/index.js",
+    "src/views/DashboardView.vue",
+    "src/views/TasksView.vue",
+    "src/views/BatchesView.vue",
+    "src/views/ProvidersView.vue",
+    "src/views/KnowledgeView.vue",
+    "src/views/SystemView.vue",
+    "src/views/SettingsView.vue",
+    "src/views/NotFoundView.vue"
+})
+
+# Directories listed to find the required paths
+_REQUIRED_PARENTS = frozenset(os.path.dirname(path) for path in REQUIRED_DIRS | REQUIRED_FILES)
+
 def test_frontend_structure():
     """Test the frontend directory structure."""
     print("Testing frontend directory structure...")
     
-    required_dirs = [
-        "src",
-        "src/components",
-        "src/views",
-        "src/router",
-        "src/store",
-        "src/services",
-        "src/assets"
-    ]
-    
-    required_files = [
-        "src/main.js",
-        "src/App.vue",
-        "src/router/index.js",
-        "src/views/DashboardView.vue",
-        "src/views/TasksView.vue",
-        "src/views/BatchesView.vue",
-        "src/views/ProvidersView.vue",
-        "src/views/KnowledgeView.vue",
-        "src/views/SystemView.vue",
-        "src/views/SettingsView.vue",
-        "src/views/NotFoundView.vue"
-    ]
-    
-    # Check required directories
-    missing_dirs = []
-    for dir_path in required_dirs:
-        full_path = os.path.join("/home/ubuntu/vertex_system/frontend", dir_path)
-        if not os.path.isdir(full_path):
-            missing_dirs.append(dir_path)
+    # List each parent directory once rather than checking every path on
+    # its own; walking the whole tree would descend into node_modules
+    frontend_dir = "/home/ubuntu/vertex_system/frontend"
+    present_dirs = set()
+    present_files = set()
+    for parent in _REQUIRED_PARENTS:
+        try:
+            with os.scandir(os.path.join(frontend_dir, parent)) as entries:
+                for entry in entries:
+                    path = os.path.join(parent, entry.name)
+                    if entry.is_dir():
+                        present_dirs.add(path)
+                    elif entry.is_file():
+                        present_files.add(path)
+        except OSError:
+            # Missing parent directory; its children are reported below
+            pass
     
-    # Check required files
-    missing_files = []
-    for file_path in required_files:
-        full_path = os.path.join("/home/ubuntu/vertex_system/frontend", file_path)
-        if not os.path.isfile(full_path):
-            missing_files.append(file_path)
+    # Check required directories and files, reporting in a stable order
+    missing_dirs = sorted(REQUIRED_DIRS - present_dirs)
+    missing_files = sorted(REQUIRED_FILES - present_files)
     
     if missing_dirs:
         print(f"❌ Missing directories: {', '.join(missing_dirs)}")
@@ -65,8 +86,7 @@ def test_package_json():
     print("Testing package.json...")
     
     try:
-        with open("/home/ubuntu/vertex_system/frontend/package.json", "r") as f:
-            package_data = json.load(f)
+        package_data = _load_json("/home/ubuntu/vertex_system/frontend/package.json")
         
         required_fields = ["name", "version", "main"]
         missing_fields = []
@@ -111,13 +131,15 @@ def test_vue_components():
         required_elements = component["required_elements"]
         
         try:
-            with open(file_path, "r") as f:
-                content = f.read()
-            
-            missing_elements = []
-            for element in required_elements:
-                if element not in content:
-                    missing_elements.append(element)
+            # Search the mapped bytes directly, without reading and
+            # decoding the whole file; an empty file cannot be mapped
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    missing_elements = list(required_elements)
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        missing_elements = [element for element in required_elements
+                                            if content.find(element.encode()) == -1]
             
             if missing_elements:
                 print(f"❌ Missing elements in {os.path.basename(file_path)}: {', '.join(missing_elements)}")
@@ -138,10 +160,13 @@ def run_all_tests():
         test_vue_components
     ]
     
+    # Buffer each test's output and write it out in one go
     results = []
     for test in tests:
-        results.append(test())
-        print()  # Add a blank line between tests
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results.append(test())
+        print(output.getvalue())  # Add a blank line between tests
     
     # Print summary
     print("Test Summary:")